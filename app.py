@@ -13,7 +13,7 @@
 ##*     > streamlit run app.py
 ##*
 ##*
-##* Supported Python versions: 3.8 - 3.12
+##* Supported Python versions: 3.10 - 3.12
 ##*     used python version: 3.11.3
 ##*     environment: CHMEDIA_gam_lottWin__3_11_3
 ##*
@@ -29,19 +29,36 @@
 ##* Date                User        Description
 ##* ------------------------------------------------------------------------
 ##* 2023-12-20          bettlerd    created script
+##* 2026-10-18          bettlerd    submit form, cached API client and cached results
+##*                                 with TTL and refresh button
+##* 2026-10-18          bettlerd    chunked export as CSV, JSON Lines or Parquet with
+##*                                 a format selector
+##* 2026-10-18          bettlerd    sidebar panel with the request metrics of the Funifier API
+##* 2026-10-18          bettlerd    state of the circuit breakers in the metrics panel
+##* 2026-10-18          bettlerd    Python 3.10 is required, e.g. by @dataclass(slots=True)
+##* 2026-10-18          bettlerd    the export is memoized per lottery and format
+##* 2026-10-18          bettlerd    the export is keyed by the fetch of the results, a refresh only
+##*                                 invalidates the query of the session
 ##*
 ##*
 
 import os
 import uuid
 import base64
+import hashlib
+import pandas as pd
 import streamlit as st
 from datetime import datetime
 from io import BytesIO
+from typing import Tuple
 
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
+from common.enums.common.export_format import ExportFormatEnum
+from common.helper.export_helper import export_dataframe, get_mime_type
 from common.service.api_funifier_service import FunifierAPI
+from common.service.circuit_breaker import circuit_breaker_statistics
+from common.service.metrics_registry import METRICS
 from domain_objects.dto.common.api_config_dto import APIConfigsDTO, Header
 
 from htbuilder import HtmlElement, div, ul, li, br, hr, a, p, img, styles, classes, fonts
@@ -58,25 +75,41 @@ st.set_page_config(
 URL = "eu1.service.funifier.com"
 VERSION = "v3"
 HEADER = ""
+CACHE_TTL_SECONDS = 15 * 60
 
 def main():
     try:
         st.title("Gamification Lottery Winners")
-        api_key = st.text_input(
-            "Please provide the API Key", 
-            "")
-        secret = st.text_input(
-            "Please provide the secret",
-            ""
-        )
-        lottery_uid = st.text_input(
-            "Please provide the lottery UID",
-            ""
-        )
-        ticket_uid = st.text_input(
-            "Please provide the lottery ticket UID",
-            ""
-        )
+
+        # the inputs of a form only trigger a rerun on submit, not on every keystroke
+        with st.form("lottery_form"):
+            api_key = st.text_input(
+                "Please provide the API Key", 
+                "")
+            secret = st.text_input(
+                "Please provide the secret",
+                ""
+            )
+            lottery_uid = st.text_input(
+                "Please provide the lottery UID",
+                ""
+            )
+            ticket_uid = st.text_input(
+                "Please provide the lottery ticket UID",
+                ""
+            )
+            submitted = st.form_submit_button("Get Results")
+
+        if submitted:
+            st.session_state["query"] = (api_key, secret, lottery_uid, ticket_uid)
+            st.session_state["refresh"] = 0
+
+        if "query" not in st.session_state:
+            metrics_panel()
+            footer()
+            return
+
+        api_key, secret, lottery_uid, ticket_uid = st.session_state["query"]
 
         st.markdown("This Parameter have been loaded:")
         st.markdown(f"- api_key: {api_key}")
@@ -90,31 +123,113 @@ def main():
             len(lottery_uid) > 0 and \
             len(ticket_uid) > 0:
 
-            api = get_funifier_api(
-                api_key,
-                secret)
-            
-            results = api.get_lottery_winners_with_address(
-                lotteryUID=lottery_uid,
-                ticketUID=ticket_uid
+            # a new refresh nonce only misses the caches of this query, not the ones of other sessions
+            if st.button("Refresh Results"):
+                st.session_state["refresh"] = st.session_state.get("refresh", 0) + 1
+
+            results, fetch_id = fetch_lottery_winners(
+                credentials_hash=get_credentials_hash(api_key, secret),
+                lottery_uid=lottery_uid,
+                ticket_uid=ticket_uid,
+                refresh=st.session_state.get("refresh", 0),
+                _api_key=api_key,
+                _secret=secret
             )
             st.markdown("## Results:")
             st.text(results)
-            csv = results.to_csv(index=False).encode('utf-8')
 
-            if len(csv) > 0:
+            if results is not None and len(results.columns) > 0:
+                export_format = ExportFormatEnum(st.selectbox(
+                    "Export format",
+                    ExportFormatEnum.list()
+                ))
+
+                data = export_lottery_winners(
+                    credentials_hash=get_credentials_hash(api_key, secret),
+                    lottery_uid=lottery_uid,
+                    ticket_uid=ticket_uid,
+                    fetch_id=fetch_id,
+                    export_format=export_format.value,
+                    _results=results
+                )
+
                 st.download_button(
-                    label="Donwload Results as CSV",
-                    data=csv,
-                    file_name=f"{lottery_uid}.csv",
-                    mime="text/csv",
-                    key="download-csv"
+                    label=f"Donwload Results as {export_format.name}",
+                    data=data,
+                    file_name=f"{lottery_uid}.{export_format.value}",
+                    mime=get_mime_type(export_format),
+                    key="download-results"
                 )
 
+        metrics_panel()
         footer()
     except Exception as e:
         st.error(f"An error occurred: {str(e)}", icon="🚨")
+
+def get_credentials_hash(
+    api_key:str,
+    secret:str
+    ) -> str:
+    """
+    Returns a hash of the credentials, so the caches are keyed by the credentials
+    without keeping them in the cache keys.
+    """
+    return hashlib.sha256(f"{api_key}:{secret}".encode('utf-8')).hexdigest()
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS)
+def get_cached_funifier_api(
+    credentials_hash:str,
+    _api_key:str,
+    _secret:str
+    ) -> FunifierAPI:
+    """
+    Returns one FunifierAPI (and its connection pool) per credentials across all the reruns.
+    The arguments with a leading underscore are not part of the cache key.
+    """
+    return get_funifier_api(_api_key, _secret)
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner="Loading the lottery winners ...")
+def fetch_lottery_winners(
+    credentials_hash:str,
+    lottery_uid:str,
+    ticket_uid:str,
+    refresh:int,
+    _api_key:str,
+    _secret:str
+    ) -> Tuple[pd.DataFrame, str]:
+    """
+    Returns the lottery winners and the id of the fetch, memoized by lottery, ticket, credentials hash
+    and the refresh nonce of the session, so reruns which only re-render the page do not call the Funifier API.
+    The id changes with every call of the API, e.g. after the cache entry has expired.
+    """
+    api = get_cached_funifier_api(credentials_hash, _api_key, _secret)
+    results = api.get_lottery_winners_with_address(
+        lotteryUID=lottery_uid,
+        ticketUID=ticket_uid
+    )
+    return results, uuid.uuid4().hex
         
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=len(ExportFormatEnum.list()) * 4, show_spinner=False)
+def export_lottery_winners(
+    credentials_hash:str,
+    lottery_uid:str,
+    ticket_uid:str,
+    fetch_id:str,
+    export_format:str,
+    _results:pd.DataFrame
+    ) -> bytes:
+    """
+    Returns the export of the lottery winners, memoized by the fetch id of `fetch_lottery_winners()` and
+    the format, so a rerun does not export the results again. The results are not hashed, they are given
+    by the fetch id, so a re-fetch of the results is exported again.
+
+    Streamlit sends the download as one payload, so the whole export is held in memory once per format;
+    it is written chunk by chunk into the buffer.
+    """
+    file = BytesIO()
+    export_dataframe(_results, ExportFormatEnum(export_format), file)
+    return file.getvalue()
+
 def get_funifier_api(
     api_key:str,
     secret:str
@@ -135,6 +250,57 @@ def get_funifier_api(
 
 
 
+def metrics_panel():
+    """
+    Shows the latency percentiles and the byte and row counters of the Funifier API
+    requests of this process in the sidebar, with downloads of all the metrics.
+    """
+    snapshot = METRICS.snapshot()
+
+    with st.sidebar:
+        st.header("API Metrics")
+        if len(snapshot["counters"]) == 0:
+            st.caption("No requests have been sent yet.")
+            return
+
+        latencies = pd.DataFrame([
+            {
+                **histogram["labels"],
+                "count": histogram["count"],
+                "mean [s]": histogram["sum"] / histogram["count"],
+                "p50 [s]": histogram["p50"],
+                "p95 [s]": histogram["p95"],
+            }
+            for histogram in snapshot["histograms"]
+            if histogram["name"] == "funifier_request_seconds"
+        ])
+        counters = pd.DataFrame([
+            {"metric": counter["name"], **counter["labels"], "value": counter["value"]}
+            for counter in snapshot["counters"]
+        ])
+
+        st.markdown("**Latency by route and phase**")
+        st.dataframe(latencies, hide_index=True)
+        st.markdown("**Requests, bytes and rows**")
+        st.dataframe(counters, hide_index=True)
+        st.markdown("**Circuit breakers**")
+        st.dataframe(pd.DataFrame(list(circuit_breaker_statistics().values())), hide_index=True)
+
+        st.download_button(
+            label="Download Metrics as JSON",
+            data=METRICS.to_json(indent=2),
+            file_name="metrics.json",
+            mime="application/json",
+            key="download-metrics-json"
+        )
+        st.download_button(
+            label="Download Metrics as Prometheus Text",
+            data=METRICS.to_prometheus(),
+            file_name="metrics.prom",
+            mime="text/plain",
+            key="download-metrics-prometheus"
+        )
+
 #region streamlit helper functions
 def image(src_as_string, **style):
     return img(src=src_as_string, style=styles(**style))
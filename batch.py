@@ -0,0 +1,161 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Exports the winners of all the lotteries of a manifest without the Streamlit app"""
+##*
+##*
+##* 1. write a manifest of the lotteries to close, either a CSV file with a header
+##*        lotteryUID,ticketUID
+##*        <lottery UID>,<lottery ticket UID>
+##*    or a JSON file
+##*        [{"lotteryUID": "<lottery UID>", "ticketUID": "<lottery ticket UID>"}]
+##* 2. set the credentials of the Funifier API
+##*     > set FUNIFIER_API_KEY=...
+##*     > set FUNIFIER_APP_SECRET=...
+##* 3. run the following command:
+##*     > python batch.py lotteries.csv --output-dir output --format csv --workers 4
+##*
+##* The output directory gets one file per lottery, the combined file of all
+##* the lotteries and summary.json with the rows, seconds and error of every
+##* lottery. The exit code is 0 if all the lotteries have succeeded, 1 if at
+##* least one has failed and 2 if the arguments or the manifest are invalid.
+##*
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##* 2026-10-18          bettlerd    the --columns are validated with the other arguments
+##*
+##*
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Optional
+
+from common.enums.common.encoding import EncodingEnum
+from common.enums.common.executor_kind import ExecutorKindEnum
+from common.enums.common.export_format import ExportFormatEnum
+from common.enums.funifier.join_plan import JoinPlanEnum
+from common.helper.manifest_helper import read_manifest
+from common.helper.projection_helper import select_columns
+from common.service.batch_runner import (
+    BatchOptions, LotteryResult, run_batch, write_combined, COMBINED_FILE_NAME, DEFAULT_MAX_WORKERS
+)
+from domain_objects.dto.common.api_config_dto import APIConfigsDTO, Header
+
+URL = "eu1.service.funifier.com"
+VERSION = "v3"
+API_KEY_VARIABLE = "FUNIFIER_API_KEY"
+APP_SECRET_VARIABLE = "FUNIFIER_APP_SECRET"
+SUMMARY_FILE_NAME = "summary.json"
+
+EXIT_OK = 0
+EXIT_FAILED_LOTTERIES = 1
+EXIT_INVALID_INPUT = 2
+
+
+def parse_arguments(argv:Optional[List[str]]=None)->argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("manifest", help="CSV or JSON file of the lottery/ticket pairs")
+    parser.add_argument("--output-dir", default="output", help="directory of the exports and the summary")
+    parser.add_argument("--format", default=ExportFormatEnum.CSV.value, choices=ExportFormatEnum.list())
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help="number of lotteries run at the same time")
+    parser.add_argument("--executor", default=ExecutorKindEnum.PROCESS.value, choices=ExecutorKindEnum.list())
+    parser.add_argument("--join-plan", default=JoinPlanEnum.SERVER.value, choices=JoinPlanEnum.list())
+    parser.add_argument("--columns", nargs="+", default=None, help="winner and address columns, defaults to all")
+    parser.add_argument("--deadline", type=float, default=None, help="seconds a lottery may take incl. its retries")
+    parser.add_argument("--combined-name", default=COMBINED_FILE_NAME, help="file name of the combined export")
+    parser.add_argument("--no-combined", action="store_true", help="writes no combined export")
+    parser.add_argument("--url", default=URL, help="host of the Funifier API, «http://» connects without TLS")
+    parser.add_argument("--version", default=VERSION)
+    parser.add_argument("--api-key", default=os.environ.get(API_KEY_VARIABLE),
+                        help=f"defaults to the environment variable {API_KEY_VARIABLE}")
+    parser.add_argument("--secret", default=os.environ.get(APP_SECRET_VARIABLE),
+                        help=f"defaults to the environment variable {APP_SECRET_VARIABLE}")
+    args = parser.parse_args(argv)
+
+    if not args.api_key or not args.secret:
+        parser.error(f"the credentials are required, set {API_KEY_VARIABLE} and {APP_SECRET_VARIABLE}")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    try:
+        select_columns(args.columns)
+    except ValueError as e:
+        parser.error(f"--columns: {e}")
+    return args
+
+def report_progress(done:int, total:int, result:LotteryResult)->None:
+    status = "ok" if result.succeeded else "FAILED"
+    line = f"[{done:>{len(str(total))}}/{total}] {status:<6} {result.lottery_uid} {result.rows} rows {result.seconds:.2f} s"
+    if not result.succeeded:
+        line += f" {result.error}"
+    print(line, file=sys.stderr, flush=True)
+
+def write_summary(path:str, results:List[LotteryResult], seconds:float, combined_path:Optional[str])->None:
+    summary = {
+        "lotteries": len(results),
+        "succeeded": sum(result.succeeded for result in results),
+        "failed": sum(not result.succeeded for result in results),
+        "rows": sum(result.rows for result in results),
+        "seconds": round(seconds, 3),
+        "combined": combined_path,
+        "results": [result.to_dict() for result in results],
+    }
+    with open(path, "w", encoding=EncodingEnum.UTF8.value) as file:
+        json.dump(summary, file, indent=2, ensure_ascii=False)
+
+def main(argv:Optional[List[str]]=None)->int:
+    args = parse_arguments(argv)
+    try:
+        entries = read_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Invalid manifest: {e}", file=sys.stderr)
+        return EXIT_INVALID_INPUT
+
+    config = APIConfigsDTO(
+        api_key=args.api_key,
+        app_secret=args.secret,
+        version=args.version,
+        url=args.url,
+        header=Header(
+            content_type="application/json",
+            range="items=0-1000000"
+        )
+    )
+    options = BatchOptions(config=config,
+                           output_dir=args.output_dir,
+                           export_format=ExportFormatEnum(args.format),
+                           join_plan=JoinPlanEnum(args.join_plan),
+                           columns=args.columns,
+                           deadline_seconds=args.deadline,
+                           keep_data=not args.no_combined)
+
+    print(f"Running {len(entries)} lotteries with {args.workers} {args.executor} workers", file=sys.stderr)
+    started_at = time.perf_counter()
+    results = run_batch(entries,
+                        options,
+                        executor=ExecutorKindEnum(args.executor),
+                        max_workers=args.workers,
+                        progress=report_progress)
+    combined_path = None if args.no_combined else write_combined(results, options, args.combined_name)
+    seconds = time.perf_counter() - started_at
+
+    write_summary(os.path.join(args.output_dir, SUMMARY_FILE_NAME), results, seconds, combined_path)
+    failed = [result for result in results if not result.succeeded]
+    print(f"{len(results) - len(failed)} of {len(results)} lotteries succeeded, "
+          f"{sum(result.rows for result in results)} rows in {seconds:.2f} s", file=sys.stderr)
+    for result in failed:
+        print(f"FAILED {result.lottery_uid}: {result.error}", file=sys.stderr)
+
+    return EXIT_FAILED_LOTTERIES if failed else EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,15 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Containing the benchmarks, run them with python -m benchmarks.<name>"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##* 
+##*
+##*
@@ -0,0 +1,176 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+"""Measures the decoding and encoding of large lists of Id and Settings DTOs
+
+The compiled decoders of `get_dto_decoder()` are compared with the previous
+implementation, i.e. `from_dict()` with one reflective `get_optional_value()`
+call per field and DTOs with a `__dict__`. Besides the time per object the
+memory of the decoded list is measured with tracemalloc.
+
+The compiled `to_dict()` is compared with the previous reflective one, and
+`list_to_json()` with `json.dumps()` of the dictionaries.
+
+Usage:
+    python -m benchmarks.dto_benchmark [--objects 100000] [--repeat 3]
+"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##* 2026-10-18      bettlerd    to_dict() and list_to_json()
+##*
+##*
+
+import argparse
+import io
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, get_args, get_origin
+
+from common.extensions.dto_extension import ExtendedDTO
+from domain_objects.dto.common.api_config_dto import Id, Settings
+
+
+#region legacy implementation
+def legacy_get_optional_value(obj:Dict[str, Any], key:str, value_type:type)->Any:
+    """
+    `get_optional_value()` before the decoders were compiled, the type is inspected for every value.
+    """
+    if obj is None or key not in obj:
+        return None
+
+    obj_by_key = obj.get(key)
+    if get_origin(value_type) is list:
+        type_args = get_args(value_type)[0]
+        if type(type_args) is type and type_args in (str, int, float, bool):
+            return [type_args(y) for y in obj_by_key]
+        elif issubclass(type_args, ExtendedDTO):
+            return [type_args.from_dict(y) for y in obj_by_key]
+    elif type(value_type) is type and value_type in (str, int, float, bool):
+        return value_type(obj_by_key)
+    elif issubclass(value_type, ExtendedDTO):
+        return value_type.from_dict(obj_by_key)
+    raise TypeError("This type has not yet been implemented!")
+
+@dataclass
+class LegacyId(ExtendedDTO):
+    name: Optional[str] = None
+    value: Optional[str] = None
+    type: Optional[str] = None
+
+    @staticmethod
+    def from_dict(obj:Any)->'LegacyId':
+        _name = legacy_get_optional_value(obj, "name", str)
+        _value = legacy_get_optional_value(obj, "value", str)
+        _type = legacy_get_optional_value(obj, "type", str)
+        return LegacyId(_name, _value, _type)
+
+@dataclass
+class LegacySettings(ExtendedDTO):
+    ids: Optional[List[LegacyId]] = None
+    expiration_time: Optional[int] = None
+
+    @staticmethod
+    def from_dict(obj:Any)->'LegacySettings':
+        _ids = legacy_get_optional_value(obj, "Ids", List[LegacyId])
+        _expiration_time = legacy_get_optional_value(obj, "ExpirationTime", int)
+        return LegacySettings(_ids, _expiration_time)
+
+def legacy_to_dict(dto:Any)->Dict[str, Any]:
+    """
+    `to_dict()` before it was compiled, it walks `__dict__` and compares every value with «None».
+    """
+    result = {}
+    for key, value in dto.__dict__.items():
+        value = None if value == "None" else value
+        if value is not None:
+            if isinstance(value, list):
+                result[key] = [legacy_to_dict(item) for item in value]
+            elif isinstance(value, Enum):
+                result[key] = value.value
+            elif isinstance(value, ExtendedDTO):
+                result[key] = legacy_to_dict(value)
+            else:
+                result[key] = value
+    return result
+#endregion
+
+
+def id_documents(n:int)->List[Dict[str, Any]]:
+    return [{"name": f"id-{i}", "value": str(i), "type": "int"} for i in range(n)]
+
+def settings_documents(n:int)->List[Dict[str, Any]]:
+    return [{"Ids": id_documents(3), "ExpirationTime": 60} for _ in range(n)]
+
+def measure(decode:Callable[[Any], Any], documents:List[Dict[str, Any]], repeat:int)->Dict[str, float]:
+    """
+    Returns the best time per object in microseconds and the memory of the decoded list in bytes per object.
+    """
+    seconds = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        [decode(document) for document in documents]
+        seconds.append(time.perf_counter() - started_at)
+
+    tracemalloc.start()
+    try:
+        decoded = [decode(document) for document in documents]
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del decoded
+
+    return {
+        "micros_per_object": min(seconds) / len(documents) * 1e6,
+        "bytes_per_object": size / len(documents),
+    }
+
+def measure_bulk(encode:Callable[[List[Any]], Any], dtos:List[Any], repeat:int)->Dict[str, float]:
+    """
+    Returns the best time per object in microseconds of encoding the whole list at once.
+    """
+    seconds = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        encode(dtos)
+        seconds.append(time.perf_counter() - started_at)
+    return {"micros_per_object": min(seconds) / len(dtos) * 1e6}
+
+def run_benchmark(objects:int, repeat:int)->Dict[str, Dict[str, float]]:
+    ids = id_documents(objects)
+    settings = settings_documents(objects // 10)
+    results = {
+        "Id legacy": measure(LegacyId.from_dict, ids, repeat),
+        "Id compiled": measure(Id.from_dict, ids, repeat),
+        "Settings legacy": measure(LegacySettings.from_dict, settings, repeat),
+        "Settings compiled": measure(Settings.from_dict, settings, repeat),
+    }
+
+    legacy_settings = [LegacySettings.from_dict(document) for document in settings]
+    settings_dtos = [Settings.from_dict(document) for document in settings]
+    results.update({
+        "Settings to_dict legacy": measure_bulk(lambda dtos: [legacy_to_dict(dto) for dto in dtos], legacy_settings, repeat),
+        "Settings to_dict compiled": measure_bulk(lambda dtos: [dto.to_dict() for dto in dtos], settings_dtos, repeat),
+        "Settings json.dumps(to_dict)": measure_bulk(lambda dtos: json.dumps([dto.to_dict() for dto in dtos]), settings_dtos, repeat),
+        "Settings list_to_json": measure_bulk(lambda dtos: Settings.list_to_json(dtos, io.StringIO()), settings_dtos, repeat),
+    })
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=100000, help="number of Id objects, a tenth as many Settings")
+    parser.add_argument("--repeat", type=int, default=3, help="the best of the repetitions is reported")
+    args = parser.parse_args()
+
+    for name, result in run_benchmark(args.objects, args.repeat).items():
+        memory = f"{result['bytes_per_object']:10.1f} bytes/object" if "bytes_per_object" in result else ""
+        print(f"{name:<30} {result['micros_per_object']:10.2f} µs/object {memory}")
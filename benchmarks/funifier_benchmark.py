@@ -0,0 +1,299 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+"""End-to-end benchmark of the FunifierAPI against the local stand-in
+
+For every payload size a stand-in server is started (see funifier_stand_in)
+and `get_lottery_winners_with_address()`, `count_lottery_participants()` and
+`count_lottery_participants_batch()` for BATCH_TICKETS tickets are called
+`--iterations` times after one warm-up call. The winners are measured once
+more with only the `--columns` (by default player, name and zip), which are
+pushed down into the pipeline, to show the bytes saved by the projection. The report has the p50/p95
+latency, the throughput in rows and MB per second, the MB on the wire per
+call (less than the body if it is compressed) and the peak memory of one
+more call traced with tracemalloc; the traced call is not part of the
+latencies since tracing slows it down.
+
+The results are compared against a stored baseline and can be saved as the
+new baseline. The baseline is only meaningful on the machine it was created on.
+
+Usage:
+    python -m benchmarks.funifier_benchmark [--sizes 1000 100000 1000000] [--iterations 5]
+        [--latency 0.0] [--bandwidth BYTES_PER_SECOND] [--certfile CERT --keyfile KEY] [--compression gzip]
+        [--columns player firstname lastName zip]
+        [--baseline benchmarks/baseline.json] [--save-baseline] [--tolerance 0.25] [--fail-on-regression]
+"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##* 2026-10-18      bettlerd    --compression and the MB on the wire per call
+##* 2026-10-18      bettlerd    count_lottery_participants_batch()
+##* 2026-10-18      bettlerd    the winners with the projected --columns
+##*
+##*
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import ssl
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.funifier_stand_in import COMPRESSION_WBITS, FunifierStandIn, StandInOptions
+from common.enums.funifier.join_plan import JoinPlanEnum
+from common.helper.funifier_response_helper import count_rows
+from common.service.api_funifier_service import FunifierAPI
+from common.service.metrics_registry import MetricsRegistry
+from domain_objects.dto.common.api_config_dto import APIConfigsDTO, Header
+
+DEFAULT_SIZES = [1000, 100000, 1000000]
+DEFAULT_ITERATIONS = 5
+DEFAULT_TOLERANCE = 0.25
+BATCH_TICKETS = 100
+# the columns of a typical export, i.e. player, name and zip
+PROJECTED_COLUMNS = ["player", "firstname", "lastName", "zip"]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# metric -> True if a higher value is better
+METRICS_DIRECTION = {
+    "p50_seconds": False,
+    "p95_seconds": False,
+    "rows_per_second": True,
+    "mb_per_second": True,
+    "wire_mb": False,
+    "peak_memory_mb": False,
+}
+
+
+def percentile(values:List[float], q:float)->float:
+    """
+    Returns the q-quantile of the values by the nearest-rank method.
+
+    Examples:
+        >>> percentile([0.3, 0.1, 0.2, 0.4], 0.5), percentile([0.3, 0.1, 0.2, 0.4], 0.95)
+        (0.2, 0.4)
+    """
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+def create_api(url:str, tls:bool)->FunifierAPI:
+    """
+    Returns a FunifierAPI for the stand-in, without response cache and with its own metrics.
+    """
+    config = APIConfigsDTO(
+        api_key="benchmark",
+        app_secret="benchmark",
+        version="v3",
+        url=url,
+        header=Header(content_type="application/json", range="items=0-1000000")
+    )
+    ssl_context = None
+    if tls:
+        # the stand-in has a self-signed certificate
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    with contextlib.redirect_stdout(io.StringIO()):
+        return FunifierAPI(config, metrics=MetricsRegistry(), ssl_context=ssl_context)
+
+def measure(call:Callable[[], Any], iterations:int, api:FunifierAPI)->Dict[str, float]:
+    """
+    Calls the function once to warm up, `iterations` times timed and once traced by tracemalloc.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = count_rows(call())
+
+        bytes_before = response_bytes(api)
+        wire_bytes_before = response_bytes(api, "funifier_response_wire_bytes_total")
+        latencies = []
+        for _ in range(iterations):
+            started_at = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - started_at)
+        n_bytes = (response_bytes(api) - bytes_before) / iterations
+        wire_bytes = (response_bytes(api, "funifier_response_wire_bytes_total") - wire_bytes_before) / iterations
+
+        tracemalloc.start()
+        try:
+            call()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    p50 = percentile(latencies, 0.5)
+    return {
+        "rows": rows,
+        "p50_seconds": round(p50, 6),
+        "p95_seconds": round(percentile(latencies, 0.95), 6),
+        "rows_per_second": round(rows / p50, 1),
+        "mb_per_second": round(n_bytes / p50 / 1e6, 3),
+        "wire_mb": round(wire_bytes / 1e6, 3),
+        "peak_memory_mb": round(peak / 1e6, 3),
+    }
+
+def response_bytes(api:FunifierAPI, counter_name:str="funifier_response_bytes_total")->float:
+    snapshot = api.metrics.snapshot()
+    return sum(counter["value"] for counter in snapshot["counters"] if counter["name"] == counter_name)
+
+def run_benchmark(
+        sizes:List[int],
+        iterations:int,
+        latency_seconds:float=0.0,
+        bandwidth:Optional[float]=None,
+        certfile:Optional[str]=None,
+        keyfile:Optional[str]=None,
+        join_plan:JoinPlanEnum=JoinPlanEnum.SERVER,
+        compression:Optional[str]=None,
+        columns:Optional[List[str]]=None
+    )->Dict[str, Dict[str, float]]:
+    """
+    Returns the measurements by benchmark name, e.g. «winners_with_address[100000]».
+    """
+    columns = PROJECTED_COLUMNS if columns is None else columns
+    results = {}
+    for size in sizes:
+        options = StandInOptions(rows=size,
+                                 latency_seconds=latency_seconds,
+                                 bandwidth_bytes_per_second=bandwidth,
+                                 certfile=certfile,
+                                 keyfile=keyfile,
+                                 compression=compression)
+        with FunifierStandIn(options) as stand_in, create_api(stand_in.url, tls=certfile is not None) as api:
+            results[f"winners_with_address[{size}]"] = measure(
+                lambda: api.get_lottery_winners_with_address("lottery-1", "ticket-1", join_plan=join_plan),
+                iterations, api)
+            results[f"winners_with_address_projected[{size}]"] = measure(
+                lambda: api.get_lottery_winners_with_address("lottery-1", "ticket-1", join_plan=join_plan,
+                                                             columns=columns),
+                iterations, api)
+            results[f"count_lottery_participants[{size}]"] = measure(
+                lambda: api.count_lottery_participants("ticket-1"),
+                iterations, api)
+            tickets = [f"ticket-{i}" for i in range(BATCH_TICKETS)]
+            results[f"count_lottery_participants_batch[{size}]"] = measure(
+                lambda: api.count_lottery_participants_batch(tickets),
+                iterations, api)
+            print(f"finished {size} rows", file=sys.stderr)
+    return results
+
+def compare(
+        results:Dict[str, Dict[str, float]],
+        baseline:Dict[str, Dict[str, float]],
+        tolerance:float=DEFAULT_TOLERANCE
+    )->List[str]:
+    """
+    Returns the regressions of the results against the baseline, i.e. the metrics which are
+    worse than the baseline by more than the tolerance (a fraction of the baseline value).
+
+    Examples:
+        >>> compare({"a": {"p50_seconds": 1.5, "rows_per_second": 90}},
+        ...         {"a": {"p50_seconds": 1.0, "rows_per_second": 100}}, tolerance=0.25)
+        ['a: p50_seconds 1.5 vs. 1.0 (+50.0%)']
+    """
+    regressions = []
+    for name, measurements in results.items():
+        for metric, higher_is_better in METRICS_DIRECTION.items():
+            value = measurements.get(metric)
+            reference = baseline.get(name, {}).get(metric)
+            if value is None or not reference:
+                continue
+            change = (value - reference) / reference
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(f"{name}: {metric} {value} vs. {reference} ({change:+.1%})")
+    return regressions
+
+def format_report(
+        results:Dict[str, Dict[str, float]],
+        baseline:Dict[str, Dict[str, float]]
+    )->str:
+    """
+    Returns the results as a table with the change against the baseline in brackets.
+    """
+    columns = ["rows", *METRICS_DIRECTION]
+    lines = [f"{'benchmark':<36}" + "".join(f"{column:>26}" for column in columns)]
+    for name, measurements in results.items():
+        cells = []
+        for column in columns:
+            value = measurements[column]
+            reference = baseline.get(name, {}).get(column)
+            change = f" ({(value - reference) / reference:+.0%})" if reference and column != "rows" else ""
+            cells.append(f"{f'{value}{change}':>26}")
+        lines.append(f"{name:<36}" + "".join(cells))
+    return "\n".join(lines)
+
+def load_baseline(path:str)->Dict[str, Dict[str, float]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+def save_baseline(path:str, results:Dict[str, Dict[str, float]], arguments:Dict[str, Any])->None:
+    document = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "arguments": arguments,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+        file.write("\n")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="number of rows of the stand-in")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before the response headers")
+    parser.add_argument("--bandwidth", type=float, default=None, help="bytes per second of the response body")
+    parser.add_argument("--certfile", default=None, help="certificate chain of the stand-in, benchmarks HTTPS if given")
+    parser.add_argument("--keyfile", default=None)
+    parser.add_argument("--compression", default=None, choices=list(COMPRESSION_WBITS), help="content coding of the stand-in")
+    parser.add_argument("--join-plan", default=JoinPlanEnum.SERVER.value, choices=JoinPlanEnum.list())
+    parser.add_argument("--columns", nargs="+", default=PROJECTED_COLUMNS, help="columns of the projected winners")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON file of the baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="stores the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed relative regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exits with 1 if there is a regression")
+    args = parser.parse_args()
+
+    results = run_benchmark(sizes=args.sizes,
+                            iterations=args.iterations,
+                            latency_seconds=args.latency,
+                            bandwidth=args.bandwidth,
+                            certfile=args.certfile,
+                            keyfile=args.keyfile,
+                            join_plan=JoinPlanEnum(args.join_plan),
+                            compression=args.compression,
+                            columns=args.columns)
+    baseline = load_baseline(args.baseline)
+    print(format_report(results, baseline))
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, {
+            "iterations": args.iterations,
+            "latency": args.latency,
+            "bandwidth": args.bandwidth,
+            "tls": args.certfile is not None,
+            "join_plan": args.join_plan,
+            "compression": args.compression,
+        })
+        print(f"saved the baseline to {args.baseline}")
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
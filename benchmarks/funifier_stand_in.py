@@ -0,0 +1,364 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+"""A local stand-in of the aggregation routes of the Funifier API
+
+It answers POST /<version>/database/<collection>/aggregate with synthetic
+achievements, so the FunifierAPI can be measured without eu1.service.funifier.com:
+    - a pipeline with a «$count» stage gets [{"count": rows}]
+    - a pipeline which groups the tickets of an «$in» list gets a count per ticket,
+      `rows` tickets bought by half as many players
+    - a pipeline which groups by player gets one address per player of its «$in» list
+    - every other pipeline gets `rows` lottery winners, with their address if it has a «$lookup»
+      or matches the ticket purchases (type 2), the i-th winner has the time FIRST_TIME + i seconds
+      and a «time» «$gte» match skips the older ones
+    - the winners only have the columns of the last «$project» stage and the addresses by player
+      the ones of the «$group» stage
+
+The `Range` header (items=<start>-<end>) selects a slice of the rows. The body
+is streamed with chunked transfer encoding and can be throttled with a latency
+before the response headers and a bandwidth limit, which applies to the
+bytes on the wire. With `--compression gzip|deflate` the body is compressed
+while it is streamed if the request accepts the coding.
+
+The server runs in a separate process, so it neither competes for the GIL
+with the client nor shows up in the memory measured in the client.
+
+Usage:
+    python -m benchmarks.funifier_stand_in --rows 100000 --port 8080 [--latency 0.05] [--bandwidth 10000000]
+        [--compression gzip]
+"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##* 2026-10-18      bettlerd    gzip/deflate compressed responses
+##* 2026-10-18      bettlerd    counts of the participants by ticket
+##* 2026-10-18      bettlerd    a time per winner and the «$gte» time match of the incremental sync
+##* 2026-10-18      bettlerd    ticket purchases (type 2) with the address of the player
+##* 2026-10-18      bettlerd    only the columns of the «$project» and «$group» stages
+##*
+##*
+
+import argparse
+import json
+import math
+import multiprocessing
+import re
+import ssl
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional, Set
+
+ROUTE_PATTERN = re.compile(r"^/[^/]+/database/[^/?]+/aggregate(\?.*)?$")
+RANGE_PATTERN = re.compile(r"^items=(\d+)-(\d+)$")
+ROWS_PER_CHUNK = 1000
+FIRST_TIME = datetime(2026, 10, 18, 8, tzinfo=timezone.utc)
+# wbits of zlib.compressobj by content coding
+COMPRESSION_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+CITIES = [("Aarau", "5000"), ("Baden", "5400"), ("Luzern", "6000"), ("St. Gallen", "9000"), ("Zug", "6300")]
+
+
+@dataclass
+class StandInOptions():
+    rows: int = 1000
+    latency_seconds: float = 0.0
+    bandwidth_bytes_per_second: Optional[float] = None
+    certfile: Optional[str] = None
+    keyfile: Optional[str] = None
+    # «gzip» or «deflate», None sends the body uncompressed
+    compression: Optional[str] = None
+
+
+def winner_row(i:int, lottery_uid:str, with_address:bool, columns:Optional[Set[str]]=None)->str:
+    """
+    Returns the i-th synthetic lottery winner as JSON, with the given columns only if there are any.
+
+    Examples:
+        >>> json.loads(winner_row(7, "lottery-1", False))["player"]
+        'player-0000007'
+        >>> winner_row(7, "lottery-1", True, {"player", "zip"})
+        '{"player":"player-0000007","zip":"6000"}'
+    """
+    row = {
+        "_id": f"achievement-{i:09d}",
+        "player": f"player-{i:07d}",
+        "total": 1,
+        "lotteryUID": lottery_uid,
+        "time": {"$date": (FIRST_TIME + timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%S.000Z")},
+        "ticketUID": f"ticket-{lottery_uid}",
+    }
+    if with_address:
+        row.update(address_fields(i))
+    if columns is not None:
+        row = {column: value for column, value in row.items() if column in columns}
+    return json.dumps(row, separators=(",", ":"))
+
+def address_fields(i:int)->dict:
+    city, zip = CITIES[i % len(CITIES)]
+    return {
+        "firstname": f"Vorname{i}",
+        "lastName": f"Nachname{i}",
+        "phone": f"079{i:07d}",
+        "dateOfBirth": "1990-01-01",
+        "street": f"Bahnhofstrasse {i % 200 + 1}",
+        "city": city,
+        "zip": zip,
+        "tos_accepted": True,
+        "privacy_accepted": i % 3 != 0,
+    }
+
+def output_columns(stage:Any)->Optional[Set[str]]:
+    """
+    Returns the columns of the rows of a «$project» or «$group» stage, None if it is no such stage.
+
+    Examples:
+        >>> sorted(output_columns({"$project": {"_id": 0, "player": 1, "zip": "$zip"}}))
+        ['player', 'zip']
+        >>> sorted(output_columns({"$group": {"_id": "$player", "zip": {"$first": "$extra.zip"}}}))
+        ['_id', 'zip']
+    """
+    fields = stage.get("$project", stage.get("$group")) if isinstance(stage, dict) else None
+    if not isinstance(fields, dict):
+        return None
+    columns = {column for column, value in fields.items() if value not in (0, False)}
+    if "$project" in stage and fields.get("_id", 1) not in (0, False):
+        columns.add("_id")
+    return columns
+
+def iter_stages(pipeline:Any)->Iterator[dict]:
+    """
+    Yields the stages of a pipeline incl. the ones of the `$lookup` sub-pipelines.
+    """
+    for stage in pipeline if isinstance(pipeline, list) else []:
+        if isinstance(stage, dict):
+            yield stage
+            lookup = stage.get("$lookup")
+            if isinstance(lookup, dict):
+                yield from iter_stages(lookup.get("pipeline"))
+
+def iter_response(pipeline:Any, rows:int, start:int, end:int)->Iterator[str]:
+    """
+    Yields the JSON array of the response in parts of at most ROWS_PER_CHUNK elements.
+    """
+    stages = pipeline if isinstance(pipeline, list) else []
+    match = stages[0].get("$match", {}) if stages and isinstance(stages[0], dict) else {}
+
+    if any("$count" in stage for stage in stages):
+        yield json.dumps([{"count": rows}])
+        return
+
+    tickets = match.get("item", {}).get("$in") if isinstance(match.get("item"), dict) else None
+    groups = [stage["$group"] for stage in stages if "$group" in stage]
+    if tickets is not None and match.get("type") == 2 and groups:
+        # grouped by ticket and player first if the distinct players are counted
+        count = (rows + 1) // 2 if len(groups) > 1 else rows
+        yield json.dumps([{"_id": ticket, "count": count} for ticket in tickets[start:end]])
+        return
+
+    players = match.get("player", {}).get("$in") if isinstance(match.get("player"), dict) else None
+    if players is not None and any("$group" in stage for stage in stages):
+        columns = next(output_columns(stage) for stage in stages if "$group" in stage)
+        parts = []
+        for player in players[start:end]:
+            suffix = str(player).rsplit("-", 1)[-1]
+            i = int(suffix) if suffix.isdigit() else 0
+            row = {"_id": player, **address_fields(i)}
+            parts.append(json.dumps({column: value for column, value in row.items() if column in columns},
+                                    separators=(",", ":")))
+        yield "[" + ",".join(parts) + "]"
+        return
+
+    item = match.get("item", "lottery")
+    lottery_uid = item if isinstance(item, str) else "lottery"
+    with_address = match.get("type") == 2 or any("$lookup" in stage for stage in iter_stages(stages))
+    projections = [output_columns(stage) for stage in stages if "$project" in stage]
+    columns = projections[-1] if projections else None
+    start += first_row_since(match.get("time"))
+    end = min(end, rows)
+
+    yield "["
+    for chunk_start in range(start, end, ROWS_PER_CHUNK):
+        chunk = ",".join(winner_row(i, lottery_uid, with_address, columns)
+                         for i in range(chunk_start, min(chunk_start + ROWS_PER_CHUNK, end)))
+        yield chunk if chunk_start == start else "," + chunk
+    yield "]"
+
+
+def first_row_since(time_match:Any)->int:
+    """
+    Returns the index of the first winner with a time at or after the «$gte» date of the match.
+
+    Examples:
+        >>> first_row_since({"$gte": {"$date": "2026-10-18T08:00:01.500Z"}}), first_row_since(None)
+        (2, 0)
+    """
+    since = time_match.get("$gte", {}).get("$date") if isinstance(time_match, dict) else None
+    if not isinstance(since, str):
+        return 0
+    seconds = (datetime.fromisoformat(since.replace("Z", "+00:00")) - FIRST_TIME).total_seconds()
+    return max(math.ceil(seconds), 0)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # the chunks are written one by one, Nagle's algorithm would delay the small ones
+    disable_nagle_algorithm = True
+    options = StandInOptions()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not ROUTE_PATTERN.match(self.path):
+            self.__send_error(404, f"The route «{self.path}» is not supported by the stand-in")
+            return
+
+        try:
+            pipeline = json.loads(body)
+        except ValueError:
+            self.__send_error(400, "The body is no valid JSON")
+            return
+
+        range_match = RANGE_PATTERN.match(self.headers.get("Range", ""))
+        start, end = (int(range_match.group(1)), int(range_match.group(2))) if range_match else (0, self.options.rows)
+
+        if self.options.latency_seconds > 0:
+            time.sleep(self.options.latency_seconds)
+
+        compression = self.__accepted_compression()
+        compressor = None if compression is None else zlib.compressobj(wbits=COMPRESSION_WBITS[compression])
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        if compression is not None:
+            self.send_header("Content-Encoding", compression)
+        self.end_headers()
+
+        started_at = time.perf_counter()
+        n_bytes = 0
+        for part in iter_response(pipeline, self.options.rows, start, end):
+            data = part.encode("utf-8")
+            if compressor is not None:
+                data = compressor.compress(data)
+            n_bytes += self.__write_chunk(data)
+            self.__throttle(n_bytes, started_at)
+        if compressor is not None:
+            n_bytes += self.__write_chunk(compressor.flush())
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+    def __accepted_compression(self)->Optional[str]:
+        compression = self.options.compression
+        accepted = [coding.split(";")[0].strip().lower() for coding in self.headers.get("Accept-Encoding", "").split(",")]
+        return compression if compression in accepted else None
+
+    def __write_chunk(self, data:bytes)->int:
+        # an empty chunk would end the body
+        if data:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        return len(data)
+
+    def __throttle(self, n_bytes:int, started_at:float)->None:
+        bandwidth = self.options.bandwidth_bytes_per_second
+        if bandwidth:
+            delay = n_bytes / bandwidth - (time.perf_counter() - started_at)
+            if delay > 0:
+                time.sleep(delay)
+
+    def __send_error(self, status:int, message:str)->None:
+        data = json.dumps({"errorCode": status, "errorMessage": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def create_server(options:StandInOptions, port:int=0)->ThreadingHTTPServer:
+    """
+    Returns the stand-in server bound to 127.0.0.1, with TLS if a certificate is given.
+    """
+    handler = type("ConfiguredStandInHandler", (StandInHandler,), {"options": options})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    if options.certfile is not None:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(options.certfile, options.keyfile)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+    return server
+
+def serve(options:StandInOptions, port_queue:Any, port:int=0)->None:
+    server = create_server(options, port)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+class FunifierStandIn():
+    """
+    Runs the stand-in server in a separate process.
+
+    Examples:
+        with FunifierStandIn(StandInOptions(rows=100000)) as stand_in:
+            config.url = stand_in.url
+    """
+
+    def __init__(self, options:Optional[StandInOptions]=None):
+        self.options = options or StandInOptions()
+        self.port:Optional[int] = None
+        self.__process = None
+
+    @property
+    def url(self)->str:
+        scheme = "http" if self.options.certfile is None else "https"
+        return f"{scheme}://127.0.0.1:{self.port}"
+
+    def start(self)->'FunifierStandIn':
+        context = multiprocessing.get_context("spawn")
+        port_queue = context.Queue()
+        self.__process = context.Process(target=serve, args=(self.options, port_queue), daemon=True)
+        self.__process.start()
+        self.port = port_queue.get(timeout=30)
+        return self
+
+    def stop(self)->None:
+        if self.__process is not None:
+            self.__process.terminate()
+            self.__process.join()
+            self.__process = None
+
+    def __enter__(self)->'FunifierStandIn':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback)->None:
+        self.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000, help="number of lottery winners")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before the response headers")
+    parser.add_argument("--bandwidth", type=float, default=None, help="bytes per second of the response body")
+    parser.add_argument("--certfile", default=None, help="certificate chain, serves HTTPS if given")
+    parser.add_argument("--keyfile", default=None)
+    parser.add_argument("--compression", default=None, choices=list(COMPRESSION_WBITS), help="content coding of the body")
+    args = parser.parse_args()
+
+    options = StandInOptions(rows=args.rows,
+                             latency_seconds=args.latency,
+                             bandwidth_bytes_per_second=args.bandwidth,
+                             certfile=args.certfile,
+                             keyfile=args.keyfile,
+                             compression=args.compression)
+    server = create_server(options, args.port)
+    print(f"Funifier stand-in with {args.rows} rows on port {server.server_address[1]}")
+    server.serve_forever()
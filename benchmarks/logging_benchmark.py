@@ -0,0 +1,98 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+"""Measures the per-call overhead of do_logging()
+
+The calls are made from a deep stack, like in a Streamlit script, and the
+console output is discarded. The previous implementation based on
+`inspect.stack()` is measured as the reference.
+
+Usage:
+    python -m benchmarks.logging_benchmark [--depth 60] [--calls 2000]
+"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##*
+##*
+
+import argparse
+import contextlib
+import inspect
+import io
+import logging
+import socket
+import time
+from typing import Callable, Dict
+
+from common.helper.logging_helper import do_logging, log_info
+
+
+def legacy_do_logging(txt:str, caller_lvl:int = 2):
+    """
+    The implementation of do_logging() before it was replaced, i.e. it looks up
+    the hostname and builds the whole stack with source context on every call.
+    """
+    hostname = socket.gethostname()
+    print(f"{inspect.stack()[caller_lvl - 1][3]}(): {txt}")
+
+def run_at_depth(depth:int, function:Callable[[], None])->None:
+    """
+    Calls the function with `depth` additional frames on the stack.
+    """
+    if depth <= 0:
+        function()
+    else:
+        run_at_depth(depth - 1, function)
+
+def measure(function:Callable[[], None], calls:int, depth:int)->float:
+    """
+    Returns the mean duration of one call in microseconds.
+    """
+    def loop():
+        for _ in range(calls):
+            function()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        run_at_depth(depth, loop)
+        elapsed = time.perf_counter() - start
+    return elapsed / calls * 1e6
+
+def run_benchmark(calls:int, depth:int)->Dict[str, float]:
+    """
+    Returns the mean duration of one call in microseconds per variant.
+    """
+    logger = logging.getLogger()
+    handlers, level = logger.handlers[:], logger.level
+    logger.handlers = [logging.NullHandler()]
+
+    try:
+        results = {
+            "legacy do_logging (inspect.stack)": measure(lambda: legacy_do_logging("winners loaded"), calls, depth),
+            "do_logging": measure(lambda: do_logging("winners loaded"), calls, depth),
+            "do_logging with fields": measure(lambda: do_logging("winners loaded", lottery="abc", rows=42), calls, depth),
+        }
+        logger.setLevel(logging.WARNING)
+        results["log_info, INFO disabled"] = measure(lambda: log_info("winners loaded", rows=42), calls, depth)
+        logger.setLevel(logging.INFO)
+        results["log_info, INFO emitted"] = measure(lambda: log_info("winners loaded", rows=42), calls, depth)
+    finally:
+        logger.handlers, logger.level = handlers, level
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000, help="number of log calls per variant")
+    parser.add_argument("--depth", type=int, default=60, help="number of frames below the caller")
+    args = parser.parse_args()
+
+    for name, micros in run_benchmark(args.calls, args.depth).items():
+        print(f"{name:<36} {micros:10.2f} µs/call")
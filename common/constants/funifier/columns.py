@@ -0,0 +1,42 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+""" Funifier API columns of the lottery winners"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##*
+##*
+
+# the column of the winner and the key of the joins, it is always returned
+PLAYER_COLUMN = "player"
+
+# the columns of the winner achievement (type 5) and their `$project` expression
+WINNER_FIELDS = {
+    "player": 1,
+    "total": 1,
+    "lotteryUID": "$item",
+    "time": 1,
+    "ticketUID": "$extra.ticket",
+}
+
+# the address columns and their field in the `extra` of the ticket purchase (type 2)
+ADDRESS_FIELDS = {
+    "firstname": "firstName",
+    "lastName": "lastName",
+    "phone": "phone",
+    "dateOfBirth": "dateOfBirth",
+    "street": "street",
+    "city": "city",
+    "zip": "zip",
+    "tos_accepted": "tos_accepted",
+    "privacy_accepted": "privacy_accepted",
+}
+
+WINNER_COLUMNS = list(WINNER_FIELDS)
+ADDRESS_COLUMNS = list(ADDRESS_FIELDS)
@@ -14,15 +14,26 @@
 ##* 2023-04-13          bettlerd    added N_DAYS
 ##* 2023-05-02          bettlerd    added LEADING_COMA, TIME_ATTRIBUTE
 ##* 2023-10-05          bettlerd    added N_ENTRIES
+##* 2026-10-18          bettlerd    added LOTTERY_UIDS, TICKET_UIDS
+##* 2026-10-18          bettlerd    added PLAYER_UIDS
+##* 2026-10-18          bettlerd    added SINCE
+##* 2026-10-18          bettlerd    added ADDRESS_GROUP, ADDRESS_GROUP_ID, PROJECTION
 ##*
 ##*
 
 # in alphabetical order
+ADDRESS_GROUP = "#address_group#"
+ADDRESS_GROUP_ID = "#address_group_id#"
 LEADING_COMA = "#leading_coma#"
 LOTTERY = "#lottery_uid#"
+LOTTERY_UIDS = "#lottery_uids#"
 N_DAYS = "#n_days#"
 N_ENTRIES = "#n_entries#"
 PLAYER = "#player_uid#"
+PLAYER_UIDS = "#player_uids#"
+PROJECTION = "#projection#"
+SINCE = "#since#"
 TICKET = "#ticket_uid#"
+TICKET_UIDS = "#ticket_uids#"
 TIME_ATTRIBUTE = "#time_attribute#"
 TIMEPERIOD = "#timeperiod#"
\ No newline at end of file
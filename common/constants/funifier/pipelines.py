@@ -0,0 +1,343 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Funifier API aggregation pipelines"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script, moved the pipelines of
+##*                                 count_lottery_participants() and
+##*                                 get_lottery_winners_with_address() from
+##*                                 the FunifierAPI
+##* 2026-10-18          bettlerd    added LOTTERY_WINNERS_WITH_ADDRESS_BATCH
+##* 2026-10-18          bettlerd    added LOTTERY_WINNERS, PLAYERS_ADDRESS
+##* 2026-10-18          bettlerd    the pipelines are compiled PipelineTemplates with
+##*                                 typed parameter slots instead of strings
+##* 2026-10-18          bettlerd    added COUNT_LOTTERY_PARTICIPANTS_BATCH and
+##*                                 COUNT_DISTINCT_LOTTERY_PARTICIPANTS_BATCH
+##* 2026-10-18          bettlerd    added LOTTERY_PARTICIPANTS_SINCE and
+##*                                 LOTTERY_WINNERS_WITH_ADDRESS_SINCE
+##* 2026-10-18          bettlerd    the address columns of the winners are bound to "#address_group_id#",
+##*                                 "#projection#" and "#address_group#", see common.helper.projection_helper
+##* 2026-10-18          bettlerd    the paginated pipelines sort by "_id", so the pages of a Range
+##*                                 header neither overlap nor skip a row
+##* 2026-10-18          bettlerd    COUNT_LOTTERY_PARTICIPANTS in alphabetical order
+##*
+##*
+
+from common.helper.pipeline_template_helper import PipelineTemplateRegistry
+import common.constants.funifier.pattern as pattern
+
+TEMPLATES = PipelineTemplateRegistry()
+
+# the pipelines which list achievements sort them by "_id" right after the "$match", a page of the
+# `Range` header is only well-defined for a deterministic order, see `FunifierAPI.iter_aggregation_pages()`
+
+# in alphabetical order
+# the players with at least one ticket by ticket, i.e. {"_id": <ticket UID>, "count": <players>}
+COUNT_DISTINCT_LOTTERY_PARTICIPANTS_BATCH = TEMPLATES.register(
+    "count_distinct_lottery_participants_batch",
+    """
+    [
+        {
+            "$match": {
+                "type": 2,
+                "item": { "$in": "#ticket_uids#" }
+            }
+        },
+        {
+            "$group": {
+                "_id": { "item": "$item", "player": "$player" }
+            }
+        },
+        {
+            "$group": {
+                "_id": "$_id.item",
+                "count": { "$sum": 1 }
+            }
+        }
+    ]
+    """,
+    {pattern.TICKET_UIDS: list})
+
+COUNT_LOTTERY_PARTICIPANTS = TEMPLATES.register(
+    "count_lottery_participants",
+    """
+    [
+        {
+            "$match": {
+                "type": 2,
+                "item": "#ticket_uid#"
+            }
+        },
+        {
+            "$count": "player"
+        },
+        {
+            "$project": {
+                "count": "$player"
+            }
+        }
+    ]
+    """,
+    {pattern.TICKET: str})
+
+# the ticket purchases by ticket like COUNT_LOTTERY_PARTICIPANTS, i.e. {"_id": <ticket UID>, "count": <tickets>}
+COUNT_LOTTERY_PARTICIPANTS_BATCH = TEMPLATES.register(
+    "count_lottery_participants_batch",
+    """
+    [
+        {
+            "$match": {
+                "type": 2,
+                "item": { "$in": "#ticket_uids#" }
+            }
+        },
+        {
+            "$group": {
+                "_id": "$item",
+                "count": { "$sum": 1 }
+            }
+        }
+    ]
+    """,
+    {pattern.TICKET_UIDS: list})
+
+# the ticket purchases since the watermark "#since#" (ISO date) with the address of the player, for the incremental sync
+LOTTERY_PARTICIPANTS_SINCE = TEMPLATES.register(
+    "lottery_participants_since",
+    """
+    [
+        {
+            "$match": {
+            "type": 2,
+            "item": "#ticket_uid#",
+            "time": { "$gte": { "$date": "#since#" } }
+            }
+        },
+        {
+            "$sort": { "_id": 1 }
+        },
+        {
+            "$project": {
+            "player": 1,
+            "time": 1,
+            "ticketUID": "$item",
+            "firstname": "$extra.firstName",
+            "lastName": "$extra.lastName",
+            "phone": "$extra.phone",
+            "dateOfBirth": "$extra.dateOfBirth",
+            "street": "$extra.street",
+            "city": "$extra.city",
+            "zip": "$extra.zip",
+            "tos_accepted": "$extra.tos_accepted",
+            "privacy_accepted": "$extra.privacy_accepted"
+            }
+        }
+    ]
+    """,
+    {pattern.TICKET: str, pattern.SINCE: str})
+
+# the winners without address, joined locally with PLAYERS_ADDRESS
+LOTTERY_WINNERS = TEMPLATES.register(
+    "lottery_winners",
+    """
+    [
+        {
+            "$match": {
+            "type": 5,
+            "item": "#lottery_uid#"
+            }
+        },
+        {
+            "$sort": { "_id": 1 }
+        },
+        {
+            "$project": {
+            "player": 1,
+            "total": 1,
+            "lotteryUID": "$item",
+            "time": 1,
+            "ticketUID": "$extra.ticket"
+            }
+        }
+    ]
+    """,
+    {pattern.LOTTERY: str})
+
+# "#address_group_id#" and "#projection#" are bound to the selected columns, see `address_group_id()`
+# and `winners_with_address_projection()` of common.helper.projection_helper
+LOTTERY_WINNERS_WITH_ADDRESS = TEMPLATES.register(
+    "lottery_winners_with_address",
+    """
+    [
+        {
+            "$match": {
+            "type": 5,
+            "item": "#lottery_uid#"
+            }
+        },
+        {
+            "$sort": { "_id": 1 }
+        },
+        {
+            "$lookup": {
+            "from": "achievement",
+            "let": {
+                "playerUID": "$player"
+            },
+            "pipeline": [
+                {
+                "$match": {
+                    "$expr": {
+                    "$and": [
+                        { "$eq": ["$type", 2] },
+                        { "$eq": ["$item", "#ticket_uid#"] },
+                        { "$eq": ["$player", "$$playerUID"] }
+                    ]
+                    }
+                }
+                },
+                {
+                "$group": {
+                    "_id": "#address_group_id#"
+                }
+                }
+            ],
+            "as": "joinedData"
+            }
+        },
+        {
+            "$project": "#projection#"
+        }
+    ]
+    """,
+    {pattern.LOTTERY: str, pattern.TICKET: str, pattern.ADDRESS_GROUP_ID: dict, pattern.PROJECTION: dict})
+
+# "#lottery_uids#" and "#ticket_uids#" are bound to lists of the same length,
+# the ticket of a lottery is looked up by the position of the lottery
+LOTTERY_WINNERS_WITH_ADDRESS_BATCH = TEMPLATES.register(
+    "lottery_winners_with_address_batch",
+    """
+    [
+        {
+            "$match": {
+            "type": 5,
+            "item": { "$in": "#lottery_uids#" }
+            }
+        },
+        {
+            "$sort": { "_id": 1 }
+        },
+        {
+            "$lookup": {
+            "from": "achievement",
+            "let": {
+                "playerUID": "$player",
+                "ticketUID": {
+                    "$arrayElemAt": [
+                        "#ticket_uids#",
+                        { "$indexOfArray": ["#lottery_uids#", "$item"] }
+                    ]
+                }
+            },
+            "pipeline": [
+                {
+                "$match": {
+                    "$expr": {
+                    "$and": [
+                        { "$eq": ["$type", 2] },
+                        { "$eq": ["$item", "$$ticketUID"] },
+                        { "$eq": ["$player", "$$playerUID"] }
+                    ]
+                    }
+                }
+                },
+                {
+                "$group": {
+                    "_id": "#address_group_id#"
+                }
+                }
+            ],
+            "as": "joinedData"
+            }
+        },
+        {
+            "$project": "#projection#"
+        }
+    ]
+    """,
+    {pattern.LOTTERY_UIDS: list, pattern.TICKET_UIDS: list, pattern.ADDRESS_GROUP_ID: dict, pattern.PROJECTION: dict})
+
+# LOTTERY_WINNERS_WITH_ADDRESS of the winners since the watermark "#since#" (ISO date), for the incremental sync
+LOTTERY_WINNERS_WITH_ADDRESS_SINCE = TEMPLATES.register(
+    "lottery_winners_with_address_since",
+    """
+    [
+        {
+            "$match": {
+            "type": 5,
+            "item": "#lottery_uid#",
+            "time": { "$gte": { "$date": "#since#" } }
+            }
+        },
+        {
+            "$sort": { "_id": 1 }
+        },
+        {
+            "$lookup": {
+            "from": "achievement",
+            "let": {
+                "playerUID": "$player"
+            },
+            "pipeline": [
+                {
+                "$match": {
+                    "$expr": {
+                    "$and": [
+                        { "$eq": ["$type", 2] },
+                        { "$eq": ["$item", "#ticket_uid#"] },
+                        { "$eq": ["$player", "$$playerUID"] }
+                    ]
+                    }
+                }
+                },
+                {
+                "$group": {
+                    "_id": "#address_group_id#"
+                }
+                }
+            ],
+            "as": "joinedData"
+            }
+        },
+        {
+            "$project": "#projection#"
+        }
+    ]
+    """,
+    {pattern.LOTTERY: str, pattern.TICKET: str, pattern.SINCE: str, pattern.ADDRESS_GROUP_ID: dict, pattern.PROJECTION: dict})
+
+# the address of the given players taken from their lottery ticket purchases,
+# "#address_group#" is bound to the selected columns, see `players_address_group()`
+PLAYERS_ADDRESS = TEMPLATES.register(
+    "players_address",
+    """
+    [
+        {
+            "$match": {
+            "type": 2,
+            "item": "#ticket_uid#",
+            "player": { "$in": "#player_uids#" }
+            }
+        },
+        {
+            "$group": "#address_group#"
+        }
+    ]
+    """,
+    {pattern.TICKET: str, pattern.PLAYER_UIDS: list, pattern.ADDRESS_GROUP: dict})
@@ -13,9 +13,15 @@
 ##* 2023-08-09          bettlerd    added imports
 ##* 2023-08-14          bettlerd    added WeekdayEnum, FrequencyEnum
 ##* 2023-08-14          bettlerd    added MonthEnum
+##* 2026-10-18          bettlerd    added ExportFormatEnum
+##* 2026-10-18          bettlerd    added CircuitStateEnum
+##* 2026-10-18          bettlerd    added ExecutorKindEnum
 ##* 
 ##*
 ##*
 
+from common.enums.common.circuit_state import CircuitStateEnum
 from common.enums.common.encoding import EncodingEnum
+from common.enums.common.executor_kind import ExecutorKindEnum
+from common.enums.common.export_format import ExportFormatEnum
 from common.enums.common.http_methods import HTTPmethodsEnum
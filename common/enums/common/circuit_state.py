@@ -0,0 +1,30 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Defining the states of a circuit breaker"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##*
+##*
+
+from enum import unique
+
+from common.extensions.enum_extension import ExtendedEnum
+
+@unique
+class CircuitStateEnum(ExtendedEnum):
+    """
+    Defining the states of a circuit breaker
+        - CLOSED: the requests are sent
+        - OPEN: the requests fail fast without being sent
+        - HALF_OPEN: a probe request is sent to find out whether the host has recovered
+    """
+    CLOSED    = "closed"
+    OPEN      = "open"
+    HALF_OPEN = "half_open"
@@ -0,0 +1,28 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Defining the pools which run the lotteries of a batch"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##*
+##*
+
+from enum import unique
+
+from common.extensions.enum_extension import ExtendedEnum
+
+@unique
+class ExecutorKindEnum(ExtendedEnum):
+    """
+    Defining the pools which run the lotteries of a batch
+        - PROCESS: one FunifierAPI per worker process, the parsing runs in parallel
+        - THREAD: one FunifierAPI shared by the worker threads, the downloads overlap
+    """
+    PROCESS = "process"
+    THREAD  = "thread"
@@ -0,0 +1,27 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Defining the export formats of the results"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##*
+##*
+
+from enum import unique
+
+from common.extensions.enum_extension import ExtendedEnum
+
+@unique
+class ExportFormatEnum(ExtendedEnum):
+    """
+    Defining the export formats of the results, the value is the file extension
+    """
+    CSV     = "csv"
+    JSONL   = "jsonl"
+    PARQUET = "parquet"
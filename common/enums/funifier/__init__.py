@@ -0,0 +1,23 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Containing the Funifier enums"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##* 2026-10-18          bettlerd    added ParticipantCountEnum
+##* 2026-10-18          bettlerd    added SyncKindEnum
+##* 2026-10-18          bettlerd    added AchievementTypeEnum
+##*
+##*
+##*
+
+from common.enums.funifier.achievement_type import AchievementTypeEnum
+from common.enums.funifier.join_plan import JoinPlanEnum
+from common.enums.funifier.participant_count import ParticipantCountEnum
+from common.enums.funifier.sync_kind import SyncKindEnum
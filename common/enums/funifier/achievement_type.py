@@ -0,0 +1,32 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Defining the types of the achievements of the lotteries"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##*
+##*
+
+from enum import unique
+
+from common.extensions.enum_extension import ExtendedEnum
+
+@unique
+class AchievementTypeEnum(ExtendedEnum):
+    """
+    Defining the types of the achievements of the lotteries, the field «type» of the collection "achievement"
+    """
+    TICKET_PURCHASE = 2
+    """
+    A player bought a lottery ticket, the field «item» is the ticket UID.
+    """
+    LOTTERY_WIN = 5
+    """
+    A player won a lottery, the field «item» is the lottery UID.
+    """
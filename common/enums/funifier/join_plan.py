@@ -0,0 +1,33 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Defining where the winners are joined with their address"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##*
+##*
+
+from enum import unique
+
+from common.extensions.enum_extension import ExtendedEnum
+
+@unique
+class JoinPlanEnum(ExtendedEnum):
+    """
+    Defining where the winners are joined with their address
+    """
+    SERVER = "server"
+    """
+    Funifier joins every winner with a correlated `$lookup` sub-pipeline.
+    """
+    CLIENT = "client"
+    """
+    The winners and the addresses of just those players are fetched in two
+    aggregations and joined locally with a hash join.
+    """
@@ -0,0 +1,32 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Defining what is counted as participant of a lottery"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##*
+##*
+
+from enum import unique
+
+from common.extensions.enum_extension import ExtendedEnum
+
+@unique
+class ParticipantCountEnum(ExtendedEnum):
+    """
+    Defining what is counted as participant of a lottery
+    """
+    TICKETS = "tickets"
+    """
+    Every lottery ticket purchase, a player with three tickets counts three times.
+    """
+    PLAYERS = "players"
+    """
+    Every player with at least one lottery ticket counts once.
+    """
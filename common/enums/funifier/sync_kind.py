@@ -0,0 +1,32 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""Defining the result sets of the incremental sync"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##*
+##*
+
+from enum import unique
+
+from common.extensions.enum_extension import ExtendedEnum
+
+@unique
+class SyncKindEnum(ExtendedEnum):
+    """
+    Defining the result sets of the incremental sync
+    """
+    WINNERS = "winners"
+    """
+    The lottery winners with their address of a lottery.
+    """
+    PARTICIPANTS = "participants"
+    """
+    The players with a ticket of a lottery ticket, with their address.
+    """
@@ -13,11 +13,36 @@ Funifier Exceptions
 ##* Date                User        Description
 ##* ------------------------------------------------------------------------
 ##* 2023-04-11          bettlerd    created script
+##* 2026-10-18          bettlerd    added FunifierTimeoutError, FunifierServerError
+##*                                 and FunifierCircuitOpenError
 ##*
 ##*
 
+from typing import Optional
+
 class FunifierAPIError(Exception):
     """
     Funifier API triggered exceptions
     """
-    pass
\ No newline at end of file
+    pass
+
+class FunifierTimeoutError(FunifierAPIError):
+    """
+    The Funifier API did not answer within the connect/read timeout or the deadline of the call
+    """
+    pass
+
+class FunifierServerError(FunifierAPIError):
+    """
+    The Funifier API answered with a status which is worth a retry (429 or 5xx)
+    """
+    def __init__(self, message:str, status:int, retry_after:Optional[float]=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+class FunifierCircuitOpenError(FunifierAPIError):
+    """
+    The circuit breaker of the host is open, the request has not been sent
+    """
+    pass
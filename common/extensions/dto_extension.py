@@ -6,7 +6,9 @@
 ##*
 """DTO extension which adds method(s)
          - to_dict()
+         - to_json()
          - get_object_by_name()
+         - list_to_dicts(), list_to_json()
 """
 ##*
 ##* Modifications:
@@ -14,42 +16,105 @@
 ##* ------------------------------------------------------------------------
 ##* 2023-05-23          bettlerd    created script
 ##* 2023-08-08          bettlerd    added get_object_by_name()
+##* 2026-10-18          bettlerd    empty __slots__, so that the DTOs can use slots; to_dict() reads the fields
+##* 2026-10-18          bettlerd    to_dict() skips the private fields
+##* 2026-10-18          bettlerd    to_dict() and the new to_json() use a serializer compiled per class,
+##*                                 lists of scalars are supported, added list_to_dicts() and list_to_json()
 ##*
 ##*
 
-from typing import Optional, List, TypeVar
+import json
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, Iterable, Optional, List, TextIO, TypeVar, get_args, get_origin, get_type_hints
 from enum import Enum
 
+from common.helper.typing_helper import unwrap_optional
+
 T = TypeVar("T")
 
+SCALAR_TYPES = (str, int, float, bool)
+# the string a str field gets from a null value, see get_optional_value()
+NONE_STRING = "None"
+
 class ExtendedDTO():
     """
     Extends the DTO with some methods.
+
+    It has no instance attributes of its own, a DTO declared with `@dataclass(slots=True)`
+    therefore has no `__dict__`.
     """
 
+    __slots__ = ()
+
     def to_dict(self):
         """
-        Converts the DTO object to a dictionary.
+        Converts the DTO object to a dictionary. Private fields, i.e. with a leading underscore, are skipped,
+        so are the fields which are None or «None».
 
         Returns:
             dict: A dictionary representation of the object.
+
+        Examples:
+            >>> from dataclasses import dataclass
+            >>> @dataclass
+            ... class Person(ExtendedDTO):
+            ...     name: Optional[str] = None
+            ...     tags: Optional[List[str]] = None
+            >>> Person("Anna", ["a", "b"]).to_dict(), Person("None").to_dict()
+            ({'name': 'Anna', 'tags': ['a', 'b']}, {})
+        """
+        return get_dto_encoder(type(self))(self)
+
+    def to_json(self, buffer:Optional[TextIO]=None) -> Optional[str]:
+        """
+        Converts the DTO object to compact JSON without creating the dictionary of `to_dict()`.
+
+        Args:
+            buffer (TextIO, optional): The JSON is written to the buffer instead of returned.
+
+        Returns:
+            Optional[str]: The same as `json.dumps(self.to_dict(), separators=(",", ":"))`, None if
+            written to the buffer.
         """
-        result = {}
-        
-        for key, value in self.__dict__.items():
-            value = self.__transform_value(value)
-
-            if value is not None:
-                if isinstance(value, list):
-                    result[key] = [item.to_dict() for item in value]
-                elif isinstance(value, Enum):
-                    result[key] = value.value
-                elif isinstance(value, ExtendedDTO):
-                    result[key] = value.to_dict()
-                else:
-                    result[key] = value
-        
-        return result
+        text = get_dto_json_encoder(type(self))(self)
+        if buffer is None:
+            return text
+        buffer.write(text)
+        return None
+
+    @staticmethod
+    def list_to_dicts(dtos:Iterable['ExtendedDTO']) -> List[Dict[str, Any]]:
+        """
+        Converts a list of DTO objects to a list of dictionaries.
+        """
+        return [encode_value(dto) for dto in dtos]
+
+    @staticmethod
+    def list_to_json(dtos:Iterable['ExtendedDTO'], buffer:Optional[TextIO]=None) -> Optional[str]:
+        """
+        Converts a list of DTO objects to a JSON array. With a buffer each object is written
+        as soon as it is encoded, so neither the dictionaries nor the whole array are held in memory.
+
+        Examples:
+            >>> from dataclasses import dataclass
+            >>> @dataclass
+            ... class Point(ExtendedDTO):
+            ...     x: Optional[int] = None
+            >>> ExtendedDTO.list_to_json([Point(1), Point()])
+            '[{"x":1},{}]'
+        """
+        if buffer is None:
+            return "[" + ",".join(encode_json_value(dto) for dto in dtos) + "]"
+
+        separator = "["
+        for dto in dtos:
+            buffer.write(separator)
+            buffer.write(encode_json_value(dto))
+            separator = ","
+        buffer.write("[]" if separator == "[" else "]")
+        return None
     
     @staticmethod
     def get_object_by_name(objects: List[T], name_attr: str, name: str) -> Optional[T]:
@@ -70,9 +135,121 @@ class ExtendedDTO():
                     return obj
         return None
 
-    #region helper methods
-    def __transform_value(self, x):
-        if x == "None":
-            return None
-        return x
-    #endregion
\ No newline at end of file
+
+#region serializers
+def encode_value(value:Any) -> Any:
+    """
+    Returns the value as it is stored by `to_dict()`: DTOs as dictionaries, enums as their
+    value and lists element by element.
+    """
+    if isinstance(value, ExtendedDTO):
+        return get_dto_encoder(type(value))(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    return value
+
+def encode_json_value(value:Any) -> str:
+    """
+    Returns the value as compact JSON, like `json.dumps(encode_value(value), separators=(",", ":"))`.
+
+    Examples:
+        >>> encode_json_value(["a", 1, 2.5, True, None])
+        '["a",1,2.5,true,null]'
+    """
+    value_type = type(value)
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value_type is bool:
+        return "true" if value else "false"
+    if value_type is int:
+        return int.__repr__(value)
+    if isinstance(value, ExtendedDTO):
+        return get_dto_json_encoder(value_type)(value)
+    if isinstance(value, Enum):
+        return encode_json_value(value.value)
+    if isinstance(value, list):
+        return "[" + ",".join([encode_json_value(item) for item in value]) + "]"
+    return json.dumps(encode_value(value), separators=(",", ":"))
+
+@lru_cache(maxsize=None)
+def get_dto_encoder(dto_class:type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Returns the function which converts a DTO to a dictionary, generated once per class.
+
+    The fields are read by name instead of through `__dict__`. Scalars and lists of scalars
+    are copied as they are, the other values go through `encode_value()`.
+    """
+    if not is_dataclass(dto_class):
+        return __encode_attributes
+
+    lines = [f"def encode_{dto_class.__name__}(obj):", "    result = {}"]
+    for name, value_type in __public_fields(dto_class):
+        lines.append(f"    value = obj.{name}")
+        lines.append(f"    if {__present_condition(value_type)}:")
+        if value_type in SCALAR_TYPES:
+            lines.append(f"        result[{name!r}] = value")
+        elif get_origin(value_type) is list and get_args(value_type)[0] in SCALAR_TYPES:
+            lines.append(f"        result[{name!r}] = list(value)")
+        else:
+            lines.append(f"        result[{name!r}] = encode_value(value)")
+    lines.append("    return result")
+    return __compile(dto_class, lines, f"encode_{dto_class.__name__}")
+
+@lru_cache(maxsize=None)
+def get_dto_json_encoder(dto_class:type) -> Callable[[Any], str]:
+    """
+    Returns the function which converts a DTO to compact JSON, generated once per class.
+    """
+    if not is_dataclass(dto_class):
+        return lambda obj: json.dumps(__encode_attributes(obj), separators=(",", ":"))
+
+    lines = [f"def encode_json_{dto_class.__name__}(obj):", "    parts = []"]
+    for name, value_type in __public_fields(dto_class):
+        key = json.dumps(name) + ":"
+        lines.append(f"    value = obj.{name}")
+        lines.append(f"    if {__present_condition(value_type)}:")
+        if value_type is str:
+            lines.append(f"        parts.append({key!r} + (encode_string(value) if type(value) is str else encode_json_value(value)))")
+        else:
+            lines.append(f"        parts.append({key!r} + encode_json_value(value))")
+    lines.append('    return "{" + ",".join(parts) + "}"')
+    return __compile(dto_class, lines, f"encode_json_{dto_class.__name__}")
+
+def __public_fields(dto_class:type) -> List[tuple]:
+    try:
+        type_hints = get_type_hints(dto_class)
+    except (NameError, TypeError):
+        # unresolvable annotations, all the fields are encoded generically
+        type_hints = {}
+    return [(dto_field.name, unwrap_optional(type_hints.get(dto_field.name, Any)))
+            for dto_field in fields(dto_class)
+            if not dto_field.name.startswith("_")]
+
+def __present_condition(value_type:Any) -> str:
+    """
+    Returns the condition under which a field is serialized, None and «None» are left out.
+    """
+    if value_type in (int, float, bool):
+        return "value is not None"
+    return f"value is not None and value != {NONE_STRING!r}"
+
+def __compile(dto_class:type, lines:List[str], function_name:str) -> Callable[[Any], Any]:
+    namespace = {
+        "encode_value": encode_value,
+        "encode_json_value": encode_json_value,
+        "encode_string": encode_basestring_ascii,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace[function_name]
+
+def __encode_attributes(obj:Any) -> Dict[str, Any]:
+    """
+    Converts a DTO which is no dataclass by its attributes.
+    """
+    return {key: encode_value(value) for key, value in vars(obj).items()
+            if not key.startswith("_") and value is not None and value != NONE_STRING}
+#endregion
@@ -22,38 +22,51 @@
 ##* 2023-10-02          bettlerd    added check if value DEFAULT exists in 
 ##*                                 detects_if_enum_in_x() method
 ##* 2023-10-02          bettlerd    added where() method
+##* 2026-10-18          bettlerd    cached name and value indexes and immutable views,
+##*                                 detects_if_enum_in_x() searches all values in one
+##*                                 pass, added from_value() and detects_if_enum_in_series()
 ##*
 ##*
 
 from enum import Enum
-from typing import List, Any, Callable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Any, Callable, Mapping, Tuple
+
+from common.helper.pattern_helper import MultiPatternMatcher, NO_MATCH
 
 class ExtendedEnum(Enum):
     """
     Adds some extensions to the enums
 
     source: https://stackoverflow.com/a/54919285/11026899
+
+    The views and indexes are built once per enum class and cached.
     """
 
     @classmethod
-    def list(cls):
-        """Returns a list"""
-        return list(map(lambda c: c.value, cls))
+    @lru_cache(maxsize=None)
+    def list(cls) -> Tuple[Any, ...]:
+        """Returns the values of the members, as immutable tuple."""
+        return tuple(member.value for member in cls)
 
     @classmethod
-    def to_dict(cls):
-        """Returns a dictionary representation of the enum."""
-        return {e.name: e.value for e in cls}
+    @lru_cache(maxsize=None)
+    def to_dict(cls) -> Mapping[str, Any]:
+        """Returns a read-only dictionary representation of the enum."""
+        return MappingProxyType({e.name: e.value for e in cls})
     
     @classmethod
-    def keys(cls):
-        """Returns a list of all the enum keys."""
-        return cls._member_names_
+    @lru_cache(maxsize=None)
+    def keys(cls) -> Tuple[str, ...]:
+        """Returns all the enum keys."""
+        return tuple(cls._member_names_)
     
     @classmethod
-    def values(cls):
-        """Returns a list of all the enum values."""
-        return list(cls._value2member_map_.keys())
+    @lru_cache(maxsize=None)
+    def values(cls) -> Tuple[Any, ...]:
+        """Returns all the enum values."""
+        return tuple(cls._value2member_map_.keys())
 
     @classmethod
     def print(cls) -> None:
@@ -73,15 +86,34 @@ class ExtendedEnum(Enum):
         Raises:
             ValueError: If no matching enum value is found.
         """
-        for member in cls:
-            if member.name == string_value:
-                return member
-        raise ValueError(f"No matching enum value for {string_value}")
+        try:
+            member = cls.__members_by_name().get(string_value)
+        except TypeError:
+            member = None
+        if member is None:
+            raise ValueError(f"No matching enum value for {string_value}")
+        return member
+
+    @classmethod
+    def from_value(cls, value:Any):
+        """Returns the enum member with the given value.
+
+        Raises:
+            ValueError: If no member has the value.
+        """
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"No matching enum value for {value}") from None
     
     @classmethod
     def detects_if_enum_in_x(cls, x:str, method:Callable=None) -> 'ExtendedEnum':
         """
-        Determines if an enum value is present in a string.
+        Determines if an enum value is present in a string. If several are, the
+        first member in the order of the enum wins.
+
+        The string is read once by an automaton over all the values (Aho-Corasick),
+        so the time does not grow with the number of members.
 
         Args:
             x (str): The string to search for the enum value.
@@ -93,16 +125,62 @@ class ExtendedEnum(Enum):
 
         Raises:
             ValueError: If no matching enum value is found.
+
+        Examples:
+            >>> class Channel(ExtendedEnum):
+            ...     RADIO = "radio"
+            ...     TV = "tv"
+            ...     DEFAULT = None
+            >>> Channel.detects_if_enum_in_x("Radio Pilatus", str.lower), Channel.detects_if_enum_in_x("web")
+            (<Channel.RADIO: 'radio'>, <Channel.DEFAULT: None>)
         """
         if method is not None:
             x = method(x)
-        for member in cls:
-            if member.value is not None and member.value in x:
-                return member
+        members, matcher = cls.__value_matcher()
+        index = matcher.first_match(x)
+        if index != NO_MATCH:
+            return members[index]
         if hasattr(cls, 'DEFAULT'):
             return cls.DEFAULT    
         raise ValueError(f"Enum could not be found in the string «{x}».")
 
+    @classmethod
+    def detects_if_enum_in_series(cls, series:Any, method:Callable=None) -> Any:
+        """
+        Applies `detects_if_enum_in_x()` to a pandas Series of strings. Every distinct
+        string is only searched once, missing values stay missing.
+
+        Args:
+            series (pd.Series): The strings to search for the enum values.
+            method (callable): An optional method to apply to the strings before
+            searching for the enum values.
+
+        Returns:
+            pd.Series: The enum members, with the index of the series.
+
+        Raises:
+            ValueError: If no matching enum value is found in a string.
+        """
+        present = series[series.notna()]
+        detected = {x: cls.detects_if_enum_in_x(x, method) for x in present.unique()}
+        return series.map(detected)
+
+    #region helper methods
+    @classmethod
+    @lru_cache(maxsize=None)
+    def __members_by_name(cls) -> Mapping[str, 'ExtendedEnum']:
+        return MappingProxyType({member.name: member for member in cls})
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def __value_matcher(cls) -> Tuple[Tuple['ExtendedEnum', ...], MultiPatternMatcher]:
+        """
+        Returns the members with a string value and the automaton over their values in the same order.
+        """
+        members = tuple(member for member in cls if isinstance(member.value, str))
+        return members, MultiPatternMatcher([member.value for member in members])
+    #endregion
+
     def __str__(self):
         """method is called when you use an enum object as a string, 
         allowing you to define the string representation of the enum."""
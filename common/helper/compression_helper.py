@@ -0,0 +1,135 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper classes which decompress HTTP response bodies while they are read"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##* 2026-10-18      bettlerd    DecompressingReader decodes all the members of a gzip body
+##*
+##*
+
+import zlib
+from typing import BinaryIO, Optional
+
+from common.helper.json_stream_helper import DEFAULT_CHUNK_SIZE
+
+# the value of the Accept-Encoding header, the content codings which can be decoded
+ACCEPT_ENCODING = "gzip, deflate"
+IDENTITY_ENCODINGS = ("", "identity")
+
+
+def normalize_encoding(content_encoding:Optional[str])->str:
+    """
+    Returns the content coding of a `Content-Encoding` header in lower case, "" if there is none.
+
+    Examples:
+        >>> normalize_encoding(" GZIP "), normalize_encoding(None)
+        ('gzip', '')
+    """
+    return (content_encoding or "").strip().lower()
+
+def is_compressed(content_encoding:Optional[str])->bool:
+    return normalize_encoding(content_encoding) not in IDENTITY_ENCODINGS
+
+
+class DecompressingReader():
+    """
+    Wraps a gzip or deflate compressed binary stream and returns the decompressed bytes.
+
+    Only one compressed chunk and its decompressed output are held in memory.
+    Reading to the end reads the wrapped stream to the end as well. A gzip
+    body of several members, e.g. written by a streaming server, is decoded
+    member by member. For «deflate» both the zlib format of RFC 1950 and the
+    raw deflate format, which some servers send instead, are accepted.
+
+    Examples:
+        >>> import gzip
+        >>> from io import BytesIO
+        >>> reader = DecompressingReader(BytesIO(gzip.compress(b'[1, 2, 3]')), "gzip", chunk_size=4)
+        >>> reader.read(2), reader.read()
+        (b'[1', b', 2, 3]')
+
+        >>> members = gzip.compress(b'[1, ') + gzip.compress(b'2, 3]')
+        >>> DecompressingReader(BytesIO(members), "gzip", chunk_size=5).read()
+        b'[1, 2, 3]'
+
+        >>> compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        >>> raw = compressor.compress(b'{"a": 1}') + compressor.flush()
+        >>> DecompressingReader(BytesIO(raw), "deflate").read()
+        b'{"a": 1}'
+    """
+
+    def __init__(self, stream:BinaryIO, content_encoding:str, chunk_size:int=DEFAULT_CHUNK_SIZE):
+        encoding = normalize_encoding(content_encoding)
+        if encoding == "gzip" or encoding == "x-gzip":
+            wbits = 16 + zlib.MAX_WBITS
+        elif encoding == "deflate":
+            wbits = zlib.MAX_WBITS
+        else:
+            raise ValueError(f"The content encoding «{content_encoding}» is not supported")
+
+        self.__stream = stream
+        self.__encoding = encoding
+        self.__wbits = wbits
+        self.__chunk_size = chunk_size
+        self.__decompressor = zlib.decompressobj(wbits=wbits)
+        self.__started = False
+        self.__buffer = b""
+        self.__eof = False
+
+    def read(self, size:int=-1)->bytes:
+        if size is None or size < 0:
+            parts = [self.__buffer]
+            self.__buffer = b""
+            while not self.__eof:
+                parts.append(self.__decompress_next())
+            return b"".join(parts)
+
+        while len(self.__buffer) < size and not self.__eof:
+            self.__buffer += self.__decompress_next()
+        data, self.__buffer = self.__buffer[:size], self.__buffer[size:]
+        return data
+
+    #region helper methods
+    def __decompress_next(self)->bytes:
+        chunk = self.__stream.read(self.__chunk_size)
+        if not chunk:
+            self.__eof = True
+            return self.__decompressor.flush()
+
+        if self.__started:
+            return self.__decompress(chunk)
+
+        self.__started = True
+        try:
+            return self.__decompress(chunk)
+        except zlib.error:
+            if self.__encoding != "deflate":
+                raise
+            # raw deflate without the zlib header
+            self.__decompressor = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+            return self.__decompress(chunk)
+
+    def __decompress(self, data:bytes)->bytes:
+        """
+        Decompresses the data, a gzip member which has ended is followed by a new decompressor
+        for the next member in its `unused_data`.
+        """
+        parts = []
+        while data:
+            if self.__decompressor.eof:
+                # the data after a zlib or deflate stream and the zero padding after the last gzip member are ignored
+                data = data.lstrip(b"\0")
+                if self.__encoding == "deflate" or not data:
+                    break
+                self.__decompressor = zlib.decompressobj(wbits=self.__wbits)
+            parts.append(self.__decompressor.decompress(data))
+            data = self.__decompressor.unused_data if self.__decompressor.eof else b""
+        return b"".join(parts)
+    #endregion
@@ -0,0 +1,88 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper methods which convert config strings to typed values"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##*
+##*
+
+import threading
+from datetime import date, datetime
+from typing import Any, Callable, Dict
+from uuid import UUID
+
+TRUE_STRINGS = frozenset(["true", "1", "yes", "y", "on"])
+FALSE_STRINGS = frozenset(["false", "0", "no", "n", "off"])
+
+
+def parse_bool(value:str)->bool:
+    """
+    Converts a string like «true», «False», «1» or «no» to a bool.
+
+    Raises:
+        ValueError: If the string is no boolean.
+
+    Examples:
+        >>> parse_bool("False"), parse_bool(" YES ")
+        (False, True)
+    """
+    normalized = str(value).strip().lower()
+    if normalized in TRUE_STRINGS:
+        return True
+    if normalized in FALSE_STRINGS:
+        return False
+    raise ValueError(f"«{value}» is no boolean")
+
+
+__converters:Dict[str, Callable[[str], Any]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": parse_bool,
+    "date": date.fromisoformat,
+    "datetime": datetime.fromisoformat,
+    "uuid": UUID,
+}
+__converters_lock = threading.Lock()
+
+def register_converter(type_name:str, converter:Callable[[str], Any])->None:
+    """
+    Registers the function which converts a string to the type `type_name`, the name is case-insensitive.
+
+    Examples:
+        >>> from decimal import Decimal
+        >>> register_converter("Decimal", Decimal)
+        >>> convert("1.10", "decimal")
+        Decimal('1.10')
+    """
+    with __converters_lock:
+        __converters[type_name.strip().lower()] = converter
+
+def get_converter(type_name:str)->Callable[[str], Any]:
+    """
+    Returns the function which converts a string to the type `type_name`.
+
+    Raises:
+        TypeError: If no converter is registered for the type.
+    """
+    converter = __converters.get(str(type_name).strip().lower())
+    if converter is None:
+        raise TypeError(f"No converter is registered for the type «{type_name}»")
+    return converter
+
+def convert(value:str, type_name:str)->Any:
+    """
+    Converts the string to the type `type_name`.
+
+    Examples:
+        >>> convert("42", "int"), convert("2026-10-18", "date")
+        (42, datetime.date(2026, 10, 18))
+    """
+    return get_converter(type_name)(value)
@@ -16,21 +16,45 @@ source: https://docs.airship.com/api/ua/
 ##* 2023-05-26          bettlerd    added get_optional_value
 ##* 2023-05-31          bettlerd    simplified get_optional_value
 ##* 2023-05-31          bettlerd    added List support in create_dto_object()
+##* 2026-10-18          bettlerd    added get_value_decoder(), get_dto_decoder() and json_field(), the types
+##*                                 are inspected once per class instead of once per value
+##* 2026-10-18          bettlerd    create_dto_object() resolves the class with get_dto_class() instead of exec,
+##*                                 added create_dto_objects()
 ##*
 ##*
 
+import importlib
+import inspect
 import json
-from typing import Any,Dict,Tuple,TypeVar, get_origin, get_args
+import threading
+from dataclasses import field, fields
+from functools import lru_cache
+from typing import Any,Callable,Dict,Iterable,List,Optional,Tuple,TypeVar, get_origin, get_args, get_type_hints
 
 from common.extensions.dto_extension import ExtendedDTO
 from common.extensions.enum_extension import ExtendedEnum
 from common.helper.regex_helper import find_pattern
+from common.helper.typing_helper import unwrap_optional
 from domain_objects.dto.big_query.config_variables.config_var_dto import ConfigVarDTO
 
 T = TypeVar('T')
 
 PATTERN_LIST = r"List\[[^\]]*\]"
 
+# modules whose DTOs are registered with the first lookup of get_dto_class()
+KNOWN_DTO_MODULES = (
+    "domain_objects.dto.common.api_config_dto",
+    "domain_objects.dto.big_query.config_variables.config_var_dto",
+    "domain_objects.dto.funifier.api_response_dto",
+)
+
+__dto_classes:Dict[Tuple[str, str], type] = {}
+__dto_modules:set = set()
+__dto_classes_lock = threading.Lock()
+
+# key of the field metadata with the name of the field in the JSON document
+JSON_KEY = "json_key"
+
 #region create_dto_object
 def create_dto_object(config_dto:ConfigVarDTO):
     """
@@ -43,10 +67,7 @@ def create_dto_object(config_dto:ConfigVarDTO):
         - object: The DTO object created from the ConfigVarDTO object
     """
     is_list, class_name = __extract_dto_name(config_dto)
-    import_string = __generate_import_string(config_dto.dto_path, class_name)
-    
-    exec(import_string)
-    config_var_dto = locals()[class_name]
+    config_var_dto = get_dto_class(config_dto.dto_path, class_name)
 
     if is_list:
         dto_object = [config_var_dto.from_dict(item) for item in json.loads(config_dto.value.replace("'","\""))]
@@ -60,22 +81,70 @@ def __extract_dto_name(config_dto:ConfigVarDTO) -> Tuple[bool, str]:
 
     return dto_is_list, dto_name
 
-def __generate_import_string(dto_path:str,
-                             dto_name:str
-                             ):
+def create_dto_objects(config_dtos:Iterable[ConfigVarDTO]) -> List[Any]:
+    """
+    This function creates the DTO objects of many ConfigVarDTO objects, e.g. all the rows of
+    `chmedia-ent-regional.common.config_variables`. Each class is imported once.
+
+    Parameters:
+        - config_dtos (Iterable[ConfigVarDTO]): The ConfigVarDTO objects to create the DTOs from
+
+    Returns:
+        - List[Any]: The DTO objects in the order of the ConfigVarDTO objects
     """
-    This function generates a string to be used as the argument to the exec() function in __create_dto_object().
-    The string is an import statement that imports the DTO object specified in the ConfigVarDTO object.
+    return [create_dto_object(config_dto) for config_dto in config_dtos]
+#endregion
+
+#region get_dto_class
+def get_dto_class(dto_path:str, dto_name:str) -> type:
+    """
+    Returns the DTO class `dto_name` of the module `dto_path`.
+
+    The module is imported with importlib on the first lookup and all its classes with a
+    `from_dict()` are registered, the following lookups are a dictionary access. The
+    KNOWN_DTO_MODULES are registered with the first lookup.
 
     Parameters:
-        - dto_path (str): The path of the DTO
+        - dto_path (str): The path of the DTO module, e.g. «domain_objects.dto.common.api_config_dto»
         - dto_name (str): Name of the DTO
 
     Returns:
-        - str: The import statement string
+        - type: The DTO class
+
+    Raises:
+        - ImportError: If the module does not exist or has no DTO of the name
+
+    Examples:
+        >>> get_dto_class("domain_objects.dto.common.api_config_dto", "Header").__name__
+        'Header'
     """
-    
-    return f"from {dto_path} import {dto_name}"
+    dto_class = __dto_classes.get((dto_path, dto_name))
+    if dto_class is not None:
+        return dto_class
+
+    with __dto_classes_lock:
+        for module_path in (*KNOWN_DTO_MODULES, dto_path):
+            if module_path not in __dto_modules:
+                __register_dto_module(module_path)
+
+    dto_class = __dto_classes.get((dto_path, dto_name))
+    if dto_class is None:
+        raise ImportError(f"cannot import name '{dto_name}' from '{dto_path}'")
+    return dto_class
+
+def register_dto_class(dto_class:type, dto_path:Optional[str]=None) -> None:
+    """
+    Registers a DTO class under its module path or the given one.
+    """
+    with __dto_classes_lock:
+        __dto_classes[(dto_path or dto_class.__module__, dto_class.__name__)] = dto_class
+
+def __register_dto_module(dto_path:str) -> None:
+    module = importlib.import_module(dto_path)
+    for name, member in inspect.getmembers(module, inspect.isclass):
+        if hasattr(member, "from_dict"):
+            __dto_classes[(dto_path, name)] = member
+    __dto_modules.add(dto_path)
 #endregion
 
 #region get_optional_value
@@ -107,35 +176,52 @@ def get_optional_value(obj: Dict[str, Any], key: str, value_type: type) -> T:
         'hello'
 
         >>> value3 = get_optional_value({"other_key": True}, "key", bool)
-        >>> value3
-        None
+        >>> value3 is None
+        True
     """
 
     if obj is None or key not in obj:
         return None
 
-    obj_by_key = obj.get(key)
+    return get_value_decoder(value_type)(obj.get(key))
+
+@lru_cache(maxsize=None)
+def get_value_decoder(value_type:type)->Callable[[Any], Any]:
+    """
+    Returns the function which converts a JSON value to the type, it is created once per type.
+
+    Args:
+        value_type (type):
+            str, int, float, bool, an ExtendedEnum, an ExtendedDTO or a List of them.
+
+    Returns:
+        Callable[[Any], Any]:
+            The type itself for the scalars, `from_string` for the enums, `from_dict` for the DTOs.
+
+    Raises:
+        TypeError: If the type is not supported.
+
+    Examples:
+        >>> get_value_decoder(int)("42")
+        42
+
+        >>> get_value_decoder(List[float])(["1.5", 2])
+        [1.5, 2.0]
+    """
     if get_origin(value_type) is list:
     ## list cases:
-        type_args = get_args(value_type)[0]
-        if __check_if___int_str_float_bool(type_args):
-            return [type_args(y) for y in obj_by_key]
-        elif __check_if__enum(type_args):
-            return [type_args.from_string(y) for y in obj_by_key]
-        elif __check_if__dto(type_args):
-            return [type_args.from_dict(y) for y in obj_by_key]
-        else:
-            __raise_type_error()
-    else:
+        decode_item = get_value_decoder(get_args(value_type)[0])
+        return lambda values: [decode_item(value) for value in values]
+
     ## scalar cases:
-        if __check_if___int_str_float_bool(value_type):
-           return value_type(obj_by_key)
-        elif __check_if__enum(value_type):
-            return value_type.from_string(obj_by_key)
-        elif __check_if__dto(value_type):
-            return value_type.from_dict(obj_by_key)
-        else:
-            __raise_type_error()
+    if __check_if___int_str_float_bool(value_type):
+        return value_type
+    elif __check_if__enum(value_type):
+        return value_type.from_string
+    elif __check_if__dto(value_type):
+        return value_type.from_dict
+    else:
+        __raise_type_error()
 
 def __check_if___int_str_float_bool(type_args)->bool:
     if type(type_args) is type and type_args in (str, int, float, bool):
@@ -143,12 +229,12 @@ def __check_if___int_str_float_bool(type_args)->bool:
     return False
 
 def __check_if__enum(type_args)->bool:
-    if issubclass(type_args, ExtendedEnum):
+    if isinstance(type_args, type) and issubclass(type_args, ExtendedEnum):
         return True
     return False
 
 def __check_if__dto(type_args)->bool:
-    if issubclass(type_args, ExtendedDTO):
+    if isinstance(type_args, type) and issubclass(type_args, ExtendedDTO):
         return True
     return False
 
@@ -156,6 +242,64 @@ def __raise_type_error()->None:
     raise TypeError("This type has not yet been implemented!")
 #endregion
 
+#region get_dto_decoder
+def json_field(key:str, default:Any=None)->Any:
+    """
+    Returns a dataclass field which `get_dto_decoder()` reads from the given key of the JSON document.
+    Without it the name of the field is used as key.
+    """
+    return field(default=default, metadata={JSON_KEY: key})
+
+@lru_cache(maxsize=None)
+def get_dto_decoder(dto_class:type)->Callable[[Any], Any]:
+    """
+    Returns a function which creates the DTO from a dictionary, generated once per class.
+
+    The field types are inspected when the decoder is generated, so a call only looks up
+    the keys and calls the decoder of each value. Like `get_optional_value()` a missing key
+    becomes None, a key with the value None is converted anyway (i.e. «None» for a str).
+
+    Args:
+        dto_class (type):
+            A dataclass whose field types are supported by `get_value_decoder()`, optionally
+            wrapped in Optional. The keys are taken from `json_field()`.
+
+    Returns:
+        Callable[[Any], Any]:
+            The decoder, None as dictionary creates the DTO with all fields None.
+
+    Examples:
+        >>> from dataclasses import dataclass
+        >>> @dataclass
+        ... class Point(ExtendedDTO):
+        ...     x: Optional[int] = json_field("X")
+        ...     tags: Optional[List[str]] = None
+        >>> get_dto_decoder(Point)({"X": "3", "tags": ["a"]})
+        Point(x=3, tags=['a'])
+        >>> get_dto_decoder(Point)(None)
+        Point(x=None, tags=None)
+    """
+    type_hints = get_type_hints(dto_class)
+    namespace = {"dto_class": dto_class}
+    arguments = []
+
+    for i, dto_field in enumerate(fields(dto_class)):
+        if not dto_field.init:
+            continue
+        key = dto_field.metadata.get(JSON_KEY, dto_field.name)
+        namespace[f"decode_{i}"] = get_value_decoder(unwrap_optional(type_hints[dto_field.name]))
+        arguments.append(f"        {dto_field.name}=decode_{i}(obj[{key!r}]) if {key!r} in obj else None,\n")
+
+    source = (f"def decode_{dto_class.__name__}(obj):\n"
+              "    if obj is None:\n"
+              "        obj = {}\n"
+              "    return dto_class(\n"
+              f"{''.join(arguments)}"
+              "    )\n")
+    exec(source, namespace)
+    return namespace[f"decode_{dto_class.__name__}"]
+#endregion
+
 if __name__ == "__main__":
     import json
     dto_string = json.loads("""
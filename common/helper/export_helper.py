@@ -0,0 +1,146 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper methods which export a DataFrame chunk by chunk"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##*
+##*
+
+from typing import BinaryIO, Dict, Iterator, List
+
+import pandas as pd
+
+from common.enums.common.encoding import EncodingEnum
+from common.enums.common.export_format import ExportFormatEnum
+
+DEFAULT_CHUNK_ROWS = 10000
+
+# low cardinality columns which are stored dictionary-encoded in Parquet
+DICTIONARY_COLUMNS = ["city", "zip", "lotteryUID", "ticketUID", "tos_accepted", "privacy_accepted"]
+
+MIME_TYPES:Dict[ExportFormatEnum, str] = {
+    ExportFormatEnum.CSV: "text/csv",
+    ExportFormatEnum.JSONL: "application/x-ndjson",
+    ExportFormatEnum.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+def get_mime_type(export_format:ExportFormatEnum)->str:
+    """
+    Returns the MIME type of the export format.
+
+    Examples:
+        >>> get_mime_type(ExportFormatEnum.CSV)
+        'text/csv'
+    """
+    return MIME_TYPES[export_format]
+
+def iter_chunks(data:pd.DataFrame, chunk_rows:int=DEFAULT_CHUNK_ROWS)->Iterator[pd.DataFrame]:
+    """
+    Yields consecutive row slices of at most `chunk_rows` rows.
+
+    Examples:
+        >>> [len(chunk) for chunk in iter_chunks(pd.DataFrame({"a": range(5)}), 2)]
+        [2, 2, 1]
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"The chunk size must be at least 1 but is {chunk_rows}")
+
+    for start in range(0, len(data.index), chunk_rows):
+        yield data.iloc[start:start + chunk_rows]
+
+def iter_export_bytes(
+        data:pd.DataFrame,
+        export_format:ExportFormatEnum,
+        chunk_rows:int=DEFAULT_CHUNK_ROWS
+    )->Iterator[bytes]:
+    """
+    Yields the export of a DataFrame as encoded chunks in CSV or JSON Lines.
+
+    Args:
+        data (pd.DataFrame): The data to export.
+        export_format (ExportFormatEnum): ExportFormatEnum.CSV or ExportFormatEnum.JSONL.
+        chunk_rows (int, optional): The number of rows per chunk. Defaults to DEFAULT_CHUNK_ROWS.
+
+    Yields:
+        bytes: The UTF-8 encoded export of one chunk.
+
+    Raises:
+        ValueError: If the format cannot be exported as independent chunks (Parquet).
+
+    Examples:
+        >>> data = pd.DataFrame({"player": ["a", "b", "c"], "zip": ["0800", "3000", "8000"]})
+        >>> b"".join(iter_export_bytes(data, ExportFormatEnum.CSV, chunk_rows=2)).decode()
+        'player,zip\\na,0800\\nb,3000\\nc,8000\\n'
+        >>> b"".join(iter_export_bytes(data.head(1), ExportFormatEnum.JSONL)).decode()
+        '{"player":"a","zip":"0800"}\\n'
+    """
+    if export_format == ExportFormatEnum.CSV:
+        # the header is written with the first chunk, or alone if there are no rows
+        if len(data.index) == 0:
+            yield data.to_csv(index=False).encode(EncodingEnum.UTF8.value)
+        for i, chunk in enumerate(iter_chunks(data, chunk_rows)):
+            yield chunk.to_csv(index=False, header=(i == 0)).encode(EncodingEnum.UTF8.value)
+    elif export_format == ExportFormatEnum.JSONL:
+        for chunk in iter_chunks(data, chunk_rows):
+            lines = chunk.to_json(orient="records", lines=True, force_ascii=False)
+            if not lines.endswith("\n"):
+                lines += "\n"
+            yield lines.encode(EncodingEnum.UTF8.value)
+    else:
+        raise ValueError(f"The format «{export_format}» cannot be exported as independent chunks")
+
+def write_parquet(data:pd.DataFrame, file:BinaryIO, chunk_rows:int=DEFAULT_CHUNK_ROWS)->None:
+    """
+    Writes the DataFrame as Parquet, one row group per chunk.
+
+    Args:
+        data (pd.DataFrame): The data to export.
+        file (BinaryIO): The file to write to.
+        chunk_rows (int, optional): The number of rows per row group. Defaults to DEFAULT_CHUNK_ROWS.
+
+    Notes:
+        - The schema is inferred from the whole DataFrame once, so all the row groups share it.
+        - The columns of DICTIONARY_COLUMNS are dictionary-encoded.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(data, preserve_index=False)
+    dictionary_columns:List[str] = [column for column in DICTIONARY_COLUMNS if column in data.columns]
+
+    with pq.ParquetWriter(file, schema, use_dictionary=dictionary_columns or False) as writer:
+        for chunk in iter_chunks(data, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+def export_dataframe(
+        data:pd.DataFrame,
+        export_format:ExportFormatEnum,
+        file:BinaryIO,
+        chunk_rows:int=DEFAULT_CHUNK_ROWS
+    )->None:
+    """
+    Writes the DataFrame chunk by chunk to a binary file in the given format.
+
+    Args:
+        data (pd.DataFrame): The data to export.
+        export_format (ExportFormatEnum): The format of the export.
+        file (BinaryIO): The file to write to.
+        chunk_rows (int, optional): The number of rows per chunk. Defaults to DEFAULT_CHUNK_ROWS.
+
+    Notes:
+        - Only one chunk is serialized at a time, so the export needs memory for one chunk
+          instead of a copy of the whole DataFrame as text and as bytes.
+    """
+    if export_format == ExportFormatEnum.PARQUET:
+        write_parquet(data, file, chunk_rows)
+    else:
+        for chunk in iter_export_bytes(data, export_format, chunk_rows):
+            file.write(chunk)
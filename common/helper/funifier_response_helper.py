@@ -0,0 +1,134 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper methods which parse the responses of the Funifier API"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script, moved __get_data() and
+##*                             __get_counts() from the FunifierAPI
+##* 2026-10-18      bettlerd    replaced pd.read_json() in get_data() by the
+##*                             streaming decoder of the json_stream_helper
+##* 2026-10-18      bettlerd    added count_rows()
+##* 2026-10-18      bettlerd    added get_counts_by_id()
+##*
+##*
+
+import logging
+from typing import Any, BinaryIO, Dict
+
+import pandas as pd
+
+from common.exceptions.funifier.api_error import FunifierAPIError
+from common.helper.json_stream_helper import ColumnBuilder, JSONArrayReader, DEFAULT_CHUNK_SIZE
+from domain_objects.dto.funifier.api_response_dto import APIResponseDTO
+
+
+def get_counts(data:pd.DataFrame)->int:
+    """
+    Extracts the count from a Pandas DataFrame and returns 0 if empty.
+
+    Args:
+        data (pd.DataFrame): The Pandas DataFrame containing the count.
+
+    Returns:
+        int: The count extracted from the DataFrame.
+
+    Notes:
+        - This method checks if the DataFrame is not empty using the `len()` function.
+        - If the DataFrame is not empty, it extracts the count from the first row of the "count" column.
+        - The count is returned as an integer using the `int()` function.
+        - If the DataFrame is empty, it returns 0.
+    """
+    if data is not None and len(data.index) > 0:
+        return int(data["count"].iloc[0])
+    else:
+        return 0
+
+def get_counts_by_id(stream:BinaryIO)->Dict[Any, int]:
+    """
+    Decodes the response body of a `$group` aggregation with a «count» per `_id` without pandas.
+
+    Args:
+        stream (BinaryIO): The response body.
+
+    Returns:
+        Dict[Any, int]: The counts by `_id`.
+
+    Raises:
+        FunifierAPIError: If the API response has an error code other than 200.
+
+    Examples:
+        >>> from io import BytesIO
+        >>> get_counts_by_id(BytesIO(b'[{"_id": "ticket-1", "count": 3}, {"_id": "ticket-2", "count": 1}]'))
+        {'ticket-1': 3, 'ticket-2': 1}
+    """
+    reader = JSONArrayReader(stream.read)
+    if not reader.is_array:
+        api_dto = APIResponseDTO.from_dict(reader.read_value())
+        if api_dto.errorCode != 200:
+            raise FunifierAPIError(api_dto.errorMessage)
+        return {}
+    return {row["_id"]: int(row["count"]) for row in reader}
+
+def count_rows(result:Any)->int:
+    """
+    Returns the number of rows of a parsed response, 0 if it is not a collection of rows.
+
+    Examples:
+        >>> count_rows(pd.DataFrame({"a": [1, 2]})), count_rows({"x": {}}), count_rows(None), count_rows("[]")
+        (2, 1, 0, 0)
+    """
+    if isinstance(result, pd.DataFrame):
+        return len(result.index)
+    if isinstance(result, tuple) and len(result) > 0:
+        # a reader which returns the rows together with additional information
+        return count_rows(result[0])
+    if isinstance(result, (dict, list)):
+        return len(result)
+    return 0
+
+def get_data(stream:BinaryIO, chunk_size:int=DEFAULT_CHUNK_SIZE)->pd.DataFrame:
+    """
+    Decodes the result of a Funifier API call from a binary stream and returns it as a Pandas DataFrame.
+
+    Args:
+        stream (BinaryIO): The response body, e.g. the `http.client.HTTPResponse` itself.
+        chunk_size (int, optional): The number of bytes read at once. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Returns:
+        pd.DataFrame: The extracted data as a Pandas DataFrame.
+
+    Raises:
+        FunifierAPIError: If the API response has an error code other than 200.
+
+    Notes:
+        - The top-level JSON array is decoded element by element while the stream is read, so the raw
+          bytes and the decoded text of the whole response are never in memory at the same time.
+        - The columns are collected row by row and the DataFrame is created once at the end.
+        - Unlike `pd.read_json()` string values are kept as they are, e.g. a phone number keeps its leading zero.
+        - If the JSON document is not an array, it is assumed to be an APIResponseDTO object and is parsed accordingly.
+        - If the API response has an error code other than 200, a FunifierAPIError is raised with the error message from the API response.
+        - If any other exception occurs during the transformation of the Pandas DataFrame, it is logged and re-raised.
+    """
+    try:
+        reader = JSONArrayReader(stream.read, chunk_size=chunk_size)
+        if not reader.is_array:
+            api_dto = APIResponseDTO.from_dict(reader.read_value())
+            if api_dto.errorCode != 200:
+                raise FunifierAPIError(api_dto.errorMessage)
+            return None
+
+        columns = ColumnBuilder()
+        for row in reader:
+            columns.append(row)
+        return pd.DataFrame(columns.columns)
+    except FunifierAPIError:
+        raise
+    except Exception as e:
+        logging.exception(f"error while transforming pandas dataframe. «{e}»")
+        raise e
@@ -0,0 +1,197 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper classes which decode JSON incrementally from a stream"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##* 2026-10-18      bettlerd    ByteCountingReader measures the time spent in read()
+##* 2026-10-18      bettlerd    ByteCountingReader reads the whole body for a negative size
+##*
+##*
+
+import codecs
+import json
+import re
+import time
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List
+
+from common.enums.common.encoding import EncodingEnum
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class ByteCountingReader():
+    """
+    Wraps a binary stream and counts the bytes read from it and the seconds spent reading.
+    """
+
+    def __init__(self, stream:BinaryIO):
+        self.__stream = stream
+        self.bytes_read = 0
+        self.read_seconds = 0.0
+
+    def read(self, size:int=-1)->bytes:
+        started_at = time.perf_counter()
+        # HTTPResponse.read(-1) reads the socket to its end instead of the body, None reads the body
+        data = self.__stream.read() if size is None or size < 0 else self.__stream.read(size)
+        self.read_seconds += time.perf_counter() - started_at
+        self.bytes_read += len(data)
+        return data
+
+
+class JSONArrayReader():
+    """
+    Reads the elements of a top-level JSON array one by one from a binary stream.
+
+    Only the current chunk and the element being decoded are held in memory.
+    If the document is not an array (e.g. an error envelope), `is_array` is
+    False and the whole document can be read with `read_value()`.
+
+    Examples:
+        >>> from io import BytesIO
+        >>> reader = JSONArrayReader(BytesIO(b'[{"a": 1}, {"a": 2}]').read, chunk_size=4)
+        >>> reader.is_array
+        True
+        >>> list(reader)
+        [{'a': 1}, {'a': 2}]
+
+        >>> reader = JSONArrayReader(BytesIO(b'{"errorCode": 401}').read)
+        >>> reader.is_array
+        False
+        >>> reader.read_value()
+        {'errorCode': 401}
+    """
+
+    def __init__(
+            self,
+            read:Callable[[int], bytes],
+            chunk_size:int=DEFAULT_CHUNK_SIZE,
+            encoding:str=EncodingEnum.UTF8.value
+        ):
+        self.__read = read
+        self.__chunk_size = chunk_size
+        self.__decoder = codecs.getincrementaldecoder(encoding)()
+        self.__raw_decode = json.JSONDecoder().raw_decode
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+
+        self.__skip_whitespace()
+        self.is_array = self.__peek() == "["
+        if self.is_array:
+            self.__pos += 1
+
+    def __iter__(self)->Iterator[Any]:
+        if not self.is_array:
+            raise ValueError("The JSON document is not an array")
+
+        self.__skip_whitespace()
+        if self.__peek() == "]":
+            return
+
+        while True:
+            yield self.__decode_element()
+
+            self.__skip_whitespace()
+            separator = self.__peek()
+            self.__pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self.__buffer, self.__pos - 1)
+            self.__skip_whitespace()
+
+    def read_value(self)->Any:
+        """
+        Reads the remaining stream and decodes it as one JSON value.
+        """
+        while self.__fill():
+            pass
+        return json.loads(self.__buffer[self.__pos:])
+
+    #region helper methods
+    def __fill(self)->bool:
+        """
+        Appends the next chunk to the buffer and returns False at the end of the stream.
+        """
+        if self.__eof:
+            return False
+
+        chunk = self.__read(self.__chunk_size)
+        if not chunk:
+            self.__eof = True
+            self.__buffer += self.__decoder.decode(b"", final=True)
+            return False
+
+        # drops the consumed part of the buffer before it grows
+        if self.__pos > 0:
+            self.__buffer = self.__buffer[self.__pos:]
+            self.__pos = 0
+        self.__buffer += self.__decoder.decode(chunk)
+        return True
+
+    def __peek(self)->str:
+        while self.__pos >= len(self.__buffer):
+            if not self.__fill():
+                raise json.JSONDecodeError("Unexpected end of the JSON document", self.__buffer, self.__pos)
+        return self.__buffer[self.__pos]
+
+    def __skip_whitespace(self)->None:
+        while True:
+            self.__pos = WHITESPACE.match(self.__buffer, self.__pos).end()
+            if self.__pos < len(self.__buffer) or not self.__fill():
+                return
+
+    def __decode_element(self)->Any:
+        while True:
+            try:
+                value, end = self.__raw_decode(self.__buffer, self.__pos)
+                # a number or literal at the end of the buffer might continue in the next chunk
+                if end < len(self.__buffer) or self.__eof:
+                    self.__pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.__eof:
+                    raise
+            self.__fill()
+    #endregion
+
+
+class ColumnBuilder():
+    """
+    Collects JSON objects row by row into columns.
+
+    A key which is missing in a row gets None in that row.
+
+    Examples:
+        >>> columns = ColumnBuilder()
+        >>> columns.append({"a": 1})
+        >>> columns.append({"a": 2, "b": "x"})
+        >>> columns.columns
+        {'a': [1, 2], 'b': [None, 'x']}
+    """
+
+    def __init__(self):
+        self.columns:Dict[str, List[Any]] = {}
+        self.n_rows = 0
+
+    def append(self, row:Dict[str, Any])->None:
+        for key, value in row.items():
+            column = self.columns.get(key)
+            if column is None:
+                column = self.columns[key] = [None] * self.n_rows
+            column.append(value)
+
+        self.n_rows += 1
+        if len(row) != len(self.columns):
+            for column in self.columns.values():
+                if len(column) < self.n_rows:
+                    column.append(None)
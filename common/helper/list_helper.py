@@ -17,6 +17,7 @@ There is a test class for this modul
 ##* 2023-09-26      bettlerd    added example in filter_objects()
 ##* 2023-09-26      bettlerd    added example in is_element_in_list()
 ##* 2023-10-25      bettlerd    update is_element_in_list(): check if object is a list
+##* 2026-10-18      bettlerd    added chunk_list()
 ##*
 ##*
 
@@ -81,6 +82,29 @@ def filter_objects(objects: List[Any], criteria: Callable[[Any], bool]) -> List[
     """
     return [obj for obj in objects if criteria(obj)]
 
+def chunk_list(list_obj:List[Any], chunk_size:int)->List[List[Any]]:
+    """
+    Splits a list into consecutive chunks of at most `chunk_size` elements.
+
+    Args:
+        list_obj (List[Any]): The list to be split.
+        chunk_size (int): The maximum number of elements per chunk.
+
+    Returns:
+        List[List[Any]]: The chunks in the order of the list.
+
+    Examples:
+        >>> chunk_list([1, 2, 3, 4, 5], 2)
+        [[1, 2], [3, 4], [5]]
+
+        >>> chunk_list([], 3)
+        []
+    """
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be at least 1 but is {chunk_size}")
+
+    return [list_obj[i:i + chunk_size] for i in range(0, len(list_obj), chunk_size)]
+
 if __name__ == "__main__":
 
     execute_test_is_element_in_list = False
@@ -11,19 +11,75 @@
 ##* ---------------------------------------------------------------------------
 ##* 2022-12-20      DOBE        created script  
 ##* 2023-10-26      DOBE        added DO_NOTHING
+##* 2026-10-18      bettlerd    replaced inspect.stack() by a single frame
+##*                             which is resolved lazily, cached the hostname,
+##*                             added log_info() and structured fields
 ##*
 ##*
 
-import re
+import functools
+import json
 import socket
-import inspect
+import sys
 import logging
+from types import CodeType
+from typing import Any, Dict
 
 from common.helper.list_helper import is_element_in_list
 
 
 DO_NOTHING = "do nothing (there is no work to be done in this step)."
 
+@functools.lru_cache(maxsize=None)
+def get_hostname()->str:
+    """
+    Returns the hostname of the machine, it is looked up only once per process.
+    """
+    return socket.gethostname()
+
+def format_fields(fields:Dict[str, Any])->str:
+    """
+    Formats structured fields as space separated key=value pairs.
+
+    A string value is quoted if it is empty or contains whitespace, quotes or «=».
+
+    Examples:
+        >>> format_fields({"lottery": "abc", "rows": 3, "city": "St. Gallen"})
+        'lottery=abc rows=3 city="St. Gallen"'
+    """
+    pairs = []
+    for key, value in fields.items():
+        text = str(value)
+        if isinstance(value, str) and (not text or any(c in text for c in ' \t\n"=')):
+            text = json.dumps(value, ensure_ascii=False)
+        pairs.append(f"{key}={text}")
+    return " ".join(pairs)
+
+
+class LogMessage():
+    """
+    A log message which is formatted only when it is emitted.
+
+    Only the code object of the caller is kept, not the frame itself, so
+    a buffered record does not keep the local variables of the caller alive.
+    """
+    __slots__ = ("code", "txt", "fields")
+
+    def __init__(self, code:CodeType, txt:str, fields:Dict[str, Any]):
+        self.code = code
+        self.txt = txt
+        self.fields = fields
+
+    @property
+    def caller(self)->str:
+        return f"{self.code.co_name}()"
+
+    def __str__(self)->str:
+        if self.fields:
+            return f"{self.caller}: {self.txt} {format_fields(self.fields)}"
+        return f"{self.caller}: {self.txt}"
+
+
 def current_method_name(level:int = 1)->str:
     """
     The function name that is being executed by the frame this record corresponds to, i.e.
@@ -31,20 +87,23 @@ def current_method_name(level:int = 1)->str:
 
     :param level: Parameter which determines what should be considered as «current» method. 0 will be current_method_name(), 1 the caller of current_method_name() and so on.
     """
-    method_name = f"{inspect.stack()[level][3]}()"
+    return f"{sys._getframe(level).f_code.co_name}()"
 
-    if False:
-        class_name = str(inspect.stack()[level + 1][4]).replace(method_name, "")
-        class_name = (re.sub(pattern="(\[)|(\])|(\')",repl="",string=class_name)
-                        .replace(".\\n","")
-                        .strip()
-            )
+def log_info(txt:str, caller_lvl:int = 2, **fields:Any):
+    """
+    Creates an info log entry whose caller and fields are formatted only if the entry is emitted.
 
-        return f'{class_name}.{method_name}'
-    else:
-        return method_name
-    
-def do_logging(txt:str,force_logging:bool=False,caller_lvl:int = 2):
+    :param txt: the text of the output
+    :param caller_lvl: the lvl of the method, caller_lvl=1 would be log_info(), caller_lvl=2, the method which calls log_info
+    :param fields: structured key/value pairs, they are appended to the text and passed to the handlers as the record attribute «fields»
+    """
+    if not logging.root.isEnabledFor(logging.INFO):
+        return
+
+    message = LogMessage(sys._getframe(caller_lvl - 1).f_code, txt, fields)
+    logging.info(message, extra={"hostname": get_hostname(), "fields": fields})
+
+def do_logging(txt:str,force_logging:bool=False,caller_lvl:int = 2, **fields:Any):
     """
     Decides whether to create a log entry or print the output to the console.
     If the method will be called on a developer machine. The output will 
@@ -53,14 +112,14 @@ def do_logging(txt:str,force_logging:bool=False,caller_lvl:int = 2):
     :param txt: the text of the output
     :param force_logging: should the logging be done even on the developer machine?
     :param caller_lvl: the lvl of the method, caller_lvl=1 would be do_logging(), caller_lvl=2, the method which calls do_logging
+    :param fields: structured key/value pairs which are appended to the text
     """
-    hostname = socket.gethostname()
     is_developer_machine = False
    
     if not force_logging & is_developer_machine:
-        print(f"{current_method_name(level=caller_lvl)}: {txt}")
+        print(LogMessage(sys._getframe(caller_lvl - 1).f_code, txt, fields))
     else:
-        logging.info(f"{current_method_name(level=caller_lvl)}: {txt}")
+        log_info(txt, caller_lvl=caller_lvl + 1, **fields)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,131 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper methods which read a manifest of lottery/ticket pairs"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##*
+##*
+
+import csv
+import io
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, TextIO
+
+from common.enums.common.encoding import EncodingEnum
+
+# the column names are compared in lower case without «_», e.g. «lotteryUID» or «lottery_uid»
+LOTTERY_KEYS = ("lotteryuid", "lottery")
+TICKET_KEYS = ("ticketuid", "ticket")
+
+
+@dataclass(frozen=True)
+class ManifestEntry():
+    """
+    A lottery and its lottery ticket.
+    """
+    lottery_uid: str
+    ticket_uid: str
+
+
+def parse_entries(rows:Iterable[Dict[str, Any]], source:str="manifest")->List[ManifestEntry]:
+    """
+    Returns the lottery/ticket pairs of the rows in their order, every pair only once.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): The rows with a lottery and a ticket column.
+        source (str, optional): The name of the manifest in the error messages. Defaults to «manifest».
+
+    Raises:
+        ValueError: If a row has no lottery or ticket UID or a lottery is given with more than one ticket.
+
+    Examples:
+        >>> parse_entries([{"lotteryUID": "l1", "ticketUID": "t1"}, {"lottery_uid": " l2 ", "ticket": "t2"},
+        ...                {"LotteryUID": "l1", "TicketUID": "t1"}])
+        [ManifestEntry(lottery_uid='l1', ticket_uid='t1'), ManifestEntry(lottery_uid='l2', ticket_uid='t2')]
+        >>> parse_entries([{"lotteryUID": "l1"}])
+        Traceback (most recent call last):
+        ...
+        ValueError: manifest, entry 1: the lottery UID and the ticket UID are required
+    """
+    entries:List[ManifestEntry] = []
+    ticket_by_lottery:Dict[str, str] = {}
+    for number, row in enumerate(rows, start=1):
+        values = {str(key).replace("_", "").strip().lower(): value for key, value in row.items()}
+        lottery_uid = __first_value(values, LOTTERY_KEYS)
+        ticket_uid = __first_value(values, TICKET_KEYS)
+        if not lottery_uid or not ticket_uid:
+            raise ValueError(f"{source}, entry {number}: the lottery UID and the ticket UID are required")
+
+        if lottery_uid in ticket_by_lottery:
+            if ticket_by_lottery[lottery_uid] != ticket_uid:
+                raise ValueError(f"{source}, entry {number}: the lottery «{lottery_uid}» is given with "
+                                 f"the tickets «{ticket_by_lottery[lottery_uid]}» and «{ticket_uid}»")
+            continue
+        ticket_by_lottery[lottery_uid] = ticket_uid
+        entries.append(ManifestEntry(lottery_uid, ticket_uid))
+    return entries
+
+def read_manifest_csv(file:TextIO, source:str="manifest")->List[ManifestEntry]:
+    """
+    Returns the pairs of a CSV manifest with a header, the delimiter «,» or «;» is detected.
+
+    Examples:
+        >>> read_manifest_csv(io.StringIO("lotteryUID;ticketUID\\nl1;t1\\n"))
+        [ManifestEntry(lottery_uid='l1', ticket_uid='t1')]
+    """
+    text = file.read()
+    header = text.split("\n", 1)[0]
+    delimiter = ";" if header.count(";") > header.count(",") else ","
+    rows = (row for row in csv.DictReader(io.StringIO(text), delimiter=delimiter) if any(row.values()))
+    return parse_entries(rows, source)
+
+def read_manifest_json(file:TextIO, source:str="manifest")->List[ManifestEntry]:
+    """
+    Returns the pairs of a JSON manifest, i.e. a list of objects or an object with the list under «lotteries».
+
+    Raises:
+        ValueError: If the JSON is no list of objects.
+
+    Examples:
+        >>> read_manifest_json(io.StringIO('{"lotteries": [{"lotteryUID": "l1", "ticketUID": "t1"}]}'))
+        [ManifestEntry(lottery_uid='l1', ticket_uid='t1')]
+    """
+    document = json.load(file)
+    rows = document.get("lotteries") if isinstance(document, dict) else document
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise ValueError(f"{source}: a list of objects with a lottery UID and a ticket UID is expected")
+    return parse_entries(rows, source)
+
+def read_manifest(path:str)->List[ManifestEntry]:
+    """
+    Returns the lottery/ticket pairs of a manifest file, the format is taken from the extension (.csv or .json).
+
+    Raises:
+        ValueError: If the extension is unknown or the manifest is invalid.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    readers = {".csv": read_manifest_csv, ".json": read_manifest_json}
+    if extension not in readers:
+        raise ValueError(f"The manifest «{path}» must be a .csv or a .json file")
+
+    # utf-8-sig also reads the CSV files of Excel which start with a BOM
+    with open(path, encoding=f"{EncodingEnum.UTF8.value}-sig", newline="") as file:
+        return readers[extension](file, os.path.basename(path))
+
+#region helper methods
+def __first_value(values:Dict[str, Any], keys:Iterable[str])->str:
+    for key in keys:
+        value = values.get(key)
+        if value is not None and str(value).strip():
+            return str(value).strip()
+    return ""
+#endregion
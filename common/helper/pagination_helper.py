@@ -0,0 +1,114 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of pagination helper methods"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##*
+##*
+
+DEFAULT_PAGE_SIZE = 1000
+MIN_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 100000
+TARGET_PAGE_SECONDS = 1.0
+TARGET_PAGE_BYTES = 4 * 1024 * 1024
+
+# the page size changes at most by this factor from one page to the next
+MAX_GROWTH_FACTOR = 2.0
+MAX_SHRINK_FACTOR = 0.5
+
+
+def range_header(start:int, page_size:int)->str:
+    """
+    Returns the value of the `Range` header for one page.
+
+    Args:
+        start (int): The index of the first item of the page.
+        page_size (int): The number of items of the page.
+
+    Returns:
+        str: The value of the `Range` header.
+
+    Examples:
+        >>> range_header(0, 1000)
+        'items=0-1000'
+
+        >>> range_header(2000, 500)
+        'items=2000-2500'
+    """
+    return f"items={start}-{start + page_size}"
+
+
+class AdaptivePageSize():
+    """
+    Adapts the page size of a paginated request to the observed latency and payload size.
+
+    After every page the size is scaled so that the next page takes about
+    `target_seconds` and carries about `target_bytes`, whichever is hit first.
+    The size never changes by more than a factor of two per page and stays
+    between `min_size` and `max_size`.
+
+    Examples:
+        >>> page_size = AdaptivePageSize(initial=1000)
+        >>> page_size.update(rows=1000, seconds=0.25, n_bytes=100_000)
+        2000
+        >>> page_size.update(rows=2000, seconds=4.0, n_bytes=400_000)
+        1000
+    """
+
+    def __init__(
+            self,
+            initial:int=DEFAULT_PAGE_SIZE,
+            min_size:int=MIN_PAGE_SIZE,
+            max_size:int=MAX_PAGE_SIZE,
+            target_seconds:float=TARGET_PAGE_SECONDS,
+            target_bytes:int=TARGET_PAGE_BYTES
+        ):
+        if not 0 < min_size <= max_size:
+            raise ValueError(f"Invalid page size bounds «{min_size}-{max_size}»")
+
+        self.__min_size = min_size
+        self.__max_size = max_size
+        self.__target_seconds = target_seconds
+        self.__target_bytes = target_bytes
+        self.__value = self.__clamp(initial)
+
+    @property
+    def value(self)->int:
+        return self.__value
+
+    def update(self, rows:int, seconds:float, n_bytes:int)->int:
+        """
+        Takes the measurements of the last page into account and returns the next page size.
+
+        Args:
+            rows (int): The number of rows of the last page.
+            seconds (float): The time it took to fetch the last page.
+            n_bytes (int): The payload size of the last page.
+
+        Returns:
+            int: The page size for the next page.
+        """
+        if rows <= 0:
+            return self.__value
+
+        factor = MAX_GROWTH_FACTOR
+        if seconds > 0:
+            factor = min(factor, self.__target_seconds / seconds)
+        if n_bytes > 0:
+            factor = min(factor, self.__target_bytes / n_bytes)
+        factor = max(factor, MAX_SHRINK_FACTOR)
+
+        self.__value = self.__clamp(int(rows * factor))
+        return self.__value
+
+    #region helper methods
+    def __clamp(self, size:int)->int:
+        return max(self.__min_size, min(self.__max_size, size))
+    #endregion
@@ -0,0 +1,92 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper classes which search many substrings at once"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##*
+##*
+
+from collections import deque
+from typing import Dict, List, Sequence
+
+NO_MATCH = -1
+
+
+class MultiPatternMatcher():
+    """
+    Aho-Corasick automaton over a list of patterns.
+
+    The text is read once, whatever the number of patterns. `first_match()`
+    returns the index of the first pattern of the list which occurs in the
+    text, i.e. the same result as testing `pattern in text` pattern by pattern.
+
+    Examples:
+        >>> matcher = MultiPatternMatcher(["lotto", "win", "in"])
+        >>> matcher.first_match("a winner"), matcher.first_match("nothing"), matcher.first_match("abc")
+        (1, 2, -1)
+    """
+
+    def __init__(self, patterns:Sequence[str]):
+        self.__goto:List[Dict[str, int]] = [{}]
+        self.__fail:List[int] = [0]
+        # the lowest index of the patterns which end in the state, incl. the ones of the fail states
+        self.__output:List[float] = [float("inf")]
+
+        for index, pattern in enumerate(patterns):
+            self.__add(pattern, index)
+        self.__link()
+
+    def first_match(self, text:str)->int:
+        """
+        Returns the lowest index of the patterns which occur in the text, NO_MATCH if there is none.
+        """
+        goto, fail, output = self.__goto, self.__fail, self.__output
+        best = output[0]
+        state = 0
+        for char in text:
+            if best == 0:
+                break
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state] < best:
+                best = output[state]
+        return NO_MATCH if best == float("inf") else int(best)
+
+    #region helper methods
+    def __add(self, pattern:str, index:int)->None:
+        state = 0
+        for char in pattern:
+            next_state = self.__goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.__goto)
+                self.__goto[state][char] = next_state
+                self.__goto.append({})
+                self.__fail.append(0)
+                self.__output.append(float("inf"))
+            state = next_state
+        self.__output[state] = min(self.__output[state], index)
+
+    def __link(self)->None:
+        """
+        Sets the fail state of every state in breadth-first order and merges the outputs along them.
+        """
+        queue = deque(self.__goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.__goto[state].items():
+                fail = self.__fail[state]
+                while fail and char not in self.__goto[fail]:
+                    fail = self.__fail[fail]
+                self.__fail[next_state] = self.__goto[fail].get(char, 0)
+                self.__output[next_state] = min(self.__output[next_state], self.__output[self.__fail[next_state]])
+                queue.append(next_state)
+    #endregion
+
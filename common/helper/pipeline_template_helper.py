@@ -0,0 +1,149 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper classes which compile and bind aggregation pipeline templates"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##*
+##*
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+# a parameter slot is a JSON string which consists of the pattern only, e.g. "#ticket_uid#"
+SLOT_PATTERN = re.compile(r'"#([a-z_]+)#"')
+
+
+class PipelineTemplate():
+    """
+    An aggregation pipeline which is parsed once and bound to its parameters many times.
+
+    A parameter slot is a JSON string value consisting only of a pattern of
+    `common.constants.funifier.pattern`, e.g. `"#ticket_uid#"`. At compile time
+    the pipeline is serialized to compact JSON and split at its slots; binding
+    only serializes the parameter values and joins the fragments. The values are
+    serialized with `json.dumps()`, so they cannot break out of their slot, and
+    equal values always result in the same string.
+
+    Examples:
+        >>> template = PipelineTemplate(
+        ...     '[{"$match": {"type": 2, "item": "#ticket_uid#"}}]',
+        ...     {"#ticket_uid#": str})
+        >>> template.bind(ticket_uid='abc"')
+        '[{"$match":{"type":2,"item":"abc\\\\""}}]'
+        >>> template.bind(ticket_uid=42)
+        Traceback (most recent call last):
+        ...
+        TypeError: The parameter «ticket_uid» must be of type str but is int
+    """
+
+    def __init__(self, source:str, parameters:Optional[Dict[str, type]]=None, name:Optional[str]=None):
+        """
+        Args:
+            source (str): The pipeline as JSON with the parameter slots.
+            parameters (Dict[str, type], optional): The type of every slot by its pattern. Defaults to no parameters.
+            name (str, optional): The name of the template.
+
+        Raises:
+            ValueError: If the source is no valid JSON or the slots do not match the parameters.
+        """
+        self.name = name
+        self.__types:Dict[str, type] = {
+            pattern.strip("#"): value_type for pattern, value_type in (parameters or {}).items()
+        }
+
+        compact = json.dumps(json.loads(source), separators=(",", ":"), ensure_ascii=False)
+        parts = SLOT_PATTERN.split(compact)
+        # parts alternate between literal fragments and slot names
+        self.__fragments:List[str] = parts[0::2]
+        self.__slots:List[str] = parts[1::2]
+
+        if set(self.__slots) != set(self.__types):
+            raise ValueError(
+                f"The slots {sorted(set(self.__slots))} of the template «{name}» "
+                f"do not match its parameters {sorted(self.__types)}")
+
+    @property
+    def parameters(self)->Dict[str, type]:
+        return dict(self.__types)
+
+    def bind(self, **values:Any)->str:
+        """
+        Returns the pipeline as compact JSON with the slots replaced by the given values.
+
+        Args:
+            **values: The value of every parameter by its name, i.e. the pattern without «#».
+
+        Returns:
+            str: The bound pipeline.
+
+        Raises:
+            TypeError: If a parameter is missing, unknown or of the wrong type.
+        """
+        if values.keys() != self.__types.keys():
+            missing = sorted(self.__types.keys() - values.keys())
+            unknown = sorted(values.keys() - self.__types.keys())
+            raise TypeError(f"Invalid parameters of the template «{self.name}»: missing {missing}, unknown {unknown}")
+
+        serialized = {}
+        for name, value in values.items():
+            value_type = self.__types[name]
+            if not isinstance(value, value_type):
+                raise TypeError(
+                    f"The parameter «{name}» must be of type {value_type.__name__} but is {type(value).__name__}")
+            serialized[name] = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+        result = [self.__fragments[0]]
+        for slot, fragment in zip(self.__slots, self.__fragments[1:]):
+            result.append(serialized[slot])
+            result.append(fragment)
+        return "".join(result)
+
+
+class PipelineTemplateRegistry():
+    """
+    Keeps the compiled pipeline templates by name.
+    """
+
+    def __init__(self):
+        self.__templates:Dict[str, PipelineTemplate] = {}
+
+    def register(self, name:str, source:str, parameters:Optional[Dict[str, type]]=None)->PipelineTemplate:
+        """
+        Compiles the pipeline and registers it under the given name.
+
+        Raises:
+            ValueError: If a template with the same name is already registered.
+        """
+        if name in self.__templates:
+            raise ValueError(f"The template «{name}» is already registered")
+
+        template = PipelineTemplate(source, parameters, name=name)
+        self.__templates[name] = template
+        return template
+
+    def get(self, name:str)->PipelineTemplate:
+        """
+        Returns the template with the given name.
+
+        Raises:
+            KeyError: If there is no template with the given name.
+        """
+        return self.__templates[name]
+
+    def bind(self, name:str, **values:Any)->str:
+        """
+        Binds the template with the given name, see `PipelineTemplate.bind()`.
+        """
+        return self.__templates[name].bind(**values)
+
+    def names(self)->List[str]:
+        """Returns the names of all the registered templates."""
+        return list(self.__templates)
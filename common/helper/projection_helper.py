@@ -0,0 +1,102 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper methods which push a column selection down into the winners pipelines"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##*
+##*
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from common.constants.funifier.columns import ADDRESS_FIELDS, PLAYER_COLUMN, WINNER_FIELDS
+
+
+def select_columns(columns:Optional[Sequence[str]], required:Sequence[str]=(PLAYER_COLUMN,))->Optional[List[str]]:
+    """
+    Returns the selected winner and address columns in the order of the pipelines, incl. the required ones.
+
+    Args:
+        columns (Sequence[str], optional): The selected columns, None selects all of them.
+        required (Sequence[str], optional): The columns which are added to every selection. Defaults to «player».
+
+    Returns:
+        Optional[List[str]]: The columns, None if all the columns are selected.
+
+    Raises:
+        ValueError: If a column is neither a winner nor an address column.
+
+    Examples:
+        >>> select_columns(["zip", "lastName"])
+        ['player', 'lastName', 'zip']
+        >>> select_columns(None) is None
+        True
+        >>> select_columns(["email"])
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown columns ['email'], the columns are ['player', 'total', 'lotteryUID', 'time', 'ticketUID', 'firstname', 'lastName', 'phone', 'dateOfBirth', 'street', 'city', 'zip', 'tos_accepted', 'privacy_accepted']
+    """
+    if columns is None:
+        return None
+
+    known = [*WINNER_FIELDS, *ADDRESS_FIELDS]
+    unknown = [column for column in columns if column not in known]
+    if unknown:
+        raise ValueError(f"Unknown columns {unknown}, the columns are {known}")
+
+    selected = set(columns).union(required)
+    return [column for column in known if column in selected]
+
+def address_group_id(columns:Optional[Sequence[str]])->Dict[str, Any]:
+    """
+    Returns the `_id` of the `$group` stage of the `$lookup` sub-pipeline with the selected address columns.
+
+    Examples:
+        >>> address_group_id(["player", "zip"])
+        {'playerUID': '$player', 'zip': '$extra.zip'}
+    """
+    group_id = {"playerUID": "$player"}
+    for column, field in ADDRESS_FIELDS.items():
+        if columns is None or column in columns:
+            group_id[field] = f"$extra.{field}"
+    return group_id
+
+def winners_with_address_projection(columns:Optional[Sequence[str]])->Dict[str, Any]:
+    """
+    Returns the outer `$project` stage of the winners joined with the address of `address_group_id()`.
+
+    Notes:
+        - A selection leaves out the `_id` of the achievement, all the columns keep it.
+
+    Examples:
+        >>> winners_with_address_projection(["player", "zip"])
+        {'_id': 0, 'player': 1, 'zip': {'$arrayElemAt': ['$joinedData._id.zip', 0]}}
+    """
+    projection:Dict[str, Any] = {} if columns is None else {"_id": 0}
+    for column, expression in WINNER_FIELDS.items():
+        if columns is None or column in columns:
+            projection[column] = expression
+    for column, field in ADDRESS_FIELDS.items():
+        if columns is None or column in columns:
+            projection[column] = {"$arrayElemAt": [f"$joinedData._id.{field}", 0]}
+    return projection
+
+def players_address_group(columns:Optional[Sequence[str]])->Dict[str, Any]:
+    """
+    Returns the `$group` stage of the address by player with the selected address columns.
+
+    Examples:
+        >>> players_address_group(["player", "zip"])
+        {'_id': '$player', 'zip': {'$first': '$extra.zip'}}
+    """
+    group:Dict[str, Any] = {"_id": "$player"}
+    for column, field in ADDRESS_FIELDS.items():
+        if columns is None or column in columns:
+            group[column] = {"$first": f"$extra.{field}"}
+    return group
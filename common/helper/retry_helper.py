@@ -0,0 +1,169 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper classes for retries with backoff and deadlines"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##*
+##*
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import BinaryIO, Optional
+
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 10.0
+DEFAULT_MAX_RETRY_AFTER = 60.0
+
+# 429 Too Many Requests and the 5xx which are typical for an overloaded or restarting node
+RETRYABLE_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+def parse_retry_after(value:Optional[str], now:Optional[float]=None)->Optional[float]:
+    """
+    Returns the delay in seconds of a `Retry-After` header, which is either a number of
+    seconds or an HTTP date. Returns None if the header is missing or invalid.
+
+    Examples:
+        >>> parse_retry_after("120")
+        120.0
+        >>> parse_retry_after("Thu, 01 Jan 1970 00:01:40 GMT", now=40)
+        60.0
+        >>> parse_retry_after("soon") is None
+        True
+    """
+    if value is None:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(retry_at - (time.time() if now is None else now), 0.0)
+
+
+class RetryPolicy():
+    """
+    Exponential backoff with full jitter.
+
+    The n-th retry waits a random time between 0 and `min(max_delay, base_delay * 2**n)`,
+    so that the clients of a recovering host do not retry in lockstep. A `Retry-After`
+    of the server is honored up to `max_retry_after` seconds.
+
+    Examples:
+        >>> policy = RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=3.0, rng=random.Random(1))
+        >>> [round(policy.delay(n), 3) for n in range(3)]
+        [0.134, 1.695, 2.291]
+        >>> policy.delay(0, retry_after=5.0)
+        5.0
+    """
+
+    def __init__(
+            self,
+            max_attempts:int=DEFAULT_MAX_ATTEMPTS,
+            base_delay:float=DEFAULT_BASE_DELAY,
+            max_delay:float=DEFAULT_MAX_DELAY,
+            max_retry_after:float=DEFAULT_MAX_RETRY_AFTER,
+            rng:Optional[random.Random]=None
+        ):
+        if max_attempts < 1:
+            raise ValueError(f"The number of attempts must be at least 1 but is {max_attempts}")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.__rng = rng or random.Random()
+
+    def delay(self, retry:int, retry_after:Optional[float]=None)->float:
+        """
+        Returns the seconds to wait before the given retry, starting with 0.
+
+        Args:
+            retry (int): The number of retries so far.
+            retry_after (float, optional): The `Retry-After` of the last response in seconds.
+        """
+        delay = self.__rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+
+
+# a single attempt without any retry
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class Deadline():
+    """
+    The point in time by which a call has to be finished, None means no deadline.
+
+    Examples:
+        >>> Deadline(None).remaining() is None
+        True
+        >>> Deadline(0).expired()
+        True
+    """
+
+    def __init__(self, seconds:Optional[float]):
+        self.__expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self)->Optional[float]:
+        if self.__expires_at is None:
+            return None
+        return max(self.__expires_at - time.monotonic(), 0.0)
+
+    def expired(self)->bool:
+        return self.__expires_at is not None and time.monotonic() >= self.__expires_at
+
+    def limit(self, timeout:Optional[float])->Optional[float]:
+        """
+        Returns the timeout shortened to the remaining time of the deadline.
+
+        Examples:
+            >>> Deadline(None).limit(30.0)
+            30.0
+            >>> Deadline(10).limit(None) <= 10
+            True
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+    def check(self)->None:
+        """
+        Raises a TimeoutError if the deadline has passed.
+        """
+        if self.expired():
+            raise TimeoutError("The deadline of the call has passed")
+
+
+class DeadlineReader():
+    """
+    Wraps a binary stream and raises a TimeoutError once the deadline has passed.
+
+    The deadline is checked before every read, so a single read can still take
+    as long as the read timeout of the socket.
+    """
+
+    def __init__(self, stream:BinaryIO, deadline:Deadline):
+        self.__stream = stream
+        self.__deadline = deadline
+
+    def read(self, size:int=-1)->bytes:
+        self.__deadline.check()
+        return self.__stream.read() if size is None or size < 0 else self.__stream.read(size)
@@ -0,0 +1,31 @@
+##*****************************************************************************
+##
+## Description ----------------------------------------------------------------
+##
+##*****************************************************************************
+##*
+""" Collection of helper methods for type annotations"""
+##*
+##* Modifications:
+##* Date            User        Description
+##* ---------------------------------------------------------------------------
+##* 2026-10-18      bettlerd    created script
+##*
+##*
+
+from typing import Any, Optional, Union, get_args, get_origin
+
+
+def unwrap_optional(value_type:Any)->Any:
+    """
+    Returns X of Optional[X], otherwise the type itself.
+
+    Examples:
+        >>> unwrap_optional(Optional[int]), unwrap_optional(str), unwrap_optional(Union[int, str])
+        (<class 'int'>, <class 'str'>, typing.Union[int, str])
+    """
+    if get_origin(value_type) is Union:
+        type_args = [type_arg for type_arg in get_args(value_type) if type_arg is not type(None)]
+        if len(type_args) == 1:
+            return type_args[0]
+    return value_type
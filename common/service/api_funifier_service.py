@@ -59,26 +59,92 @@ source: https://api.funifier.com/
 ##* 2023-10-25          bettlerd    changed helper to service
 ##* 2023-10-25          bettlerd    updated get_lottery_participants(), added which_tickets
 ##* 2023-12-25          bettlerd    added get_lottery_winners_with_address()
+##* 2026-10-18          bettlerd    added keep-alive connection pool, close() and
+##*                                 pool_statistics()
+##* 2026-10-18          bettlerd    added iter_aggregation_pages() and
+##*                                 iter_lottery_winners_with_address()
+##* 2026-10-18          bettlerd    moved the pipelines to constants.funifier.pipelines
+##*                                 and the response parsing to funifier_response_helper
+##*                                 to share them with the AsyncFunifierAPI
+##* 2026-10-18          bettlerd    added get_lottery_winners_with_address_batch()
+##* 2026-10-18          bettlerd    added response cache of the aggregation calls with
+##*                                 the TTL of settings.expiration_time
+##* 2026-10-18          bettlerd    __get_data() decodes the response body while it is
+##*                                 read from the socket
+##* 2026-10-18          bettlerd    added join_plan to get_lottery_winners_with_address()
+##*                                 with a client-side hash join of the addresses
+##* 2026-10-18          bettlerd    bind the compiled pipeline templates instead of str.replace()
+##* 2026-10-18          bettlerd    record the timing breakdown, byte and row counts of every
+##*                                 request in a MetricsRegistry
+##* 2026-10-18          bettlerd    added ssl_context and urls with the scheme http:// or https://
+##* 2026-10-18          bettlerd    added connect/read timeouts, a deadline per call, retries with
+##*                                 backoff of the idempotent calls and a circuit breaker per host
+##* 2026-10-18          bettlerd    accept gzip/deflate responses, decompressed while they are read
+##* 2026-10-18          bettlerd    added count_lottery_participants_batch()
+##* 2026-10-18          bettlerd    added the incremental sync_lottery_winners_with_address() and
+##*                                 sync_lottery_participants()
+##* 2026-10-18          bettlerd    added snapshot_lottery() into an AchievementSnapshotStore
+##* 2026-10-18          bettlerd    added the column selection of the winners, pushed down into the pipelines
+##* 2026-10-18          bettlerd    sync_lottery_winners_with_address() keeps a result set per column selection
+##* 2026-10-18          bettlerd    the circuit breaker counts a success only if a status has been read
+##* 2026-10-18          bettlerd    a request aborted before a status has been read releases the probe
 ##*
 ##*
 
-import http.client
-from io import StringIO
-import json
 import base64
-import logging
-from typing import List
+import http.client
+import ssl
+import time
+import weakref
+from io import BytesIO
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
 import pandas as pd
 
 from common.enums.common.encoding import EncodingEnum
 from common.enums.common.http_methods import HTTPmethodsEnum
-from common.exceptions.funifier.api_error import FunifierAPIError
+from common.enums.funifier.achievement_type import AchievementTypeEnum
+from common.enums.funifier.join_plan import JoinPlanEnum
+from common.enums.funifier.participant_count import ParticipantCountEnum
+from common.enums.funifier.sync_kind import SyncKindEnum
+from common.exceptions.funifier.api_error import (
+    FunifierAPIError, FunifierCircuitOpenError, FunifierServerError, FunifierTimeoutError
+)
+from common.helper.compression_helper import ACCEPT_ENCODING, DecompressingReader, is_compressed
+from common.helper.funifier_response_helper import count_rows, get_counts, get_counts_by_id, get_data
+from common.helper.json_stream_helper import ByteCountingReader, JSONArrayReader
+from common.helper.list_helper import chunk_list
 from common.helper.logging_helper import do_logging
-from domain_objects.dto.funifier.api_response_dto import APIResponseDTO
+from common.helper.projection_helper import (
+    address_group_id, players_address_group, select_columns, winners_with_address_projection
+)
+from common.helper.pagination_helper import AdaptivePageSize, range_header, DEFAULT_PAGE_SIZE
+from common.helper.retry_helper import (
+    Deadline, DeadlineReader, RetryPolicy, parse_retry_after, NO_RETRY, RETRYABLE_STATUSES
+)
+from common.service.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from common.service.incremental_sync import IncrementalSyncStore, SyncState, EPOCH
+from common.service.connection_pool import HTTPSConnectionPool, split_scheme, DEFAULT_POOL_SIZE
+from common.service.metrics_registry import MetricsRegistry, METRICS
+from common.service.response_cache import ResponseCache, make_cache_key, DEFAULT_CACHE_SIZE
+from common.service.snapshot_store import AchievementSnapshotStore
 from domain_objects.dto.common.api_config_dto import APIConfigsDTO
+from domain_objects.dto.funifier.api_response_dto import APIResponseDTO
+from common.constants.funifier.columns import ADDRESS_COLUMNS, PLAYER_COLUMN
 import common.constants.funifier.pattern as pattern
+import common.constants.funifier.pipelines as pipelines
 import common.constants.funifier.routes as routes
 
+DEFAULT_BATCH_SIZE = 25
+PLAYERS_PER_REQUEST = 500
+TICKETS_PER_REQUEST = 1000
+# the status of the request metrics of a response which has been answered by the response cache
+CACHE_STATUS = "cache"
+DEFAULT_CONNECT_TIMEOUT = 10.0
+# an aggregation with a $lookup per winner can take a while before the first byte
+DEFAULT_READ_TIMEOUT = 120.0
+# the errors after which an idempotent call is sent once more
+RETRYABLE_ERRORS = (FunifierServerError, FunifierTimeoutError, OSError, http.client.HTTPException)
+
 
 class FunifierAPI():
     """
@@ -87,39 +153,378 @@ class FunifierAPI():
     source: https://api.funifier.com/
     """
 
-    def __init__(self, config:APIConfigsDTO):
+    def __init__(
+            self,
+            config:APIConfigsDTO,
+            pool_size:int=DEFAULT_POOL_SIZE,
+            cache_size:int=DEFAULT_CACHE_SIZE,
+            cache_dir:Optional[str]=None,
+            metrics:Optional[MetricsRegistry]=None,
+            ssl_context:Optional[ssl.SSLContext]=None,
+            connect_timeout:Optional[float]=DEFAULT_CONNECT_TIMEOUT,
+            read_timeout:Optional[float]=DEFAULT_READ_TIMEOUT,
+            deadline_seconds:Optional[float]=None,
+            retry_policy:Optional[RetryPolicy]=None,
+            circuit_breaker:Optional[CircuitBreaker]=None
+        ):
+        """
+        Args:
+            config (APIConfigsDTO): The credentials, url, version and header of the API.
+            pool_size (int, optional): The number of keep-alive connections kept open to the API host. Defaults to DEFAULT_POOL_SIZE.
+            cache_size (int, optional): The number of aggregation responses kept in memory. Defaults to DEFAULT_CACHE_SIZE.
+            cache_dir (str, optional): The directory of the on-disk cache tier. Defaults to None (memory only).
+            metrics (MetricsRegistry, optional): The registry of the request metrics. Defaults to the registry of the process.
+            ssl_context (ssl.SSLContext, optional): The TLS context of the connections. Defaults to the default context of `http.client`.
+            connect_timeout (float, optional): The seconds to connect and send a request. Defaults to DEFAULT_CONNECT_TIMEOUT.
+            read_timeout (float, optional): The seconds every read of a response may take. Defaults to DEFAULT_READ_TIMEOUT.
+            deadline_seconds (float, optional): The seconds a call may take incl. its retries. Defaults to None (no deadline).
+            retry_policy (RetryPolicy, optional): The backoff of the idempotent calls. Defaults to `RetryPolicy()`.
+            circuit_breaker (CircuitBreaker, optional): Defaults to the breaker of the host shared by the process.
+
+        Notes:
+            - The aggregation responses are only cached if `config.settings.expiration_time` (in seconds) is set.
+            - The url of the config is an HTTPS host, the prefix «http://» connects without TLS, e.g. to a local stand-in.
+            - The GET requests and the aggregations are retried after a timeout, a connection error, 429 or 5xx.
+              The other requests are sent only once.
+        """
         do_logging("Initializing Funifier API")
         self.__API_KEY = config.api_key
         self.__APP_SECRET = config.app_secret
         self.__URL = config.url
         self.__VERSION = config.version
         self.__HEADER = config.header
-    
-    def __API_request(self, method:str,route:str, body=None):
-        conn = http.client.HTTPSConnection(self.__URL) 
+        host, use_tls = split_scheme(self.__URL)
+        self.__POOL = HTTPSConnectionPool(host,
+                                          size=pool_size,
+                                          timeout=connect_timeout,
+                                          ssl_context=ssl_context,
+                                          use_tls=use_tls,
+                                          read_timeout=read_timeout)
+        self.__READ_TIMEOUT = read_timeout
+        self.__DEADLINE_SECONDS = deadline_seconds
+        self.__RETRY_POLICY = retry_policy or RetryPolicy()
+        self.__BREAKER = circuit_breaker or get_circuit_breaker(host)
+        self.__CACHE = self.__create_cache(config, cache_size, cache_dir)
+        self.__METRICS = METRICS if metrics is None else metrics
+        # closes the pooled connections when the client is garbage collected or on shutdown
+        self.__finalizer = weakref.finalize(self, self.__POOL.close)
+
+    def __enter__(self)->'FunifierAPI':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback)->None:
+        self.close()
+
+    def close(self)->None:
+        """
+        Closes all the pooled connections to the Funifier API.
+        """
+        self.__finalizer()
+
+    def pool_statistics(self)->Dict[str, int]:
+        """
+        Returns the hit and miss counters of the connection pool, see `HTTPSConnectionPool.statistics()`.
+        """
+        return self.__POOL.statistics()
+
+    def cache_statistics(self)->Optional[Dict[str, int]]:
+        """
+        Returns the hit, miss and eviction counters of the response cache, see `ResponseCache.statistics()`.
+        Returns None if the cache is disabled.
+        """
+        return None if self.__CACHE is None else self.__CACHE.statistics()
+
+    def circuit_statistics(self)->Dict[str, Any]:
+        """
+        Returns the state and the trip counters of the circuit breaker, see `CircuitBreaker.statistics()`.
+        """
+        return self.__BREAKER.statistics()
+
+    @property
+    def metrics(self)->MetricsRegistry:
+        """
+        The registry of the request metrics, see `__API_request()` for the recorded metrics.
+        """
+        return self.__METRICS
+
+    def invalidate_cache(self, route:Optional[str]=None)->None:
+        """
+        Removes the cached responses of the route, or all the cached responses if no route is given.
+
+        Args:
+            route (str, optional): The route, see `common.constants.funifier.routes`.
+        """
+        if self.__CACHE is not None:
+            self.__CACHE.invalidate(None if route is None else f"/{self.__VERSION}{route}")
+
+    def __API_request(self, method:str,route:str, body=None, range:str=None, reader:Callable[[BinaryIO], Any]=None):
+        """
+        Sends a request and returns the decoded response body, or the result of `reader`
+        which gets the response body as a binary stream.
+
+        Notes:
+            - Every request is recorded in the metrics registry, labeled by its route without the query string:
+                - funifier_request_seconds{route,phase}: histogram of the phases «connect» (TCP, only for a new
+                  connection), «tls», «send», «server» (time to the response headers), «download» (reading the
+                  body), «decompress» (only for a compressed body), «decode» (parsing the body while it is read)
+                  and «total». A response of the cache only records the phase «cache».
+                - funifier_requests_total{route,status}: the HTTP status or «cache».
+                - funifier_request_errors_total{route,error}: the requests which raised an exception.
+                - funifier_request_bytes_total, funifier_response_bytes_total and funifier_response_rows_total{route}.
+                  The response bytes are counted decompressed.
+                - funifier_response_wire_bytes_total{route}: the response bytes as transferred, i.e. compressed.
+                - funifier_retries_total{route,error}: the attempts which have been retried.
+                - funifier_circuit_rejections_total{route}: the requests which failed fast.
+                - funifier_sync_rows_total{kind}: the rows fetched by the incremental sync.
+            - The API may answer with a gzip or deflate compressed body, which is decompressed while it is read.
+              An uncompressed body is read as it is.
+            - An idempotent call is retried with the backoff of the retry policy, at least as long as the
+              `Retry-After` of the response, as long as the attempts and the deadline allow it.
+
+        Raises:
+            FunifierServerError: If the API still answers with 429 or 5xx after the last attempt.
+            FunifierTimeoutError: If the API does not answer in time.
+            FunifierCircuitOpenError: If the circuit breaker of the host is open.
+        """
         headers = {
           'Content-Type': self.__HEADER.content_type,
           'Authorization': 'Basic {}'.format(
             base64.b64encode(bytes(f'{self.__API_KEY}:{self.__APP_SECRET}',
                                    EncodingEnum.UTF8.value))
                   .decode(EncodingEnum.ASCII.value)),
-          'Range': self.__HEADER.range
+          'Range': range or self.__HEADER.range,
+          'Accept-Encoding': ACCEPT_ENCODING
         }
         
-        conn.request(method, f"/{self.__VERSION}{route}",body=body, headers=headers)
-        res = conn.getresponse()
-        data = res.read()
-        
-        return data.decode(EncodingEnum.UTF8.value)
-    
+        url = f"/{self.__VERSION}{route}"
+        metric_route = route.split("?")[0]
+        policy = self.__RETRY_POLICY if self.__is_idempotent(method, url) else NO_RETRY
+        deadline = Deadline(self.__DEADLINE_SECONDS)
+
+        retry = 0
+        while True:
+            try:
+                return self.__attempt_request(method, url, metric_route, body, headers, reader, deadline)
+            except RETRYABLE_ERRORS as e:
+                delay = policy.delay(retry, getattr(e, "retry_after", None))
+                remaining = deadline.remaining()
+                if retry + 1 >= policy.max_attempts or (remaining is not None and delay >= remaining):
+                    raise
+                self.__METRICS.increment("funifier_retries_total", route=metric_route, error=type(e).__name__)
+                do_logging(f"Retrying «{metric_route}» in {delay:.2f}s after {type(e).__name__}: {e}")
+                time.sleep(delay)
+                retry += 1
+
+    def __attempt_request(
+            self,
+            method:str,
+            url:str,
+            metric_route:str,
+            body,
+            headers:Dict[str, str],
+            reader:Callable[[BinaryIO], Any],
+            deadline:Deadline
+        )->Any:
+        """
+        Sends the request once and records it in the metrics registry.
+        """
+        timings:Dict[str, float] = {}
+        started_at = time.perf_counter()
+        try:
+            result, status, n_bytes, wire_bytes = self.__send_request(method, url, body, headers, reader, timings, deadline)
+        except FunifierCircuitOpenError:
+            self.__METRICS.increment("funifier_circuit_rejections_total", route=metric_route)
+            raise
+        except Exception as e:
+            self.__METRICS.increment("funifier_request_errors_total", route=metric_route, error=type(e).__name__)
+            raise
+
+        elapsed = time.perf_counter() - started_at
+        self.__record_request(metric_route, status, timings, elapsed,
+                              request_bytes=0 if body is None else len(body),
+                              response_bytes=n_bytes,
+                              wire_bytes=wire_bytes,
+                              rows=count_rows(result))
+        return result
+
+    def __send_request(
+            self,
+            method:str,
+            url:str,
+            body,
+            headers:Dict[str, str],
+            reader:Callable[[BinaryIO], Any],
+            timings:Dict[str, float],
+            deadline:Deadline
+        )->Tuple[Any, Any, int, int]:
+        """
+        Returns the result, the HTTP status (or CACHE_STATUS), the size of the decompressed response body
+        and the number of bytes transferred.
+
+        Raises:
+            FunifierServerError: If the API answers with a status of RETRYABLE_STATUSES.
+            FunifierTimeoutError: If a read timeout or the deadline is hit.
+            FunifierCircuitOpenError: If the circuit breaker of the host is open.
+        """
+        cache_key = self.__cache_key(method, url, body, headers['Range'])
+        if cache_key is not None:
+            data = self.__CACHE.get(cache_key)
+            if data is not None:
+                result, n_bytes = self.__read_body(BytesIO(data), reader, timings, deadline)
+                return result, CACHE_STATUS, n_bytes, 0
+
+        if deadline.expired():
+            raise FunifierTimeoutError(f"The deadline of the request to «{url}» has passed")
+        if not self.__BREAKER.allow_request():
+            raise FunifierCircuitOpenError(
+                f"The circuit breaker of «{self.__BREAKER.host}» is open, "
+                f"the next request is sent in {self.__BREAKER.retry_in():.1f}s")
+
+        read_timeout = deadline.limit(self.__READ_TIMEOUT)
+        data = None
+        status = None
+        try:
+            with self.__POOL.urlopen(method, url, body=body, headers=headers, timings=timings,
+                                     read_timeout=None if read_timeout is None else max(read_timeout, 0.001)) as res:
+                status = res.status
+                if status in RETRYABLE_STATUSES:
+                    raise self.__server_error(res, url)
+
+                wire_stream = ByteCountingReader(res)
+                content_encoding = res.getheader("Content-Encoding")
+                compressed = is_compressed(content_encoding)
+                stream = DecompressingReader(wire_stream, content_encoding) if compressed else wire_stream
+
+                if cache_key is None or not 200 <= status < 300:
+                    # nothing to cache, the body is read straight from the socket
+                    result, n_bytes = self.__read_body(stream, reader, timings, deadline)
+                else:
+                    started_at = time.perf_counter()
+                    data = stream.read()
+                    timings["download"] = time.perf_counter() - started_at
+        except TimeoutError as e:
+            self.__BREAKER.record_failure()
+            raise FunifierTimeoutError(f"The request to «{url}» timed out: {e}") from e
+        except (FunifierServerError, OSError, http.client.HTTPException):
+            self.__BREAKER.record_failure()
+            raise
+        except BaseException:
+            # the host has answered if a status has been read, e.g. with an error message of the API;
+            # an error before, e.g. of a closed pool, is not counted but must not keep the probe
+            if status is not None:
+                self.__BREAKER.record_success()
+            else:
+                self.__BREAKER.release_probe()
+            raise
+        self.__BREAKER.record_success()
+
+        if compressed:
+            # the time of the wrapped reads is split into the transfer and the decompression
+            timings["decompress"] = max(timings["download"] - wire_stream.read_seconds, 0.0)
+            timings["download"] = wire_stream.read_seconds
+
+        if data is None:
+            return result, status, n_bytes, wire_stream.bytes_read
+
+        self.__CACHE.put(cache_key, url, data)
+        result, _ = self.__read_body(BytesIO(data), reader, timings, deadline)
+        return result, status, len(data), wire_stream.bytes_read
+
+    def __server_error(self, res:http.client.HTTPResponse, url:str)->FunifierServerError:
+        retry_after = parse_retry_after(res.getheader("Retry-After"))
+        # the error body is read, so the response is complete
+        res.read()
+        return FunifierServerError(f"The Funifier API answered «{res.status} {res.reason}» to «{url}»",
+                                   status=res.status,
+                                   retry_after=retry_after)
+
+    def __read_body(
+            self,
+            stream:BinaryIO,
+            reader:Callable[[BinaryIO], Any],
+            timings:Dict[str, float],
+            deadline:Deadline
+        )->Tuple[Any, int]:
+        """
+        Returns the parsed body and its size, the time spent reading the stream is added to the
+        phase «download» and the rest to the phase «decode».
+        """
+        counting_stream = ByteCountingReader(DeadlineReader(stream, deadline))
+        started_at = time.perf_counter()
+        if reader is None:
+            result = counting_stream.read().decode(EncodingEnum.UTF8.value)
+        else:
+            result = reader(counting_stream)
+            # consumes trailing whitespace, so the connection can be re-used
+            counting_stream.read()
+        elapsed = time.perf_counter() - started_at
+
+        timings["download"] = timings.get("download", 0.0) + counting_stream.read_seconds
+        timings["decode"] = timings.get("decode", 0.0) + max(elapsed - counting_stream.read_seconds, 0.0)
+        return result, counting_stream.bytes_read
+
     def __GET_request(self, route:str):
         return self.__API_request(method=HTTPmethodsEnum.GET.value,
                                   route=route)
     
-    def __POST_request(self,route:str,body:str):       
+    def __POST_request(self,route:str,body:str,range:str=None,reader:Callable[[BinaryIO], Any]=None):       
         return self.__API_request(method=HTTPmethodsEnum.POST.value,
                                   route=route,
-                                  body=body.encode(EncodingEnum.UTF8.value))
+                                  body=body.encode(EncodingEnum.UTF8.value),
+                                  range=range,
+                                  reader=reader)
+
+    def iter_aggregation_pages(
+            self,
+            route:str,
+            body:str,
+            page_size:int=DEFAULT_PAGE_SIZE,
+            adaptive:bool=True
+        )->Iterator[pd.DataFrame]:
+        """
+        Sends an aggregation pipeline page by page and yields each page as soon as it arrives.
+
+        Args:
+            route (str): The aggregation route, see `common.constants.funifier.routes`.
+            body (str): The aggregation pipeline.
+            page_size (int, optional): The number of items of the first page. Defaults to DEFAULT_PAGE_SIZE.
+            adaptive (bool, optional): Adapts the page size to the observed latency and payload size. Defaults to True.
+
+        Yields:
+            pd.DataFrame: The rows of one page.
+
+        Notes:
+            - The pages are requested with the `Range` header instead of the one of the config.
+            - The pipeline must sort by a unique key, e.g. `{"$sort": {"_id": 1}}` after the `$match`.
+              Without a deterministic order a row may be skipped or returned twice between two pages.
+            - The iteration stops with the first page which has fewer rows than requested.
+            - Only the current page is held in memory, use `pd.concat()` to get all the rows at once.
+        """
+        page_sizer = AdaptivePageSize(initial=page_size) if adaptive else None
+        start = 0
+
+        def read_page(stream:BinaryIO)->Tuple[pd.DataFrame, int]:
+            counting_stream = ByteCountingReader(stream)
+            return self.__get_data(counting_stream), counting_stream.bytes_read
+
+        while True:
+            requested = page_sizer.value if adaptive else page_size
+            started_at = time.perf_counter()
+            data, n_bytes = self.__POST_request(route=route,
+                                                body=body,
+                                                range=range_header(start, requested),
+                                                reader=read_page)
+            elapsed = time.perf_counter() - started_at
+
+            n_rows = 0 if data is None else len(data.index)
+            if n_rows > 0:
+                yield data
+            if n_rows < requested:
+                return
+
+            start += n_rows
+            if adaptive:
+                page_sizer.update(rows=n_rows, seconds=elapsed, n_bytes=n_bytes)
 
     #region lottery
     def count_lottery_participants(self,ticketUID:str)->int:
@@ -145,120 +550,353 @@ class FunifierAPI():
         source: https://docs.google.com/spreadsheets/d/10Khpsyi3JGwoCZp2z_Y-rhBPXS0fH9-3owuDd18Z7aQ/edit
         """
         # do_logging(f"Getting lottery participants for ticket «{ticketUID}»")
-        body = """
-            [
-                {
-                    "$match": {
-                        "type": 2,
-                        "item": "#ticket_uid#"
-                    }
-                },
-                {
-                    "$count": "player"
-                },
-                {
-                    "$project": {
-                        "count": "$player"
-                    }
-                }
-            ]      
-        """.replace(pattern.TICKET,ticketUID)
+        body = pipelines.COUNT_LOTTERY_PARTICIPANTS.bind(ticket_uid=ticketUID)
 
-        api_res = self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body)
-        data = pd.read_json(api_res)
+        data = self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body,reader=self.__get_data)
 
         return self.__get_counts(data)
 
-    def get_lottery_winners_with_address(self,lotteryUID:str, ticketUID:str)->pd.DataFrame:
+    def count_lottery_participants_batch(
+            self,
+            ticketUIDs:List[str],
+            count:ParticipantCountEnum=ParticipantCountEnum.TICKETS
+        )->Dict[str, int]:
+        """
+        Returns the count of the participants of many lottery tickets with one `$group` aggregation.
+
+        Args:
+            ticketUIDs (List[str]): The UIDs of the lottery tickets to count the participants for.
+            count (ParticipantCountEnum, optional): Whether the ticket purchases, like `count_lottery_participants()`,
+                                                    or the distinct players are counted. Defaults to ParticipantCountEnum.TICKETS.
+
+        Returns:
+            Dict[str, int]: The count by ticket UID in the order of the given UIDs, 0 for a ticket without participants.
+
+        Notes:
+            - The pipeline matches all the tickets with `$in` and groups the purchases by ticket,
+              for ParticipantCountEnum.PLAYERS they are grouped by ticket and player first.
+            - The small response is decoded into a dictionary without a DataFrame.
+            - More than TICKETS_PER_REQUEST tickets are split into several aggregations.
+        """
+        counts = dict.fromkeys(ticketUIDs, 0)
+        template = (pipelines.COUNT_DISTINCT_LOTTERY_PARTICIPANTS_BATCH if count == ParticipantCountEnum.PLAYERS
+                    else pipelines.COUNT_LOTTERY_PARTICIPANTS_BATCH)
+
+        for batch in chunk_list(list(counts), TICKETS_PER_REQUEST):
+            body = template.bind(ticket_uids=batch)
+            counts.update(self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body,reader=get_counts_by_id))
+
+        return counts
+
+    def get_lottery_winners_with_address(
+            self,
+            lotteryUID:str,
+            ticketUID:str,
+            join_plan:JoinPlanEnum=JoinPlanEnum.SERVER,
+            columns:Optional[List[str]]=None
+        )->pd.DataFrame:
         """
         Returns all the lottery winners of the given lottery from the Funifier collection "achievement".
 
         Args:
             lotteryUID (str): The UID of the lottery to retrieve the winners for.
             ticketUID (str): The UID of the lottery ticketed corresponding to the lottery UID.
+            join_plan (JoinPlanEnum, optional): Where the winners are joined with their address. Defaults to JoinPlanEnum.SERVER.
+            columns (List[str], optional): The winner and address columns to return, «player» is always returned.
+                                           Defaults to all the columns incl. the «_id» of the achievement.
 
         Returns:
             pd.DataFrame: A Pandas DataFrame containing information about the lottery winners.            
+
+        Notes:
+            - JoinPlanEnum.SERVER runs a correlated `$lookup` sub-pipeline for every winner on Funifier's side.
+            - JoinPlanEnum.CLIENT fetches the winners first, then the addresses of just those players
+              with one `$in` query per batch of players, and joins them locally with a hash join.
+            - The columns are pushed down into the `$group` of the addresses and the `$project` of the
+              winners, so the payload shrinks with every column which is left out.
+
+        Raises:
+            ValueError: If a column is neither a winner nor an address column.
+        """
+        do_logging(f"Getting lottery winners for lottery «{lotteryUID}» ({join_plan} join)")
+        columns = select_columns(columns)
+
+        if join_plan == JoinPlanEnum.CLIENT:
+            return self.__get_lottery_winners_with_address_client_join(lotteryUID, ticketUID, columns)
+
+        body = self.__winners_with_address_body(lotteryUID, ticketUID, columns)
+        return self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body,reader=self.__get_data)
+
+    def __get_lottery_winners_with_address_client_join(
+            self,
+            lotteryUID:str,
+            ticketUID:str,
+            columns:Optional[List[str]]
+        )->pd.DataFrame:
+        body = pipelines.LOTTERY_WINNERS.bind(lottery_uid=lotteryUID)
+        winners = self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body,reader=self.__get_data)
+        if winners is None or len(winners.index) == 0:
+            return winners
+        if columns is not None:
+            winners = winners[[column for column in columns if column in winners.columns]].copy()
+        address_columns = [column for column in ADDRESS_COLUMNS if columns is None or column in columns]
+        if len(address_columns) == 0:
+            return winners
+
+        # build side: the addresses of the winners by player
+        addresses:Dict[str, Dict[str, Any]] = {}
+        address_group = players_address_group(columns)
+        for players in chunk_list(winners[PLAYER_COLUMN].unique().tolist(), PLAYERS_PER_REQUEST):
+            body = pipelines.PLAYERS_ADDRESS.bind(ticket_uid=ticketUID, player_uids=players, address_group=address_group)
+            addresses.update(self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body,reader=self.__get_rows_by_id))
+
+        # probe side: every winner looks up the address of its player
+        no_address:Dict[str, Any] = {}
+        matches = [addresses.get(player, no_address) for player in winners[PLAYER_COLUMN]]
+        for column in address_columns:
+            winners[column] = [match.get(column) for match in matches]
+        return winners
+
+    def get_lottery_winners_with_address_batch(
+            self,
+            lottery_ticket_uids:List[Tuple[str, str]],
+            batch_size:int=DEFAULT_BATCH_SIZE,
+            columns:Optional[List[str]]=None
+        )->pd.DataFrame:
         """
-        do_logging(f"Getting lottery winners for lottery «{lotteryUID}»")
-
-        body = (
-            """
-                [
-                    {
-                        "$match": {
-                        "type": 5,
-                        "item": "#lottery_uid#"
-                        }
-                    },
-                    {
-                        "$lookup": {
-                        "from": "achievement",
-                        "let": {
-                            "playerUID": "$player"
-                        },
-                        "pipeline": [
-                            {
-                            "$match": {
-                                "$expr": {
-                                "$and": [
-                                    { "$eq": ["$type", 2] },
-                                    { "$eq": ["$item", "#ticket_uid#"] },
-                                    { "$eq": ["$player", "$$playerUID"] }
-                                ]
-                                }
-                            }
-                            },
-                            {
-                            "$group": {
-                                "_id": {
-                                    "playerUID": "$player",
-                                    "firstName": "$extra.firstName",
-                                    "lastName": "$extra.lastName",
-                                    "phone": "$extra.phone",
-                                    "dateOfBirth": "$extra.dateOfBirth",
-                                    "street": "$extra.street",
-                                    "city": "$extra.city",
-                                    "zip": "$extra.zip",
-                                    "tos_accepted": "$extra.tos_accepted",
-                                    "privacy_accepted": "$extra.privacy_accepted"
-                                }
-                            }
-                            }
-                        ],
-                        "as": "joinedData"
-                        }
-                    },
-                    {
-                        "$project": {
-                        "player": 1,
-                        "total": 1,
-                        "lotteryUID": "$item",
-                        "time": 1,
-                        "ticketUID": "$extra.ticket",
-                        "firstname": { "$arrayElemAt": ["$joinedData._id.firstName", 0] },
-                        "lastName": { "$arrayElemAt": ["$joinedData._id.lastName", 0] },
-                        "phone": { "$arrayElemAt": ["$joinedData._id.phone", 0] },
-                        "dateOfBirth": { "$arrayElemAt": ["$joinedData._id.dateOfBirth", 0] },
-                        "street": { "$arrayElemAt": ["$joinedData._id.street", 0] },
-                        "city": { "$arrayElemAt": ["$joinedData._id.city", 0] },
-                        "zip": { "$arrayElemAt": ["$joinedData._id.zip", 0] },
-                        "tos_accepted": { "$arrayElemAt": ["$joinedData._id.tos_accepted", 0] },
-                        "privacy_accepted": { "$arrayElemAt": ["$joinedData._id.privacy_accepted", 0] }
-                        }
-                    }
-                ]
-            """
-            .replace(pattern.LOTTERY,lotteryUID)
-            .replace(pattern.TICKET,ticketUID)
+        Returns the lottery winners of many lotteries with one aggregation per batch of lotteries.
+
+        Args:
+            lottery_ticket_uids (List[Tuple[str, str]]): The pairs of lottery UID and corresponding lottery ticket UID.
+            batch_size (int, optional): The maximum number of lotteries per aggregation. Defaults to DEFAULT_BATCH_SIZE.
+            columns (List[str], optional): The columns to return, «player» and «lotteryUID» are always returned.
+                                           Defaults to all the columns.
+
+        Returns:
+            pd.DataFrame: The lottery winners of all the lotteries sorted by the column «lotteryUID», with the
+                          same columns as `get_lottery_winners_with_address()`.
+
+        Raises:
+            ValueError: If the same lottery UID is given with different ticket UIDs or a column is unknown.
+
+        Notes:
+            - The pipeline matches all the lotteries of a batch with `$in` and looks up the ticket of each winner
+              by the position of its lottery in the batch.
+            - Duplicated pairs are requested only once.
+        """
+        ticket_by_lottery:Dict[str, str] = {}
+        for lotteryUID, ticketUID in lottery_ticket_uids:
+            if ticket_by_lottery.setdefault(lotteryUID, ticketUID) != ticketUID:
+                raise ValueError(f"The lottery «{lotteryUID}» is given with more than one ticket UID")
+
+        do_logging(f"Getting lottery winners for {len(ticket_by_lottery)} lotteries")
+        columns = select_columns(columns, required=(PLAYER_COLUMN, "lotteryUID"))
+
+        frames = []
+        for batch in chunk_list(list(ticket_by_lottery.items()), batch_size):
+            body = self.__winners_with_address_batch_body(
+                lotteryUIDs=[lotteryUID for lotteryUID, _ in batch],
+                ticketUIDs=[ticketUID for _, ticketUID in batch],
+                columns=columns)
+            data = self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body,reader=self.__get_data)
+            if data is not None and len(data.index) > 0:
+                frames.append(data)
+
+        if len(frames) == 0:
+            return pd.DataFrame()
+
+        return (
+            pd.concat(frames, ignore_index=True)
+              .sort_values("lotteryUID", kind="stable", ignore_index=True)
         )
-        
-        api_res = self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body)
-        return self.__get_data(api_res)
+
+    def iter_lottery_winners_with_address(
+            self,
+            lotteryUID:str,
+            ticketUID:str,
+            page_size:int=DEFAULT_PAGE_SIZE,
+            columns:Optional[List[str]]=None
+        )->Iterator[pd.DataFrame]:
+        """
+        Yields the lottery winners of the given lottery page by page, see `get_lottery_winners_with_address()`.
+
+        Args:
+            lotteryUID (str): The UID of the lottery to retrieve the winners for.
+            ticketUID (str): The UID of the lottery ticketed corresponding to the lottery UID.
+            page_size (int, optional): The number of winners of the first page. Defaults to DEFAULT_PAGE_SIZE.
+            columns (List[str], optional): The columns to return, «player» is always returned. Defaults to all the columns.
+
+        Yields:
+            pd.DataFrame: The lottery winners of one page.
+        """
+        do_logging(f"Iterating lottery winners for lottery «{lotteryUID}»")
+
+        body = self.__winners_with_address_body(lotteryUID, ticketUID, select_columns(columns))
+        yield from self.iter_aggregation_pages(route=routes.DB_ACHIEVEMENT_AGGR, body=body, page_size=page_size)
+
+    def sync_lottery_winners_with_address(
+            self,
+            lotteryUID:str,
+            ticketUID:str,
+            store:IncrementalSyncStore,
+            columns:Optional[List[str]]=None
+        )->pd.DataFrame:
+        """
+        Returns the lottery winners of the given lottery like `get_lottery_winners_with_address()`, but only
+        the winners since the last sync are fetched and merged into the rows of the store.
+
+        Args:
+            lotteryUID (str): The UID of the lottery to retrieve the winners for.
+            ticketUID (str): The UID of the lottery ticketed corresponding to the lottery UID.
+            store (IncrementalSyncStore): The store of the rows and the `time` watermark.
+            columns (List[str], optional): The columns to return, «player» and «time» are always returned.
+                                           Defaults to all the columns.
+
+        Returns:
+            pd.DataFrame: All the lottery winners synced so far, one row per player.
+
+        Notes:
+            - The first sync fetches all the winners, every further one the winners with a `time`
+              at or after the watermark. The winners at the watermark itself are fetched again
+              and replace their stored row, so no winner of the same millisecond is lost.
+            - Every selection of columns is synced as a result set of its own, so the stored rows always
+              have the selected columns.
+            - Use `store.clear()` with the same columns to fetch all the winners again.
+        """
+        columns = select_columns(columns, required=(PLAYER_COLUMN, "time"))
+        state = store.load(SyncKindEnum.WINNERS, lotteryUID, ticketUID, columns)
+        do_logging(f"Syncing lottery winners for lottery «{lotteryUID}» since {state.watermark}")
+
+        body = pipelines.LOTTERY_WINNERS_WITH_ADDRESS_SINCE.bind(lottery_uid=lotteryUID,
+                                                                 ticket_uid=ticketUID,
+                                                                 since=state.watermark,
+                                                                 address_group_id=address_group_id(columns),
+                                                                 projection=winners_with_address_projection(columns))
+        return self.__sync(store, state, body)
+
+    def sync_lottery_participants(
+            self,
+            ticketUID:str,
+            store:IncrementalSyncStore
+        )->pd.DataFrame:
+        """
+        Returns the participants of the given lottery ticket with their address, only the ticket
+        purchases since the last sync are fetched and merged into the rows of the store.
+
+        Args:
+            ticketUID (str): The UID of the lottery ticket to retrieve the participants for.
+            store (IncrementalSyncStore): The store of the rows and the `time` watermark.
+
+        Returns:
+            pd.DataFrame: All the participants synced so far, one row per player with their latest purchase.
+        """
+        state = store.load(SyncKindEnum.PARTICIPANTS, None, ticketUID)
+        do_logging(f"Syncing lottery participants for ticket «{ticketUID}» since {state.watermark}")
+
+        body = pipelines.LOTTERY_PARTICIPANTS_SINCE.bind(ticket_uid=ticketUID, since=state.watermark)
+        return self.__sync(store, state, body)
+
+    def snapshot_lottery(
+            self,
+            lotteryUID:str,
+            ticketUID:str,
+            store:AchievementSnapshotStore,
+            page_size:int=DEFAULT_PAGE_SIZE
+        )->Dict[str, int]:
+        """
+        Writes the winners (type 5) of the lottery and the ticket purchases (type 2) of the lottery ticket
+        page by page into the snapshot store, which answers the queries afterwards without the API.
+
+        Args:
+            lotteryUID (str): The UID of the lottery to snapshot the winners for.
+            ticketUID (str): The UID of the lottery ticketed corresponding to the lottery UID.
+            store (AchievementSnapshotStore): The store of the Arrow IPC files.
+            page_size (int, optional): The number of rows of the first page. Defaults to DEFAULT_PAGE_SIZE.
+
+        Returns:
+            Dict[str, int]: The number of rows written per partition, i.e. «winners» and «participants».
+
+        Notes:
+            - The partitions of the lottery and the ticket are replaced, not appended to.
+            - Only one page is held in memory at a time.
+        """
+        do_logging(f"Snapshotting lottery «{lotteryUID}» and ticket «{ticketUID}»")
+
+        partitions = {
+            "winners": (AchievementTypeEnum.LOTTERY_WIN, lotteryUID,
+                        pipelines.LOTTERY_WINNERS.bind(lottery_uid=lotteryUID)),
+            "participants": (AchievementTypeEnum.TICKET_PURCHASE, ticketUID,
+                             pipelines.LOTTERY_PARTICIPANTS_SINCE.bind(ticket_uid=ticketUID, since=EPOCH)),
+        }
+        n_rows = {}
+        for name, (achievement_type, item, body) in partitions.items():
+            store.clear(achievement_type, item)
+            n_rows[name] = 0
+            for page in self.iter_aggregation_pages(route=routes.DB_ACHIEVEMENT_AGGR, body=body, page_size=page_size):
+                store.append(achievement_type, item, page)
+                n_rows[name] += len(page.index)
+            self.__METRICS.increment("funifier_snapshot_rows_total", n_rows[name], type=str(achievement_type.value))
+        return n_rows
+
+    def __sync(self, store:IncrementalSyncStore, state:SyncState, body:str)->pd.DataFrame:
+        new_rows = self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body,reader=self.__get_data)
+        state = store.merge(state, new_rows)
+        store.save(state)
+        self.__METRICS.increment("funifier_sync_rows_total",
+                                 0 if new_rows is None else len(new_rows.index),
+                                 kind=state.kind.value)
+        return state.rows
+
+    def __winners_with_address_body(self, lotteryUID:str, ticketUID:str, columns:Optional[List[str]]=None)->str:
+        return pipelines.LOTTERY_WINNERS_WITH_ADDRESS.bind(lottery_uid=lotteryUID,
+                                                           ticket_uid=ticketUID,
+                                                           address_group_id=address_group_id(columns),
+                                                           projection=winners_with_address_projection(columns))
+
+    def __winners_with_address_batch_body(
+            self,
+            lotteryUIDs:List[str],
+            ticketUIDs:List[str],
+            columns:Optional[List[str]]=None
+        )->str:
+        return pipelines.LOTTERY_WINNERS_WITH_ADDRESS_BATCH.bind(lottery_uids=lotteryUIDs,
+                                                                 ticket_uids=ticketUIDs,
+                                                                 address_group_id=address_group_id(columns),
+                                                                 projection=winners_with_address_projection(columns))
 
     #endregion
 
     #region helper methods
+    def __create_cache(
+            self,
+            config:APIConfigsDTO,
+            cache_size:int,
+            cache_dir:Optional[str]
+        )->Optional[ResponseCache]:
+        if config.settings is None or not config.settings.expiration_time:
+            return None
+        return ResponseCache(ttl_seconds=config.settings.expiration_time,
+                             max_entries=cache_size,
+                             cache_dir=cache_dir)
+
+    def __is_idempotent(self, method:str, url:str)->bool:
+        """
+        Returns whether the request may be sent more than once, i.e. a GET or an aggregation.
+        """
+        return method == HTTPmethodsEnum.GET.value or "/aggregate" in url
+
+    def __cache_key(self, method:str, url:str, body:Optional[bytes], range:Optional[str])->Optional[str]:
+        """
+        Returns the cache key of a request or None if the request must not be cached.
+        Only the aggregation calls are cached since they are read-only.
+        """
+        if self.__CACHE is None or method != HTTPmethodsEnum.POST.value or "/aggregate" not in url:
+            return None
+        return make_cache_key(route=url,
+                              body=None if body is None else body.decode(EncodingEnum.UTF8.value),
+                              credentials=f"{self.__URL}:{self.__API_KEY}:{self.__APP_SECRET}",
+                              range=range)
+
     def __define_time_range(
             self,
             from_date:str,
@@ -344,58 +982,60 @@ class FunifierAPI():
                        .replace(pattern.N_DAYS,str_n_days)
             )
 
-    def __get_counts(self,data:pd.DataFrame)->int:
-        """
-        Extracts the count from a Pandas DataFrame and returns 0 if empty.
-
-        Args:
-            data (pd.DataFrame): The Pandas DataFrame containing the count.
+    def __record_request(
+            self,
+            route:str,
+            status:Any,
+            timings:Dict[str, float],
+            elapsed:float,
+            request_bytes:int,
+            response_bytes:int,
+            wire_bytes:int,
+            rows:int
+        )->None:
+        metrics = self.__METRICS
+        if status == CACHE_STATUS:
+            metrics.observe("funifier_request_seconds", elapsed, route=route, phase="cache")
+        else:
+            for phase, seconds in timings.items():
+                # a re-used connection has neither a connect nor a TLS handshake
+                if phase in ("connect", "tls") and seconds == 0:
+                    continue
+                metrics.observe("funifier_request_seconds", seconds, route=route, phase=phase)
+            metrics.observe("funifier_request_seconds", elapsed, route=route, phase="total")
 
-        Returns:
-            int: The count extracted from the DataFrame.
+        metrics.increment("funifier_requests_total", route=route, status=status)
+        metrics.increment("funifier_request_bytes_total", request_bytes, route=route)
+        metrics.increment("funifier_response_bytes_total", response_bytes, route=route)
+        metrics.increment("funifier_response_wire_bytes_total", wire_bytes, route=route)
+        metrics.increment("funifier_response_rows_total", rows, route=route)
 
-        Notes:
-            - This method checks if the DataFrame is not empty using the `len()` function.
-            - If the DataFrame is not empty, it extracts the count from the "count" column using the `data["count"]` syntax.
-            - The count is returned as an integer using the `int()` function.
-            - If the DataFrame is empty, it returns 0.
+    def __get_counts(self,data:pd.DataFrame)->int:
         """
-        if len(data.index) > 0:
-            return int(data["count"])
-        else:
-            return 0
-
-    def __get_data(self, api_result:str)->pd.DataFrame:
+        Extracts the count from a Pandas DataFrame, see `funifier_response_helper.get_counts()`.
         """
-        Extracts the data from the result of a Funifier API call and returns it as a Pandas DataFrame.
-
-        Args:
-            api_result (str): The result of the Funifier API call as a string.
+        return get_counts(data)
 
-        Returns:
-            pd.DataFrame: The extracted data as a Pandas DataFrame.
+    def __get_rows_by_id(self, stream:BinaryIO)->Dict[Any, Dict[str, Any]]:
+        """
+        Decodes the response body of a `$group` aggregation into a dictionary of the rows by their `_id`.
 
         Raises:
             FunifierAPIError: If the API response has an error code other than 200.
-
-        Notes:
-            - This method uses the `pd.read_json()` method to read the API result string as a JSON object and convert it to a Pandas DataFrame.
-            - If the API result string cannot be read as a JSON object, it is assumed to be an APIResponseDTO object and is parsed accordingly.
-            - If the API response has an error code other than 200, a FunifierAPIError is raised with the error message from the API response.
-            - If any other exception occurs during the transformation of the Pandas DataFrame, it is logged and re-raised.
         """
-        try:
-            data = pd.read_json(StringIO(api_result))
-            return data
-        except ValueError:
-            json_str = json.loads(api_result)
-            api_dto = APIResponseDTO.from_dict(json_str)
-
+        reader = JSONArrayReader(stream.read)
+        if not reader.is_array:
+            api_dto = APIResponseDTO.from_dict(reader.read_value())
             if api_dto.errorCode != 200:
                 raise FunifierAPIError(api_dto.errorMessage)
-        except Exception as e:
-            logging.exception(f"error while transforming pandas dataframe. «{e}»")
-            raise e
+            return {}
+        return {row.pop("_id"): row for row in reader}
+
+    def __get_data(self, stream:BinaryIO)->pd.DataFrame:
+        """
+        Decodes the response body of a Funifier API call while it is read, see `funifier_response_helper.get_data()`.
+        """
+        return get_data(stream)
     #endregion
 
     #region unittest
@@ -0,0 +1,523 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""an asyncio helper class which connects to the funifier API.\n
+
+The AsyncFunifierAPI has the same surface as the FunifierAPI but all the
+methods are coroutines, so the calls for many lotteries can run at the same
+time. The SyncFunifierAPI is a blocking facade which runs the coroutines on
+a private event loop.
+
+Example:
+    async with AsyncFunifierAPI(config, max_concurrency=8) as api:
+        counts = await asyncio.gather(
+            *[api.count_lottery_participants(ticketUID=uid) for uid in ticket_uids])
+
+source: https://api.funifier.com/
+"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##* 2026-10-18          bettlerd    decodes the response bytes with the streaming decoder
+##* 2026-10-18          bettlerd    bind the compiled pipeline templates instead of str.replace()
+##* 2026-10-18          bettlerd    added count_lottery_participants_batch()
+##* 2026-10-18          bettlerd    added the column selection of get_lottery_winners_with_address()
+##* 2026-10-18          bettlerd    scheme of the url, status codes, read timeout, retries and circuit
+##*                                 breaker like the FunifierAPI
+##* 2026-10-18          bettlerd    a failed connect is counted by the circuit breaker, an aborted
+##*                                 request releases the probe
+##*
+##*
+
+import asyncio
+import base64
+import http.client
+import ssl
+import threading
+from io import BytesIO
+from typing import Any, Awaitable, Coroutine, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from common.enums.common.encoding import EncodingEnum
+from common.enums.common.http_methods import HTTPmethodsEnum
+from common.enums.funifier.participant_count import ParticipantCountEnum
+from common.exceptions.funifier.api_error import (
+    FunifierAPIError, FunifierCircuitOpenError, FunifierServerError, FunifierTimeoutError
+)
+from common.helper.funifier_response_helper import get_counts, get_counts_by_id, get_data
+from common.helper.list_helper import chunk_list
+from common.helper.projection_helper import address_group_id, select_columns, winners_with_address_projection
+from common.helper.logging_helper import do_logging
+from common.helper.retry_helper import RetryPolicy, parse_retry_after, NO_RETRY, RETRYABLE_STATUSES
+from common.service.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from common.service.connection_pool import split_scheme
+from domain_objects.dto.common.api_config_dto import APIConfigsDTO
+import common.constants.funifier.pipelines as pipelines
+import common.constants.funifier.routes as routes
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_READ_TIMEOUT = 120.0
+TICKETS_PER_REQUEST = 1000
+HTTPS_PORT = 443
+HTTP_PORT = 80
+READ_CHUNK_SIZE = 64 * 1024
+CRLF = b"\r\n"
+# statuses without a response body
+NO_BODY_STATUSES = (204, 304)
+
+# errors raised by a re-used connection whose socket has been closed by the server
+STALE_CONNECTION_ERRORS = (
+    ConnectionError,
+    asyncio.IncompleteReadError,
+    ssl.SSLEOFError,
+)
+
+# errors after which an idempotent call is sent once more, like RETRYABLE_ERRORS of the FunifierAPI
+RETRYABLE_ERRORS = (
+    FunifierServerError,
+    FunifierTimeoutError,
+    OSError,
+    asyncio.IncompleteReadError,
+    http.client.HTTPException,
+)
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class AsyncFunifierAPI():
+    """
+    Gives asynchronous access to the Funifier API
+
+    At most `max_concurrency` requests are in flight at the same time; their
+    keep-alive connections are re-used by the following requests. An instance
+    is bound to the event loop it is first used in.
+
+    source: https://api.funifier.com/
+    """
+
+    def __init__(
+            self,
+            config:APIConfigsDTO,
+            max_concurrency:int=DEFAULT_MAX_CONCURRENCY,
+            ssl_context:Optional[ssl.SSLContext]=None,
+            read_timeout:Optional[float]=DEFAULT_READ_TIMEOUT,
+            retry_policy:Optional[RetryPolicy]=None,
+            circuit_breaker:Optional[CircuitBreaker]=None
+        ):
+        """
+        Args:
+            config (APIConfigsDTO): The credentials, url, version and header of the API, a url with «http://» connects without TLS.
+            max_concurrency (int, optional): The maximum number of requests in flight. Defaults to DEFAULT_MAX_CONCURRENCY.
+            ssl_context (ssl.SSLContext, optional): The TLS context of the connections. Defaults to `ssl.create_default_context()`.
+            read_timeout (float, optional): The seconds the connect and every read of a response may take. Defaults to DEFAULT_READ_TIMEOUT.
+            retry_policy (RetryPolicy, optional): The backoff of the idempotent calls. Defaults to `RetryPolicy()`.
+            circuit_breaker (CircuitBreaker, optional): Defaults to the breaker of the host shared with the FunifierAPI.
+        """
+        do_logging("Initializing async Funifier API")
+        if max_concurrency < 1:
+            raise ValueError(f"The concurrency limit must be at least 1 but is {max_concurrency}")
+
+        self.__API_KEY = config.api_key
+        self.__APP_SECRET = config.app_secret
+        host, use_tls = split_scheme(config.url)
+        self.__HOST_HEADER = host
+        self.__HOST, self.__PORT = self.__split_port(host, HTTPS_PORT if use_tls else HTTP_PORT)
+        self.__VERSION = config.version
+        self.__HEADER = config.header
+        self.__SSL = (ssl_context or ssl.create_default_context()) if use_tls else None
+        self.__READ_TIMEOUT = read_timeout
+        self.__RETRY_POLICY = retry_policy or RetryPolicy()
+        self.__BREAKER = circuit_breaker or get_circuit_breaker(host)
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+        self.__idle:List[Connection] = []
+
+    async def __aenter__(self)->'AsyncFunifierAPI':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback)->None:
+        await self.close()
+
+    async def close(self)->None:
+        """
+        Closes all the idle connections to the Funifier API.
+        """
+        idle, self.__idle = self.__idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+    async def __API_request(self, method:str, route:str, body:bytes=None, range:str=None)->bytes:
+        """
+        Sends the request and returns the response body, an idempotent call is retried like in
+        `FunifierAPI.__API_request()` but waits with `asyncio.sleep()`.
+
+        Raises:
+            FunifierServerError: If the API still answers with 429 or 5xx after the last attempt.
+            FunifierTimeoutError: If the API does not answer in time.
+            FunifierCircuitOpenError: If the circuit breaker of the host is open.
+            FunifierAPIError: If the API answers with another status which is not 2xx.
+        """
+        headers = {
+          'Content-Type': self.__HEADER.content_type,
+          'Authorization': 'Basic {}'.format(
+            base64.b64encode(bytes(f'{self.__API_KEY}:{self.__APP_SECRET}',
+                                   EncodingEnum.UTF8.value))
+                  .decode(EncodingEnum.ASCII.value)),
+          'Range': range or self.__HEADER.range
+        }
+        path = f"/{self.__VERSION}{route}"
+        policy = self.__RETRY_POLICY if self.__is_idempotent(method, path) else NO_RETRY
+
+        retry = 0
+        while True:
+            try:
+                return await self.__send_request(method, path, body, headers)
+            except RETRYABLE_ERRORS as e:
+                if retry + 1 >= policy.max_attempts:
+                    raise
+                delay = policy.delay(retry, getattr(e, "retry_after", None))
+                do_logging(f"Retrying «{route.split('?')[0]}» in {delay:.2f}s after {type(e).__name__}: {e}")
+                await asyncio.sleep(delay)
+                retry += 1
+
+    async def __send_request(self, method:str, path:str, body:Optional[bytes], headers:Dict[str, str])->bytes:
+        """
+        Sends the request once on an idle or a new connection and records the outcome in the circuit breaker.
+        """
+        if not self.__BREAKER.allow_request():
+            raise FunifierCircuitOpenError(
+                f"The circuit breaker of «{self.__BREAKER.host}» is open, "
+                f"the next request is sent in {self.__BREAKER.retry_in():.1f}s")
+
+        connection = None
+        try:
+            async with self.__semaphore:
+                connection, reused = await self.__acquire()
+                try:
+                    status, reason, response_headers, keep_alive, data = await self.__exchange(
+                        connection, method, path, body, headers)
+                except STALE_CONNECTION_ERRORS:
+                    if not reused:
+                        raise
+                    connection[1].close()
+                    connection = await self.__connect()
+                    status, reason, response_headers, keep_alive, data = await self.__exchange(
+                        connection, method, path, body, headers)
+
+                if keep_alive:
+                    self.__idle.append(connection)
+                else:
+                    connection[1].close()
+        except (asyncio.TimeoutError, TimeoutError) as e:
+            self.__close(connection)
+            self.__BREAKER.record_failure()
+            raise FunifierTimeoutError(f"The request to «{path}» timed out after {self.__READ_TIMEOUT}s") from e
+        except (OSError, asyncio.IncompleteReadError, http.client.HTTPException):
+            self.__close(connection)
+            self.__BREAKER.record_failure()
+            raise
+        except BaseException:
+            # e.g. a cancelled task, the host is not to blame but the probe of a half-open breaker ends
+            self.__close(connection)
+            self.__BREAKER.release_probe()
+            raise
+
+        message = f"The Funifier API answered «{status} {reason}» to «{path}»"
+        if status in RETRYABLE_STATUSES:
+            self.__BREAKER.record_failure()
+            raise FunifierServerError(message,
+                                      status=status,
+                                      retry_after=parse_retry_after(response_headers.get("retry-after")))
+        # the host has answered, even if it is with an error of the API
+        self.__BREAKER.record_success()
+        if not 200 <= status < 300:
+            raise FunifierAPIError(message)
+        return data
+
+    async def __POST_request(self, route:str, body:str, range:str=None)->bytes:
+        return await self.__API_request(method=HTTPmethodsEnum.POST.value,
+                                        route=route,
+                                        body=body.encode(EncodingEnum.UTF8.value),
+                                        range=range)
+
+    #region lottery
+    async def count_lottery_participants(self, ticketUID:str)->int:
+        """
+        Returns the count of all the participants of the given lottery ticket, see `FunifierAPI.count_lottery_participants()`.
+
+        Args:
+            ticketUID (str): The UID of the lottery ticket to count the participants for.
+
+        Returns:
+            int: The count of the lottery participants.
+        """
+        body = pipelines.COUNT_LOTTERY_PARTICIPANTS.bind(ticket_uid=ticketUID)
+
+        api_res = await self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body)
+        data = await asyncio.to_thread(get_data, BytesIO(api_res))
+
+        return get_counts(data)
+
+    async def count_lottery_participants_batch(
+            self,
+            ticketUIDs:List[str],
+            count:ParticipantCountEnum=ParticipantCountEnum.TICKETS
+        )->Dict[str, int]:
+        """
+        Returns the count of the participants of many lottery tickets, see `FunifierAPI.count_lottery_participants_batch()`.
+        The aggregations of more than TICKETS_PER_REQUEST tickets run at the same time.
+        """
+        counts = dict.fromkeys(ticketUIDs, 0)
+        template = (pipelines.COUNT_DISTINCT_LOTTERY_PARTICIPANTS_BATCH if count == ParticipantCountEnum.PLAYERS
+                    else pipelines.COUNT_LOTTERY_PARTICIPANTS_BATCH)
+
+        responses = await asyncio.gather(*[
+            self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR, body=template.bind(ticket_uids=batch))
+            for batch in chunk_list(list(counts), TICKETS_PER_REQUEST)])
+        for api_res in responses:
+            counts.update(get_counts_by_id(BytesIO(api_res)))
+
+        return counts
+
+    async def get_lottery_winners_with_address(
+            self,
+            lotteryUID:str,
+            ticketUID:str,
+            columns:Optional[List[str]]=None
+        )->pd.DataFrame:
+        """
+        Returns all the lottery winners of the given lottery, see `FunifierAPI.get_lottery_winners_with_address()`.
+
+        Args:
+            lotteryUID (str): The UID of the lottery to retrieve the winners for.
+            ticketUID (str): The UID of the lottery ticketed corresponding to the lottery UID.
+            columns (List[str], optional): The columns to return, «player» is always returned. Defaults to all the columns.
+
+        Returns:
+            pd.DataFrame: A Pandas DataFrame containing information about the lottery winners.
+        """
+        do_logging(f"Getting lottery winners for lottery «{lotteryUID}»")
+
+        columns = select_columns(columns)
+        body = pipelines.LOTTERY_WINNERS_WITH_ADDRESS.bind(lottery_uid=lotteryUID,
+                                                           ticket_uid=ticketUID,
+                                                           address_group_id=address_group_id(columns),
+                                                           projection=winners_with_address_projection(columns))
+
+        api_res = await self.__POST_request(route=routes.DB_ACHIEVEMENT_AGGR,body=body)
+        # parsing is CPU bound, it must not block the other downloads
+        return await asyncio.to_thread(get_data, BytesIO(api_res))
+    #endregion
+
+    #region helper methods
+    def __split_port(self, host:str, default_port:int)->Tuple[str, int]:
+        name, separator, port = host.rpartition(":")
+        if separator and port.isdigit():
+            return name, int(port)
+        return host, default_port
+
+    def __is_idempotent(self, method:str, path:str)->bool:
+        """
+        Returns whether the request may be sent more than once, i.e. a GET or an aggregation.
+        """
+        return method == HTTPmethodsEnum.GET.value or "/aggregate" in path
+
+    async def __read(self, awaitable:Awaitable[Any])->Any:
+        """
+        Awaits a connect or a read of the socket, at most `read_timeout` seconds.
+        """
+        return await asyncio.wait_for(awaitable, self.__READ_TIMEOUT)
+
+    def __close(self, connection:Optional[Connection])->None:
+        if connection is not None:
+            connection[1].close()
+
+    async def __connect(self)->Connection:
+        return await self.__read(asyncio.open_connection(self.__HOST, self.__PORT, ssl=self.__SSL))
+
+    async def __acquire(self)->Tuple[Connection, bool]:
+        while self.__idle:
+            reader, writer = self.__idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return (reader, writer), True
+            writer.close()
+        return await self.__connect(), False
+
+    async def __exchange(
+            self,
+            connection:Connection,
+            method:str,
+            path:str,
+            body:Optional[bytes],
+            headers:Dict[str, str]
+        )->Tuple[int, str, Dict[str, str], bool, bytes]:
+        """
+        Sends one HTTP/1.1 request and reads its response.
+
+        Returns:
+            Tuple[int, str, Dict[str, str], bool, bytes]: The status, the reason, the headers in lower case,
+                                                          whether the connection can be kept alive and the
+                                                          response body.
+
+        Raises:
+            http.client.BadStatusLine: If the status line is no HTTP status line.
+        """
+        reader, writer = connection
+        body = body or b""
+
+        head = [f"{method} {path} HTTP/1.1", f"Host: {self.__HOST_HEADER}", f"Content-Length: {len(body)}"]
+        head += [f"{name}: {value}" for name, value in headers.items() if value is not None]
+        writer.write("\r\n".join(head).encode(EncodingEnum.LATIN1.value) + CRLF + CRLF + body)
+        await writer.drain()
+
+        status_line = await self.__read(reader.readline())
+        if not status_line:
+            raise ConnectionResetError("The server closed the connection without a response")
+        version, _, status_reason = status_line.decode(EncodingEnum.LATIN1.value).strip().partition(" ")
+        status, _, reason = status_reason.partition(" ")
+        if not version.startswith("HTTP/") or not status.isdigit():
+            raise http.client.BadStatusLine(status_line.decode(EncodingEnum.LATIN1.value).strip())
+
+        response_headers = {}
+        while True:
+            line = await self.__read(reader.readline())
+            if line in (CRLF, b"\n", b""):
+                break
+            name, _, value = line.decode(EncodingEnum.LATIN1.value).partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        keep_alive = response_headers.get("connection", "").lower() != "close"
+
+        if int(status) in NO_BODY_STATUSES:
+            data = b""
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self.__read_chunked(reader)
+        elif "content-length" in response_headers:
+            data = await self.__read(reader.readexactly(int(response_headers["content-length"])))
+        else:
+            # the body ends with the connection, every read is limited by the read timeout
+            chunks = []
+            while chunk := await self.__read(reader.read(READ_CHUNK_SIZE)):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+            keep_alive = False
+
+        return int(status), reason, response_headers, keep_alive, data
+
+    async def __read_chunked(self, reader:asyncio.StreamReader)->bytes:
+        chunks = []
+        while True:
+            size_line = await self.__read(reader.readline())
+            size = int(size_line.split(b";")[0].strip(), 16)
+            if size == 0:
+                # skips the trailers
+                while (await self.__read(reader.readline())) not in (CRLF, b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self.__read(reader.readexactly(size)))
+            await self.__read(reader.readexactly(len(CRLF)))
+    #endregion
+
+
+class SyncFunifierAPI():
+    """
+    Blocking facade of the AsyncFunifierAPI with the surface of the FunifierAPI.
+
+    The coroutines run on a private event loop in a background thread, so the
+    facade can be used from synchronous code like the Streamlit app.
+
+    Example:
+        api = SyncFunifierAPI(config)
+        counts = api.run_all(
+            api.async_api.count_lottery_participants(ticketUID=uid) for uid in ticket_uids)
+        api.close()
+    """
+
+    def __init__(
+            self,
+            config:APIConfigsDTO,
+            max_concurrency:int=DEFAULT_MAX_CONCURRENCY,
+            ssl_context:Optional[ssl.SSLContext]=None,
+            read_timeout:Optional[float]=DEFAULT_READ_TIMEOUT,
+            retry_policy:Optional[RetryPolicy]=None,
+            circuit_breaker:Optional[CircuitBreaker]=None
+        ):
+        self.__loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(target=self.__loop.run_forever,
+                                         name="funifier-api-loop",
+                                         daemon=True)
+        self.__thread.start()
+        self.__API = AsyncFunifierAPI(config=config,
+                                      max_concurrency=max_concurrency,
+                                      ssl_context=ssl_context,
+                                      read_timeout=read_timeout,
+                                      retry_policy=retry_policy,
+                                      circuit_breaker=circuit_breaker)
+
+    def __enter__(self)->'SyncFunifierAPI':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback)->None:
+        self.close()
+
+    @property
+    def async_api(self)->AsyncFunifierAPI:
+        return self.__API
+
+    def run(self, coroutine:Coroutine)->Any:
+        """
+        Runs a coroutine on the event loop of the facade and returns its result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.__loop).result()
+
+    def run_all(self, coroutines:Iterable[Coroutine])->List[Any]:
+        """
+        Runs the coroutines concurrently and returns their results in the same order.
+        """
+        async def gather(coroutines:List[Coroutine])->List[Any]:
+            return await asyncio.gather(*coroutines)
+
+        return self.run(gather(list(coroutines)))
+
+    def close(self)->None:
+        """
+        Closes the connections and stops the event loop of the facade.
+        """
+        if self.__loop.is_closed():
+            return
+        self.run(self.__API.close())
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+        self.__loop.close()
+
+    #region lottery
+    def count_lottery_participants(self, ticketUID:str)->int:
+        return self.run(self.__API.count_lottery_participants(ticketUID=ticketUID))
+
+    def count_lottery_participants_batch(
+            self,
+            ticketUIDs:List[str],
+            count:ParticipantCountEnum=ParticipantCountEnum.TICKETS
+        )->Dict[str, int]:
+        return self.run(self.__API.count_lottery_participants_batch(ticketUIDs=ticketUIDs, count=count))
+
+    def get_lottery_winners_with_address(
+            self,
+            lotteryUID:str,
+            ticketUID:str,
+            columns:Optional[List[str]]=None
+        )->pd.DataFrame:
+        return self.run(self.__API.get_lottery_winners_with_address(lotteryUID=lotteryUID,
+                                                                    ticketUID=ticketUID,
+                                                                    columns=columns))
+    #endregion
@@ -0,0 +1,265 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""runs the lotteries of a manifest in a process or thread pool.\n
+
+Every lottery is fetched with `FunifierAPI.get_lottery_winners_with_address()`
+and exported to its own file in the output directory. A lottery which fails
+is reported in its LotteryResult, the other lotteries of the batch go on.
+The winners of all the lotteries are exported once more to a combined file.
+
+With ExecutorKindEnum.PROCESS every worker process creates its own
+FunifierAPI, so the parsing of the responses runs in parallel. With
+ExecutorKindEnum.THREAD the workers share one FunifierAPI with a connection
+per worker.
+
+Example:
+    options = BatchOptions(config, output_dir="out")
+    results = run_batch(read_manifest("lotteries.csv"), options, max_workers=4)
+    write_combined(results, options)
+"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##*
+##*
+
+import functools
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote
+
+import pandas as pd
+
+from common.enums.common.executor_kind import ExecutorKindEnum
+from common.enums.common.export_format import ExportFormatEnum
+from common.enums.funifier.join_plan import JoinPlanEnum
+from common.helper.export_helper import export_dataframe
+from common.helper.manifest_helper import ManifestEntry
+from common.service.api_funifier_service import FunifierAPI
+from domain_objects.dto.common.api_config_dto import APIConfigsDTO
+
+DEFAULT_MAX_WORKERS = 4
+COMBINED_FILE_NAME = "combined"
+LOTTERY_COLUMN = "lotteryUID"
+
+
+@dataclass
+class BatchOptions():
+    """
+    The settings of a batch, they are sent to every worker process.
+    """
+    config: APIConfigsDTO
+    output_dir: str
+    export_format: ExportFormatEnum = ExportFormatEnum.CSV
+    join_plan: JoinPlanEnum = JoinPlanEnum.SERVER
+    columns: Optional[List[str]] = None
+    # the seconds a lottery may take incl. its retries, None waits for the API
+    deadline_seconds: Optional[float] = None
+    # the winners are sent back to the caller for the combined file
+    keep_data: bool = True
+
+
+@dataclass
+class LotteryResult():
+    """
+    The outcome of one lottery of the batch.
+    """
+    lottery_uid: str
+    ticket_uid: str
+    rows: int = 0
+    seconds: float = 0.0
+    path: Optional[str] = None
+    error: Optional[str] = None
+    data: Optional[pd.DataFrame] = field(default=None, repr=False)
+
+    @property
+    def succeeded(self)->bool:
+        return self.error is None
+
+    def to_dict(self)->Dict[str, Any]:
+        """
+        Returns the result without the winners, e.g. for a summary file.
+        """
+        return {
+            "lotteryUID": self.lottery_uid,
+            "ticketUID": self.ticket_uid,
+            "succeeded": self.succeeded,
+            "rows": self.rows,
+            "seconds": round(self.seconds, 3),
+            "path": self.path,
+            "error": self.error,
+        }
+
+
+def output_path(output_dir:str, name:str, export_format:ExportFormatEnum)->str:
+    """
+    Returns the path of the export of a lottery, the characters which are not safe in a file name are quoted.
+
+    Examples:
+        >>> output_path("out", "lottery/2026 A", ExportFormatEnum.CSV)
+        'out/lottery%2F2026%20A.csv'
+    """
+    return os.path.join(output_dir, f"{quote(name, safe='-_.')}.{export_format.value}")
+
+def run_lottery(api:FunifierAPI, entry:ManifestEntry, options:BatchOptions)->LotteryResult:
+    """
+    Fetches the winners of the lottery and exports them, an exception is returned as the error of the result.
+    """
+    result = LotteryResult(entry.lottery_uid, entry.ticket_uid)
+    started_at = time.perf_counter()
+    try:
+        data = api.get_lottery_winners_with_address(lotteryUID=entry.lottery_uid,
+                                                    ticketUID=entry.ticket_uid,
+                                                    join_plan=options.join_plan,
+                                                    columns=options.columns)
+        data = pd.DataFrame() if data is None else data
+
+        path = output_path(options.output_dir, entry.lottery_uid, options.export_format)
+        __export(data, options.export_format, path)
+        result.rows = len(data.index)
+        result.path = path
+        result.data = data if options.keep_data else None
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.seconds = time.perf_counter() - started_at
+    return result
+
+def run_batch(
+        entries:List[ManifestEntry],
+        options:BatchOptions,
+        executor:ExecutorKindEnum=ExecutorKindEnum.PROCESS,
+        max_workers:int=DEFAULT_MAX_WORKERS,
+        progress:Optional[Callable[[int, int, LotteryResult], None]]=None
+    )->List[LotteryResult]:
+    """
+    Runs the lotteries in a pool of at most `max_workers` workers.
+
+    Args:
+        entries (List[ManifestEntry]): The lotteries and their tickets.
+        options (BatchOptions): The API config and the export settings.
+        executor (ExecutorKindEnum, optional): A pool of processes or threads. Defaults to ExecutorKindEnum.PROCESS.
+        max_workers (int, optional): The number of lotteries which run at the same time. Defaults to DEFAULT_MAX_WORKERS.
+        progress (Callable[[int, int, LotteryResult], None], optional): Called with the number of finished
+                                                                        lotteries, the number of all the lotteries and
+                                                                        the result of the lottery which has finished.
+
+    Returns:
+        List[LotteryResult]: The results in the order of the entries.
+
+    Notes:
+        - A lottery which raises an error, or whose worker process dies, fails alone.
+        - The output directory is created if it does not exist.
+    """
+    if max_workers < 1:
+        raise ValueError(f"The number of workers must be at least 1 but is {max_workers}")
+
+    os.makedirs(options.output_dir, exist_ok=True)
+    results:List[Optional[LotteryResult]] = [None] * len(entries)
+    if len(entries) == 0:
+        return []
+
+    n_workers = min(max_workers, len(entries))
+    pool, submit, shared_api = __create_pool(executor, n_workers, options)
+    try:
+        futures:Dict[Future, int] = {submit(pool, entry): index for index, entry in enumerate(entries)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # e.g. BrokenProcessPool if a worker process has been killed
+                entry = entries[index]
+                result = LotteryResult(entry.lottery_uid, entry.ticket_uid, error=f"{type(e).__name__}: {e}")
+            results[index] = result
+            if progress is not None:
+                progress(done, len(entries), result)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        if shared_api is not None:
+            shared_api.close()
+    return results
+
+def write_combined(
+        results:List[LotteryResult],
+        options:BatchOptions,
+        name:str=COMBINED_FILE_NAME
+    )->Optional[str]:
+    """
+    Exports the winners of all the succeeded lotteries to one file in the order of the results.
+
+    Returns:
+        Optional[str]: The path of the combined file, None if no lottery has succeeded.
+
+    Notes:
+        - The column «lotteryUID» is added if the selected columns do not contain it.
+    """
+    frames = []
+    for result in results:
+        if not result.succeeded or result.data is None:
+            continue
+        data = result.data
+        if LOTTERY_COLUMN not in data.columns and len(data.index) > 0:
+            data = data.copy(deep=False)
+            data.insert(0, LOTTERY_COLUMN, result.lottery_uid)
+        frames.append(data)
+    if len(frames) == 0:
+        return None
+
+    non_empty = [frame for frame in frames if len(frame.index) > 0]
+    data = pd.concat(non_empty, ignore_index=True) if non_empty else frames[0]
+    path = output_path(options.output_dir, name, options.export_format)
+    __export(data, options.export_format, path)
+    return path
+
+#region helper methods
+def __export(data:pd.DataFrame, export_format:ExportFormatEnum, path:str)->None:
+    """
+    Writes the export next to the target and renames it, so a file of the output directory is never partial.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            export_dataframe(data, export_format, file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def __create_api(options:BatchOptions, pool_size:int=1)->FunifierAPI:
+    return FunifierAPI(options.config, pool_size=pool_size, deadline_seconds=options.deadline_seconds)
+
+# the FunifierAPI of a worker process, created once by its initializer
+__worker_api:Optional[FunifierAPI] = None
+__worker_options:Optional[BatchOptions] = None
+
+def __init_worker(options:BatchOptions)->None:
+    global __worker_api, __worker_options
+    __worker_options = options
+    __worker_api = __create_api(options)
+
+def __run_in_worker(entry:ManifestEntry)->LotteryResult:
+    return run_lottery(__worker_api, entry, __worker_options)
+
+def __create_pool(executor:ExecutorKindEnum, n_workers:int, options:BatchOptions):
+    """
+    Returns the pool, the function which submits an entry to it and the FunifierAPI shared by the threads.
+    """
+    if executor == ExecutorKindEnum.PROCESS:
+        pool:Executor = ProcessPoolExecutor(max_workers=n_workers, initializer=__init_worker, initargs=(options,))
+        return pool, lambda pool, entry: pool.submit(__run_in_worker, entry), None
+
+    api = __create_api(options, pool_size=n_workers)
+    pool = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="lottery")
+    run = functools.partial(run_lottery, api, options=options)
+    return pool, lambda pool, entry: pool.submit(run, entry), api
+#endregion
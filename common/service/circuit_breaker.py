@@ -0,0 +1,200 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""a thread-safe circuit breaker per host.\n
+
+After `failure_threshold` consecutive failures the breaker opens and the
+requests to the host fail fast for `reset_seconds`. Then one probe request
+is let through: its success closes the breaker, its failure opens it again.
+A probe which ends without an outcome, e.g. cancelled before the host has
+answered, is released, so the next request becomes the probe.
+"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##* 2026-10-18          bettlerd    added release_probe() for a probe which ends without an outcome
+##*
+##*
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from common.enums.common.circuit_state import CircuitStateEnum
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_SECONDS = 30.0
+
+
+class CircuitBreaker():
+    """
+    Tracks the consecutive failures of a host and decides whether a request may be sent.
+
+    Examples:
+        >>> breaker = CircuitBreaker("host", failure_threshold=2, reset_seconds=60)
+        >>> breaker.record_failure(); breaker.record_failure()
+        >>> breaker.state, breaker.allow_request()
+        (<CircuitStateEnum.OPEN: 'open'>, False)
+        >>> breaker.statistics()["trips"], breaker.statistics()["rejected"]
+        (1, 1)
+    """
+
+    def __init__(
+            self,
+            host:str,
+            failure_threshold:int=DEFAULT_FAILURE_THRESHOLD,
+            reset_seconds:float=DEFAULT_RESET_SECONDS
+        ):
+        if failure_threshold < 1:
+            raise ValueError(f"The failure threshold must be at least 1 but is {failure_threshold}")
+
+        self.__host = host
+        self.__failure_threshold = failure_threshold
+        self.__reset_seconds = reset_seconds
+        self.__lock = threading.Lock()
+
+        self.__state = CircuitStateEnum.CLOSED
+        self.__consecutive_failures = 0
+        self.__opened_at = 0.0
+        self.__probe_in_flight = False
+
+        self.__trips = 0
+        self.__rejected = 0
+        self.__successes = 0
+        self.__failures = 0
+
+    @property
+    def host(self)->str:
+        return self.__host
+
+    @property
+    def state(self)->CircuitStateEnum:
+        with self.__lock:
+            return self.__current_state()
+
+    def allow_request(self)->bool:
+        """
+        Returns whether a request may be sent. In the half-open state only one probe is allowed at a time.
+        """
+        with self.__lock:
+            state = self.__current_state()
+            if state == CircuitStateEnum.CLOSED:
+                return True
+            if state == CircuitStateEnum.HALF_OPEN and not self.__probe_in_flight:
+                self.__state = CircuitStateEnum.HALF_OPEN
+                self.__probe_in_flight = True
+                return True
+            self.__rejected += 1
+            return False
+
+    def record_success(self)->None:
+        with self.__lock:
+            self.__successes += 1
+            self.__consecutive_failures = 0
+            self.__probe_in_flight = False
+            self.__state = CircuitStateEnum.CLOSED
+
+    def release_probe(self)->None:
+        """
+        Ends a request without counting a success or a failure, e.g. if it has been aborted before
+        the host has answered. A half-open breaker lets the next request through as probe.
+
+        Examples:
+            >>> breaker = CircuitBreaker("host", failure_threshold=1, reset_seconds=0)
+            >>> breaker.record_failure()
+            >>> breaker.allow_request(), breaker.allow_request()
+            (True, False)
+            >>> breaker.release_probe()
+            >>> breaker.state, breaker.allow_request()
+            (<CircuitStateEnum.HALF_OPEN: 'half_open'>, True)
+        """
+        with self.__lock:
+            self.__probe_in_flight = False
+
+    def record_failure(self)->None:
+        with self.__lock:
+            self.__failures += 1
+            self.__consecutive_failures += 1
+            probe_failed = self.__probe_in_flight
+            self.__probe_in_flight = False
+            if probe_failed or (self.__state == CircuitStateEnum.CLOSED
+                                and self.__consecutive_failures >= self.__failure_threshold):
+                self.__state = CircuitStateEnum.OPEN
+                self.__opened_at = time.monotonic()
+                self.__trips += 1
+
+    def retry_in(self)->float:
+        """
+        Returns the seconds until an open breaker lets the next probe through, 0 if it is not open.
+        """
+        with self.__lock:
+            if self.__current_state() != CircuitStateEnum.OPEN:
+                return 0.0
+            return max(self.__opened_at + self.__reset_seconds - time.monotonic(), 0.0)
+
+    def statistics(self)->Dict[str, Any]:
+        """
+        Returns the state and the counters of the breaker.
+
+        Returns:
+            Dict[str, Any]:
+                - host: the host of the breaker
+                - state: the value of the CircuitStateEnum
+                - consecutive_failures: failures since the last success
+                - trips: how many times the breaker has opened
+                - rejected: requests which failed fast
+                - successes, failures: the recorded outcomes
+        """
+        with self.__lock:
+            return {
+                "host": self.__host,
+                "state": self.__current_state().value,
+                "consecutive_failures": self.__consecutive_failures,
+                "trips": self.__trips,
+                "rejected": self.__rejected,
+                "successes": self.__successes,
+                "failures": self.__failures,
+            }
+
+    #region helper methods
+    def __current_state(self)->CircuitStateEnum:
+        """
+        Returns the state, an open breaker is half-open once `reset_seconds` have passed.
+        """
+        if (self.__state == CircuitStateEnum.OPEN
+                and time.monotonic() - self.__opened_at >= self.__reset_seconds):
+            return CircuitStateEnum.HALF_OPEN
+        return self.__state
+    #endregion
+
+
+_breakers:Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(
+        host:str,
+        failure_threshold:int=DEFAULT_FAILURE_THRESHOLD,
+        reset_seconds:float=DEFAULT_RESET_SECONDS
+    )->CircuitBreaker:
+    """
+    Returns the circuit breaker of the host, it is shared by all the clients of the process.
+    The thresholds are only used when the breaker of the host is created.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(host, failure_threshold, reset_seconds)
+        return breaker
+
+def circuit_breaker_statistics()->Dict[str, Dict[str, Any]]:
+    """
+    Returns the statistics of the shared circuit breakers by host.
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.host: breaker.statistics() for breaker in breakers}
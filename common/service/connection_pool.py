@@ -0,0 +1,307 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""a thread-safe pool of keep-alive HTTPS connections to a single host.\n
+
+Re-using a connection saves the TCP and TLS handshake of every request.
+"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##* 2026-10-18          bettlerd    added TimedHTTPSConnection and the timings of urlopen()
+##* 2026-10-18          bettlerd    added ssl_context, plain HTTP for local stand-ins and split_scheme()
+##* 2026-10-18          bettlerd    added read_timeout, the timeout applies to connecting only
+##*
+##*
+
+import http.client
+import ssl
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_IDLE_SECONDS = 60.0
+
+# errors raised by a re-used connection whose socket has been closed by the server
+STALE_CONNECTION_ERRORS = (
+    ConnectionError,
+    http.client.BadStatusLine,
+    http.client.CannotSendRequest,
+    ssl.SSLEOFError,
+)
+
+
+def split_scheme(url:str)->Tuple[str, bool]:
+    """
+    Returns the host (incl. port) of the url and whether the connections use TLS.
+
+    A url without a scheme is an HTTPS host, like the url of the API config.
+
+    Examples:
+        >>> split_scheme("eu1.service.funifier.com")
+        ('eu1.service.funifier.com', True)
+        >>> split_scheme("http://127.0.0.1:8080/")
+        ('127.0.0.1:8080', False)
+    """
+    if url.startswith("http://"):
+        return url[len("http://"):].rstrip("/"), False
+    if url.startswith("https://"):
+        return url[len("https://"):].rstrip("/"), True
+    return url, True
+
+
+class TimedHTTPConnection(http.client.HTTPConnection):
+    """
+    An HTTP connection which measures its TCP connect.
+
+    `connect_seconds` and `tls_seconds` hold the durations of the last
+    `connect()` and are 0 as long as the connection has not been opened.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connect_seconds = 0.0
+        self.tls_seconds = 0.0
+
+    def connect(self)->None:
+        started_at = time.perf_counter()
+        super().connect()
+        self.connect_seconds = time.perf_counter() - started_at
+
+
+class TimedHTTPSConnection(http.client.HTTPSConnection, TimedHTTPConnection):
+    """
+    An HTTPS connection which measures its TCP connect and its TLS handshake.
+
+    `HTTPSConnection.connect()` opens the socket with the `connect()` of its
+    base class, which is the one of TimedHTTPConnection in this class order.
+    """
+
+    def connect(self)->None:
+        started_at = time.perf_counter()
+        super().connect()
+        self.tls_seconds = max(time.perf_counter() - started_at - self.connect_seconds, 0.0)
+
+
+class HTTPSConnectionPool():
+    """
+    Keeps up to `size` idle keep-alive connections to one host.
+
+    The connections use TLS unless `use_tls` is False, which is meant for a
+    local stand-in of the API. `timeout` limits connecting and sending the
+    request, `read_timeout` every read of the response.
+
+    A connection is taken from the pool for the duration of one request and
+    is returned once its response has been read completely. If all idle
+    connections are in use a new one is opened; it is closed on release when
+    the pool is already full.
+    """
+
+    def __init__(
+            self,
+            host:str,
+            size:int=DEFAULT_POOL_SIZE,
+            timeout:Optional[float]=None,
+            max_idle_seconds:float=DEFAULT_MAX_IDLE_SECONDS,
+            ssl_context:Optional[ssl.SSLContext]=None,
+            use_tls:bool=True,
+            read_timeout:Optional[float]=None
+        ):
+        if size < 1:
+            raise ValueError(f"The pool size must be at least 1 but is {size}")
+
+        self.__host = host
+        self.__size = size
+        self.__timeout = timeout
+        self.__read_timeout = read_timeout
+        self.__max_idle_seconds = max_idle_seconds
+        self.__ssl_context = ssl_context
+        self.__use_tls = use_tls
+        self.__idle:deque = deque()
+        self.__lock = threading.Lock()
+        self.__closed = False
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__stale = 0
+        self.__discarded = 0
+
+    @property
+    def host(self)->str:
+        return self.__host
+
+    @property
+    def size(self)->int:
+        return self.__size
+
+    @contextmanager
+    def urlopen(
+            self,
+            method:str,
+            url:str,
+            body=None,
+            headers:Optional[Dict[str, str]]=None,
+            timings:Optional[Dict[str, float]]=None,
+            read_timeout:Optional[float]=None
+        ) -> Iterator[http.client.HTTPResponse]:
+        """
+        Sends a request over a pooled connection and yields the response.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The path (incl. query string) of the request.
+            body (bytes, optional): The request body.
+            headers (Dict[str, str], optional): The request headers.
+            timings (Dict[str, float], optional): If given, gets the durations in seconds of the phases
+                «connect» (TCP), «tls», «send» and «server» (from the sent request to the response headers).
+            read_timeout (float, optional): The timeout of every read of this response. Defaults to the one of the pool.
+
+        Yields:
+            http.client.HTTPResponse: The response, which has to be read within the `with` block.
+
+        Notes:
+            - If a re-used connection turns out to be stale, the request is sent once more over a new connection.
+            - The connection only goes back to the pool if the response was read completely and the server keeps it alive.
+        """
+        conn, reused = self.__acquire()
+        try:
+            try:
+                res = self.__send(conn, method, url, body, headers, timings, read_timeout)
+            except STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                conn.close()
+                with self.__lock:
+                    self.__stale += 1
+                conn = self.__new_connection()
+                res = self.__send(conn, method, url, body, headers, timings, read_timeout)
+
+            yield res
+        except BaseException:
+            conn.close()
+            raise
+        else:
+            self.__release(conn, res)
+
+    def statistics(self)->Dict[str, int]:
+        """
+        Returns the counters of the pool.
+
+        Returns:
+            Dict[str, int]:
+                - hits: requests which re-used an idle connection
+                - misses: requests which had to open a new connection
+                - stale: re-used connections which had been closed by the server
+                - discarded: connections closed on release (pool full, not kept alive or expired)
+                - idle: connections currently waiting in the pool
+                - size: maximum number of idle connections
+        """
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "stale": self.__stale,
+                "discarded": self.__discarded,
+                "idle": len(self.__idle),
+                "size": self.__size,
+            }
+
+    def close(self)->None:
+        """
+        Closes all idle connections. Connections which are in use are closed on release.
+        """
+        with self.__lock:
+            self.__closed = True
+            idle = list(self.__idle)
+            self.__idle.clear()
+
+        for conn, _ in idle:
+            conn.close()
+
+    #region helper methods
+    def __new_connection(self)->http.client.HTTPConnection:
+        if not self.__use_tls:
+            return TimedHTTPConnection(self.__host, timeout=self.__timeout)
+        return TimedHTTPSConnection(self.__host, timeout=self.__timeout, context=self.__ssl_context)
+
+    def __acquire(self)->Tuple[http.client.HTTPConnection, bool]:
+        expired = []
+        conn = None
+        with self.__lock:
+            if self.__closed:
+                raise RuntimeError(f"The connection pool for «{self.__host}» is closed")
+
+            now = time.monotonic()
+            while self.__idle:
+                candidate, released_at = self.__idle.pop()
+                if now - released_at > self.__max_idle_seconds:
+                    expired.append(candidate)
+                    self.__stale += 1
+                else:
+                    conn = candidate
+                    break
+
+            if conn is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+
+        for candidate in expired:
+            candidate.close()
+
+        if conn is None:
+            return self.__new_connection(), False
+        return conn, True
+
+    def __release(self, conn:http.client.HTTPConnection, res:http.client.HTTPResponse)->None:
+        if res.will_close or not res.isclosed():
+            conn.close()
+            with self.__lock:
+                self.__discarded += 1
+            return
+
+        with self.__lock:
+            if not self.__closed and len(self.__idle) < self.__size:
+                self.__idle.append((conn, time.monotonic()))
+                return
+            self.__discarded += 1
+        conn.close()
+
+    def __send(
+            self,
+            conn:http.client.HTTPConnection,
+            method:str,
+            url:str,
+            body,
+            headers:Optional[Dict[str, str]],
+            timings:Optional[Dict[str, float]]=None,
+            read_timeout:Optional[float]=None
+        )->http.client.HTTPResponse:
+        # a new connection is opened by request(), a re-used one still has the durations of its
+        # own connect, so they are only taken from a connection which had no socket yet
+        opens_connection = conn.sock is None
+        started_at = time.perf_counter()
+        conn.request(method, url, body=body, headers=headers or {})
+        sent_at = time.perf_counter()
+        read_timeout = self.__read_timeout if read_timeout is None else read_timeout
+        if read_timeout is not None and conn.sock is not None:
+            conn.sock.settimeout(read_timeout)
+        res = conn.getresponse()
+
+        if timings is not None:
+            connect_seconds = getattr(conn, "connect_seconds", 0.0) if opens_connection else 0.0
+            tls_seconds = getattr(conn, "tls_seconds", 0.0) if opens_connection else 0.0
+            timings["connect"] = connect_seconds
+            timings["tls"] = tls_seconds
+            timings["send"] = max(sent_at - started_at - connect_seconds - tls_seconds, 0.0)
+            timings["server"] = time.perf_counter() - sent_at
+        return res
+    #endregion
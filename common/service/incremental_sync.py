@@ -0,0 +1,234 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""a persisted result set per lottery/ticket which is refreshed incrementally.\n
+
+The store keeps the rows fetched so far and the `time` watermark, i.e. the
+time of the newest row. A refresh only fetches the rows since the watermark
+and merges them into the stored rows with one row per player.
+
+A result set is identified by its kind, its UIDs and its selected columns,
+a sync with other columns starts from EPOCH instead of merging rows which
+lack the columns. Per result set two files are written to the store directory:
+    - <kind>-<hash>.pkl: the rows as pickled DataFrame
+    - <kind>-<hash>.json: the watermark, the UIDs, the columns and the number of rows
+The rows are written before the watermark, so an interrupted refresh only
+fetches the same rows once more.
+"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##* 2026-10-18          bettlerd    the selected columns are part of the key of a result set
+##* 2026-10-18          bettlerd    an unreadable state falls back to a full sync from EPOCH
+##*
+##*
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+
+import pandas as pd
+
+from common.enums.common.encoding import EncodingEnum
+from common.enums.funifier.sync_kind import SyncKindEnum
+from common.helper.logging_helper import do_logging
+
+# the watermark of a result set which has never been synced
+EPOCH = "1970-01-01T00:00:00.000Z"
+TIME_COLUMN = "time"
+PLAYER_COLUMN = "player"
+ROWS_FILE_SUFFIX = ".pkl"
+STATE_FILE_SUFFIX = ".json"
+
+
+def time_to_iso(value:Any)->Optional[str]:
+    """
+    Returns the value of a `time` field as ISO date in UTC with milliseconds, None if it is no time.
+    The Funifier API returns the time as `{"$date": ...}` with an ISO date or epoch milliseconds.
+
+    Examples:
+        >>> time_to_iso({"$date": "2026-10-18T08:00:00.000Z"}), time_to_iso(1760774400000)
+        ('2026-10-18T08:00:00.000Z', '2025-10-18T08:00:00.000Z')
+        >>> time_to_iso(None) is None
+        True
+    """
+    if isinstance(value, dict):
+        value = value.get("$date")
+
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        moment = datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+    elif isinstance(value, str):
+        try:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+    else:
+        return None
+
+    moment = moment.astimezone(timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}Z"
+
+
+@dataclass
+class SyncState():
+    """
+    The rows of a result set and the time of its newest row.
+    """
+    kind: SyncKindEnum
+    lottery_uid: Optional[str]
+    ticket_uid: Optional[str]
+    # the selected columns of the rows, None for all the columns
+    columns: Optional[List[str]] = None
+    watermark: str = EPOCH
+    rows: pd.DataFrame = field(default_factory=pd.DataFrame)
+    synced_at: Optional[float] = None
+
+
+class IncrementalSyncStore():
+    """
+    Persists the SyncState of every lottery/ticket in a directory.
+
+    Examples:
+        store = IncrementalSyncStore("/tmp/lottery-sync")
+        winners = api.sync_lottery_winners_with_address(lotteryUID, ticketUID, store)
+    """
+
+    def __init__(self, directory:str, key_column:str=PLAYER_COLUMN):
+        """
+        Args:
+            directory (str): The directory of the files, it is created if it does not exist.
+            key_column (str, optional): The column of the merged rows which is unique. Defaults to «player».
+        """
+        self.__directory = directory
+        self.__key_column = key_column
+        self.__lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self)->str:
+        return self.__directory
+
+    def load(
+            self,
+            kind:SyncKindEnum,
+            lottery_uid:Optional[str],
+            ticket_uid:Optional[str],
+            columns:Optional[List[str]]=None
+        )->SyncState:
+        """
+        Returns the stored state of the selected columns, an empty state with the watermark EPOCH if there is none
+        or its files cannot be read, e.g. a truncated pickle, so the next sync fetches all the rows again.
+        """
+        state = SyncState(kind, lottery_uid, ticket_uid, columns)
+        path = self.__path(kind, lottery_uid, ticket_uid, columns)
+        try:
+            with open(path + STATE_FILE_SUFFIX, encoding=EncodingEnum.UTF8.value) as file:
+                header = json.load(file)
+            rows = pd.read_pickle(path + ROWS_FILE_SUFFIX)
+        except (OSError, ValueError, EOFError, AttributeError, ImportError, pickle.UnpicklingError) as e:
+            if not isinstance(e, FileNotFoundError):
+                do_logging(f"Ignoring the unreadable sync state «{path}»: {type(e).__name__}: {e}")
+            return state
+
+        state.watermark = header.get("watermark", EPOCH)
+        state.synced_at = header.get("synced_at")
+        state.rows = rows
+        return state
+
+    def merge(self, state:SyncState, new_rows:Optional[pd.DataFrame])->SyncState:
+        """
+        Merges the new rows into the state, a newer row of a player replaces the stored one,
+        and moves the watermark to the newest time of the new rows.
+        """
+        state.synced_at = time.time()
+        if new_rows is None or len(new_rows.index) == 0:
+            return state
+
+        watermark = max((iso for iso in map(time_to_iso, new_rows.get(TIME_COLUMN, [])) if iso is not None),
+                        default=state.watermark)
+        # the ISO dates have a fixed format, so they are ordered like the times
+        state.watermark = max(state.watermark, watermark)
+
+        rows = new_rows if len(state.rows.index) == 0 else pd.concat([state.rows, new_rows], ignore_index=True)
+        if self.__key_column in rows.columns:
+            rows = rows.drop_duplicates(subset=self.__key_column, keep="last", ignore_index=True)
+        state.rows = rows
+        return state
+
+    def save(self, state:SyncState)->None:
+        """
+        Writes the rows and then the watermark, each file is replaced atomically.
+        """
+        path = self.__path(state.kind, state.lottery_uid, state.ticket_uid, state.columns)
+        header = {
+            "kind": state.kind.value,
+            "lotteryUID": state.lottery_uid,
+            "ticketUID": state.ticket_uid,
+            "columns": state.columns,
+            "watermark": state.watermark,
+            "rows": len(state.rows.index),
+            "synced_at": state.synced_at,
+        }
+        with self.__lock:
+            self.__write(path + ROWS_FILE_SUFFIX, lambda file: state.rows.to_pickle(file))
+            self.__write(path + STATE_FILE_SUFFIX,
+                         lambda file: file.write(json.dumps(header, indent=2).encode(EncodingEnum.UTF8.value)))
+
+    def clear(
+            self,
+            kind:SyncKindEnum,
+            lottery_uid:Optional[str],
+            ticket_uid:Optional[str],
+            columns:Optional[List[str]]=None
+        )->None:
+        """
+        Removes the stored state of the selected columns, the next sync fetches all the rows again.
+        """
+        path = self.__path(kind, lottery_uid, ticket_uid, columns)
+        for suffix in (STATE_FILE_SUFFIX, ROWS_FILE_SUFFIX):
+            try:
+                os.remove(path + suffix)
+            except FileNotFoundError:
+                pass
+
+    #region helper methods
+    def __path(
+            self,
+            kind:SyncKindEnum,
+            lottery_uid:Optional[str],
+            ticket_uid:Optional[str],
+            columns:Optional[List[str]]
+        )->str:
+        key = f"{lottery_uid or ''}\n{ticket_uid or ''}"
+        if columns is not None:
+            # all the columns keep the key of the stores written before the column selection
+            key += "\n" + ",".join(columns)
+        key = key.encode(EncodingEnum.UTF8.value)
+        return os.path.join(self.__directory, f"{kind.value}-{hashlib.sha256(key).hexdigest()[:24]}")
+
+    def __write(self, path:str, write)->None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.__directory)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                write(file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    #endregion
@@ -0,0 +1,260 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""an in-process registry of counters and latency histograms.\n
+
+The FunifierAPI records the timing breakdown, the payload sizes and the row
+counts of every request here. The registry can be dumped as JSON or in the
+Prometheus text exposition format.
+"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##*
+##*
+
+import bisect
+import json
+import math
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# upper bounds in seconds, from a local cache hit up to a slow export of a big lottery
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def label_key(labels:Dict[str, Any])->LabelKey:
+    """
+    Returns the labels as a hashable key, sorted by label name.
+
+    Examples:
+        >>> label_key({"route": "/a", "phase": "total"})
+        (('phase', 'total'), ('route', '/a'))
+    """
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class Histogram():
+    """
+    Counts observations in cumulative buckets with fixed upper bounds.
+
+    Examples:
+        >>> histogram = Histogram((0.1, 1.0))
+        >>> for value in (0.05, 0.5, 0.5, 2.0):
+        ...     histogram.observe(value)
+        >>> histogram.count, histogram.sum
+        (4, 3.05)
+        >>> histogram.cumulative_counts()
+        [1, 3, 4]
+        >>> histogram.quantile(0.5)
+        0.55
+    """
+
+    def __init__(self, buckets:Sequence[float]=DEFAULT_LATENCY_BUCKETS):
+        if list(buckets) != sorted(buckets) or len(buckets) == 0:
+            raise ValueError(f"The buckets must be a non-empty ascending sequence but are {buckets}")
+
+        self.buckets:Tuple[float, ...] = tuple(buckets)
+        # the last count is the +Inf bucket
+        self.__counts:List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value:float)->None:
+        self.__counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self)->List[int]:
+        """
+        Returns the number of observations less or equal to each bucket bound, the last one is +Inf.
+        """
+        result = []
+        total = 0
+        for count in self.__counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q:float)->Optional[float]:
+        """
+        Estimates the q-quantile by linear interpolation within its bucket, like the Prometheus
+        function `histogram_quantile()`. Returns None if there are no observations.
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        lower_bound, lower_count = 0.0, 0
+        for bound, count in zip(self.buckets, self.cumulative_counts()):
+            if count >= rank:
+                if count == lower_count:
+                    return bound
+                return round(lower_bound + (bound - lower_bound) * (rank - lower_count) / (count - lower_count), 6)
+            lower_bound, lower_count = bound, count
+        # the quantile lies in the +Inf bucket
+        return self.buckets[-1]
+
+
+class MetricsRegistry():
+    """
+    Keeps named counters and histograms, each one per combination of labels.
+
+    All the methods are thread-safe.
+
+    Examples:
+        >>> registry = MetricsRegistry()
+        >>> registry.increment("requests_total", route="/a")
+        >>> registry.increment("requests_total", 2, route="/a")
+        >>> registry.counter_value("requests_total", route="/a")
+        3.0
+        >>> registry.observe("request_seconds", 0.2, route="/a")
+        >>> print(registry.to_prometheus().splitlines()[0])
+        # TYPE request_seconds histogram
+    """
+
+    def __init__(self, buckets:Sequence[float]=DEFAULT_LATENCY_BUCKETS):
+        self.__buckets = tuple(buckets)
+        self.__counters:Dict[str, Dict[LabelKey, float]] = {}
+        self.__histograms:Dict[str, Dict[LabelKey, Histogram]] = {}
+        self.__lock = threading.Lock()
+
+    def increment(self, name:str, value:float=1, **labels:Any)->None:
+        """
+        Adds the value to the counter with the given name and labels.
+        """
+        key = label_key(labels)
+        with self.__lock:
+            counters = self.__counters.setdefault(name, {})
+            counters[key] = counters.get(key, 0.0) + value
+
+    def observe(self, name:str, value:float, **labels:Any)->None:
+        """
+        Records one observation in the histogram with the given name and labels.
+        """
+        key = label_key(labels)
+        with self.__lock:
+            histograms = self.__histograms.setdefault(name, {})
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = Histogram(self.__buckets)
+            histogram.observe(value)
+
+    def counter_value(self, name:str, **labels:Any)->float:
+        """
+        Returns the value of a counter, 0 if it has never been incremented.
+        """
+        with self.__lock:
+            return self.__counters.get(name, {}).get(label_key(labels), 0.0)
+
+    def reset(self)->None:
+        """
+        Removes all the counters and histograms.
+        """
+        with self.__lock:
+            self.__counters.clear()
+            self.__histograms.clear()
+
+    def snapshot(self)->Dict[str, List[Dict[str, Any]]]:
+        """
+        Returns all the metrics as plain data.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]:
+                - counters: name, labels and value of every counter
+                - histograms: name, labels, count, sum, p50, p95 and the cumulative buckets of every histogram
+        """
+        with self.__lock:
+            counters = [
+                {"name": name, "labels": dict(key), "value": value}
+                for name, series in sorted(self.__counters.items())
+                for key, value in sorted(series.items())
+            ]
+            histograms = [
+                {
+                    "name": name,
+                    "labels": dict(key),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                    "buckets": dict(zip([*map(str, histogram.buckets), "+Inf"], histogram.cumulative_counts())),
+                }
+                for name, series in sorted(self.__histograms.items())
+                for key, histogram in sorted(series.items())
+            ]
+        return {"counters": counters, "histograms": histograms}
+
+    def to_json(self, indent:Optional[int]=None)->str:
+        """
+        Returns the snapshot of the metrics as JSON, see `snapshot()`.
+        """
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self)->str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        for name in sorted({histogram["name"] for histogram in snapshot["histograms"]}):
+            lines.append(f"# TYPE {name} histogram")
+            for histogram in snapshot["histograms"]:
+                if histogram["name"] != name:
+                    continue
+                for bound, count in histogram["buckets"].items():
+                    lines.append(f"{name}_bucket{format_labels(histogram['labels'], le=bound)} {count}")
+                lines.append(f"{name}_sum{format_labels(histogram['labels'])} {format_value(histogram['sum'])}")
+                lines.append(f"{name}_count{format_labels(histogram['labels'])} {histogram['count']}")
+
+        for name in sorted({counter["name"] for counter in snapshot["counters"]}):
+            lines.append(f"# TYPE {name} counter")
+            for counter in snapshot["counters"]:
+                if counter["name"] == name:
+                    lines.append(f"{name}{format_labels(counter['labels'])} {format_value(counter['value'])}")
+
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(labels:Dict[str, str], **extra:str)->str:
+    """
+    Formats the labels of a Prometheus sample.
+
+    Examples:
+        >>> format_labels({"route": '/a"b'}, le="0.5")
+        '{route="/a\\\\"b",le="0.5"}'
+        >>> format_labels({})
+        ''
+    """
+    items = {**labels, **extra}
+    if not items:
+        return ""
+    escaped = (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for value in items.values()
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(items, escaped)) + "}"
+
+def format_value(value:float)->str:
+    """
+    Formats a sample value, integral values without a decimal point.
+
+    Examples:
+        >>> format_value(3.0), format_value(0.25)
+        ('3', '0.25')
+    """
+    if math.isfinite(value) and value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+# the registry of the process, shared by all the API clients unless they get their own
+METRICS = MetricsRegistry()
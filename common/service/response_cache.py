@@ -0,0 +1,248 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""a TTL response cache with an in-memory LRU tier and an optional on-disk tier.\n
+
+The FunifierAPI uses it to answer repeated aggregation calls without a
+round trip to the Funifier API.
+"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##* 2026-10-18          bettlerd    make_cache_key() keeps the key order of the body
+##*
+##*
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from common.enums.common.encoding import EncodingEnum
+
+DEFAULT_CACHE_SIZE = 128
+CACHE_FILE_SUFFIX = ".cache"
+
+
+def make_cache_key(route:str, body:Optional[str], credentials:str, range:Optional[str]=None)->str:
+    """
+    Returns the cache key of a request.
+
+    Args:
+        route (str): The route of the request.
+        body (str, optional): The request body, a JSON body is normalized so that whitespace does not matter.
+                              The key order is kept, e.g. the keys of a `$sort` stage are its sort order.
+        credentials (str): The credentials of the request, only their hash becomes part of the key.
+        range (str, optional): The `Range` header of the request.
+
+    Returns:
+        str: The hex digest of the key.
+
+    Examples:
+        >>> make_cache_key("/a", '[{"b": 1, "c": 2}]', "key:secret") == make_cache_key("/a", '[{"b":1,"c":2}]', "key:secret")
+        True
+        >>> make_cache_key("/a", '[{"$sort": {"b": 1, "c": 1}}]', "key:secret") == make_cache_key("/a", '[{"$sort": {"c": 1, "b": 1}}]', "key:secret")
+        False
+    """
+    try:
+        normalized_body = json.dumps(json.loads(body), separators=(",", ":"))
+    except (TypeError, ValueError):
+        normalized_body = (body or "").strip()
+
+    credentials_hash = hashlib.sha256(credentials.encode(EncodingEnum.UTF8.value)).hexdigest()
+    key = "\n".join([route, range or "", normalized_body, credentials_hash])
+    return hashlib.sha256(key.encode(EncodingEnum.UTF8.value)).hexdigest()
+
+
+class ResponseCache():
+    """
+    Caches response bodies for `ttl_seconds`.
+
+    The memory tier keeps the `max_entries` most recently used responses. If a
+    `cache_dir` is given, every response is written there as well and survives
+    a restart of the process; an entry found on disk is promoted to memory.
+    """
+
+    def __init__(
+            self,
+            ttl_seconds:float,
+            max_entries:int=DEFAULT_CACHE_SIZE,
+            cache_dir:Optional[str]=None
+        ):
+        if ttl_seconds <= 0:
+            raise ValueError(f"The time to live must be positive but is {ttl_seconds}")
+        if max_entries < 1:
+            raise ValueError(f"The cache size must be at least 1 but is {max_entries}")
+
+        self.__ttl_seconds = ttl_seconds
+        self.__max_entries = max_entries
+        self.__cache_dir = cache_dir
+        # key -> (route, expires_at, value)
+        self.__entries:'OrderedDict[str, Tuple[str, float, bytes]]' = OrderedDict()
+        self.__lock = threading.Lock()
+
+        self.__hits = 0
+        self.__disk_hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def ttl_seconds(self)->float:
+        return self.__ttl_seconds
+
+    def get(self, key:str)->Optional[bytes]:
+        """
+        Returns the cached response of the key or None if there is no valid entry.
+        """
+        now = time.time()
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return entry[2]
+                del self.__entries[key]
+                self.__expirations += 1
+
+        entry = self.__read_file(key, now)
+
+        with self.__lock:
+            if entry is None:
+                self.__misses += 1
+                return None
+            self.__disk_hits += 1
+            self.__put_in_memory(key, entry)
+            return entry[2]
+
+    def put(self, key:str, route:str, value:bytes)->None:
+        """
+        Caches the response of the key.
+        """
+        entry = (route, time.time() + self.__ttl_seconds, value)
+        with self.__lock:
+            self.__put_in_memory(key, entry)
+        self.__write_file(key, entry)
+
+    def invalidate(self, route:Optional[str]=None)->int:
+        """
+        Removes the entries of the route, or all the entries if no route is given.
+
+        Args:
+            route (str, optional): The route whose entries are removed.
+
+        Returns:
+            int: The number of removed memory entries.
+        """
+        with self.__lock:
+            keys = [key for key, entry in self.__entries.items() if route is None or entry[0] == route]
+            for key in keys:
+                del self.__entries[key]
+
+        for path in self.__cache_files():
+            header = self.__read_header(path)
+            if route is None or header is None or header.get("route") == route:
+                self.__remove_file(path)
+
+        return len(keys)
+
+    def statistics(self)->Dict[str, int]:
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            Dict[str, int]:
+                - hits: requests answered by the memory tier
+                - disk_hits: requests answered by the disk tier
+                - misses: requests which had to be sent to the API
+                - evictions: entries dropped from memory because the cache was full
+                - expirations: entries dropped because their time to live had passed
+                - entries: entries currently in memory
+        """
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "disk_hits": self.__disk_hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+                "expirations": self.__expirations,
+                "entries": len(self.__entries),
+            }
+
+    #region helper methods
+    def __put_in_memory(self, key:str, entry:Tuple[str, float, bytes])->None:
+        self.__entries[key] = entry
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
+
+    def __cache_path(self, key:str)->str:
+        return os.path.join(self.__cache_dir, f"{key}{CACHE_FILE_SUFFIX}")
+
+    def __cache_files(self):
+        if self.__cache_dir is None:
+            return []
+        return [os.path.join(self.__cache_dir, name)
+                for name in os.listdir(self.__cache_dir)
+                if name.endswith(CACHE_FILE_SUFFIX)]
+
+    def __write_file(self, key:str, entry:Tuple[str, float, bytes])->None:
+        """
+        Writes the entry as a JSON header line followed by the response body.
+        """
+        if self.__cache_dir is None:
+            return
+
+        route, expires_at, value = entry
+        header = json.dumps({"route": route, "expires_at": expires_at}).encode(EncodingEnum.UTF8.value)
+        fd, tmp_path = tempfile.mkstemp(dir=self.__cache_dir)
+        with os.fdopen(fd, "wb") as file:
+            file.write(header + b"\n" + value)
+        os.replace(tmp_path, self.__cache_path(key))
+
+    def __read_file(self, key:str, now:float)->Optional[Tuple[str, float, bytes]]:
+        if self.__cache_dir is None:
+            return None
+
+        path = self.__cache_path(key)
+        try:
+            with open(path, "rb") as file:
+                header = json.loads(file.readline())
+                value = file.read()
+        except (OSError, ValueError):
+            return None
+
+        if header["expires_at"] <= now:
+            with self.__lock:
+                self.__expirations += 1
+            self.__remove_file(path)
+            return None
+        return header["route"], header["expires_at"], value
+
+    def __read_header(self, path:str)->Optional[dict]:
+        try:
+            with open(path, "rb") as file:
+                return json.loads(file.readline())
+        except (OSError, ValueError):
+            return None
+
+    def __remove_file(self, path:str)->None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    #endregion
@@ -0,0 +1,245 @@
+##**************************************************************************
+##
+## Description -------------------------------------------------------------
+##
+##**************************************************************************
+##*
+"""a local columnar snapshot of the lottery achievements.\n
+
+The pages of the achievement aggregations are written as Arrow IPC files,
+partitioned by achievement type and item, i.e. the lottery UID of the
+winners (type 5) and the ticket UID of the ticket purchases (type 2):
+
+    <root>/type=5/item=<lottery UID>/part-00000.arrow
+    <root>/type=2/item=<ticket UID>/part-00000.arrow
+
+The files are read memory-mapped, so a column which is not used is never
+read from disk. The queries for winners, counts and the address join run
+fully offline. pyarrow 14 or newer, for the `promote_options` of
+`pa.concat_tables()`, is imported on the first use of the store.
+
+Example:
+    store = AchievementSnapshotStore("/data/lottery-snapshots")
+    api.snapshot_lottery(lotteryUID, ticketUID, store)
+    winners = store.get_lottery_winners_with_address(lotteryUID, ticketUID)
+"""
+##*
+##* Modifications:
+##* Date                User        Description
+##* ------------------------------------------------------------------------
+##* 2026-10-18          bettlerd    created script
+##* 2026-10-18          bettlerd    ADDRESS_COLUMNS of common.constants.funifier.columns
+##* 2026-10-18          bettlerd    pyarrow 14 or newer is required
+##*
+##*
+
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+from common.constants.funifier.columns import ADDRESS_COLUMNS
+from common.enums.funifier.achievement_type import AchievementTypeEnum
+from common.enums.funifier.participant_count import ParticipantCountEnum
+from common.service.incremental_sync import time_to_iso, PLAYER_COLUMN, TIME_COLUMN
+
+PART_FILE_PREFIX = "part-"
+PART_FILE_SUFFIX = ".arrow"
+
+
+class AchievementSnapshotStore():
+    """
+    Writes the achievement pages to Arrow IPC files and queries them offline.
+    """
+
+    def __init__(self, root:str):
+        """
+        Args:
+            root (str): The directory of the partitions, it is created if it does not exist.
+        """
+        self.__root = root
+        self.__lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    @property
+    def root(self)->str:
+        return self.__root
+
+    #region write
+    def append(self, achievement_type:AchievementTypeEnum, item:str, data:Optional[pd.DataFrame])->Optional[str]:
+        """
+        Writes a page of achievements as a new part of the partition.
+
+        Args:
+            achievement_type (AchievementTypeEnum): The type of the achievements.
+            item (str): The lottery UID of the winners or the ticket UID of the ticket purchases.
+            data (pd.DataFrame): The rows of the page, the column «time» is stored as UTC timestamp.
+
+        Returns:
+            Optional[str]: The path of the part, None if the page is empty.
+        """
+        if data is None or len(data.index) == 0:
+            return None
+
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(self.__normalize(data), preserve_index=False)
+        directory = self.__partition_path(achievement_type, item)
+
+        with self.__lock:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"{PART_FILE_PREFIX}{len(self.__part_files(directory)):05d}{PART_FILE_SUFFIX}")
+            fd, tmp_path = tempfile.mkstemp(dir=directory)
+            try:
+                with os.fdopen(fd, "wb") as file, pa.ipc.new_file(file, table.schema) as writer:
+                    writer.write_table(table)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        return path
+
+    def clear(self, achievement_type:AchievementTypeEnum, item:str)->None:
+        """
+        Removes the partition, e.g. before a lottery is snapshotted again.
+        """
+        with self.__lock:
+            shutil.rmtree(self.__partition_path(achievement_type, item), ignore_errors=True)
+    #endregion
+
+    #region read
+    def items(self, achievement_type:AchievementTypeEnum)->List[str]:
+        """
+        Returns the lottery or ticket UIDs of the partitions of the achievement type.
+        """
+        directory = os.path.join(self.__root, f"type={achievement_type.value}")
+        if not os.path.isdir(directory):
+            return []
+        return sorted(unquote(name[len("item="):]) for name in os.listdir(directory) if name.startswith("item="))
+
+    def read(
+            self,
+            achievement_type:AchievementTypeEnum,
+            item:str,
+            columns:Optional[List[str]]=None
+        )->Any:
+        """
+        Returns the partition as one pyarrow Table, read memory-mapped.
+
+        Args:
+            achievement_type (AchievementTypeEnum): The type of the achievements.
+            item (str): The lottery UID of the winners or the ticket UID of the ticket purchases.
+            columns (List[str], optional): The columns to read, missing ones are left out. Defaults to all.
+
+        Returns:
+            pa.Table: The rows of all the parts, an empty table if the partition does not exist.
+
+        Notes:
+            - The buffers of the table point into the memory-mapped files, only the pages which are
+              accessed are read from disk.
+            - Parts with different schemas, e.g. a column which is null in one page, are unified.
+        """
+        import pyarrow as pa
+
+        tables = []
+        for path in self.__part_files(self.__partition_path(achievement_type, item)):
+            with pa.memory_map(path, "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+            if columns is not None:
+                table = table.select([column for column in columns if column in table.column_names])
+            tables.append(table)
+
+        if len(tables) == 0:
+            return pa.table({})
+        return pa.concat_tables(tables, promote_options="default")
+
+    def count_rows(self, achievement_type:AchievementTypeEnum, item:str)->int:
+        """
+        Returns the number of rows of the partition from the metadata of the parts.
+        """
+        import pyarrow as pa
+
+        n_rows = 0
+        for path in self.__part_files(self.__partition_path(achievement_type, item)):
+            with pa.memory_map(path, "r") as source:
+                reader = pa.ipc.open_file(source)
+                n_rows += sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+        return n_rows
+    #endregion
+
+    #region lottery
+    def get_lottery_winners(self, lotteryUID:str, columns:Optional[List[str]]=None)->pd.DataFrame:
+        """
+        Returns the stored winners of the lottery, like `FunifierAPI.get_lottery_winners_with_address()`.
+        """
+        return self.read(AchievementTypeEnum.LOTTERY_WIN, lotteryUID, columns).to_pandas()
+
+    def count_lottery_participants(
+            self,
+            ticketUID:str,
+            count:ParticipantCountEnum=ParticipantCountEnum.TICKETS
+        )->int:
+        """
+        Returns the count of the stored participants of the lottery ticket, see `FunifierAPI.count_lottery_participants_batch()`.
+        """
+        if count == ParticipantCountEnum.TICKETS:
+            return self.count_rows(AchievementTypeEnum.TICKET_PURCHASE, ticketUID)
+
+        import pyarrow.compute as pc
+
+        players = self.read(AchievementTypeEnum.TICKET_PURCHASE, ticketUID, [PLAYER_COLUMN])
+        if players.num_rows == 0:
+            return 0
+        return pc.count_distinct(players[PLAYER_COLUMN]).as_py()
+
+    def get_lottery_winners_with_address(self, lotteryUID:str, ticketUID:str)->pd.DataFrame:
+        """
+        Returns the stored winners of the lottery joined with the address of their stored ticket purchase.
+
+        Notes:
+            - If a winner has several ticket purchases, the address of the first one is used.
+            - A winner without ticket purchase keeps empty address columns.
+            - Address columns of the stored winners, i.e. snapshotted with the address, are replaced.
+        """
+        winners = self.get_lottery_winners(lotteryUID)
+        if len(winners.index) == 0:
+            return winners
+
+        purchases = self.read(AchievementTypeEnum.TICKET_PURCHASE, ticketUID,
+                              [PLAYER_COLUMN, *ADDRESS_COLUMNS]).to_pandas()
+        addresses:Dict[Any, Dict[str, Any]] = {}
+        if PLAYER_COLUMN in purchases.columns:
+            for row in purchases.drop_duplicates(subset=PLAYER_COLUMN, keep="first").to_dict("records"):
+                addresses[row.pop(PLAYER_COLUMN)] = row
+
+        no_address:Dict[str, Any] = {}
+        matches = [addresses.get(player, no_address) for player in winners[PLAYER_COLUMN]]
+        for column in ADDRESS_COLUMNS:
+            winners[column] = [match.get(column) for match in matches]
+        return winners
+    #endregion
+
+    #region helper methods
+    def __partition_path(self, achievement_type:AchievementTypeEnum, item:str)->str:
+        return os.path.join(self.__root, f"type={achievement_type.value}", f"item={quote(item, safe='')}")
+
+    def __part_files(self, directory:str)->List[str]:
+        if not os.path.isdir(directory):
+            return []
+        return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                      if name.startswith(PART_FILE_PREFIX) and name.endswith(PART_FILE_SUFFIX))
+
+    def __normalize(self, data:pd.DataFrame)->pd.DataFrame:
+        """
+        Converts the «time» values, e.g. `{"$date": ...}`, to UTC timestamps.
+        """
+        if TIME_COLUMN not in data.columns:
+            return data
+        data = data.copy(deep=False)
+        data[TIME_COLUMN] = pd.to_datetime(data[TIME_COLUMN].map(time_to_iso), utc=True)
+        return data
+    #endregion
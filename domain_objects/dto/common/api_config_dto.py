@@ -20,83 +20,96 @@ DTO which contains general API attributes.
 ##* 2023-07-13          bettlerd    added expiration_time
 ##* 2023-08-08          bettlerd    added Id
 ##* 2023-08-08          bettlerd    added get_value()
+##* 2026-10-18          bettlerd    from_dict() uses the compiled decoder of the class, __slots__
+##* 2026-10-18          bettlerd    get_value() uses the converter of the type instead of eval and caches
+##*                                 the value, added Settings.get_values()
 ##*
 ##*
 
 import json
-from dataclasses import dataclass
-from typing import Any,List,Optional
+from dataclasses import dataclass, field
+from typing import Any,Dict,List,Optional,Tuple
 
 from common.extensions.dto_extension import ExtendedDTO
-from common.helper.dto_helper import get_optional_value
+from common.helper.converter_helper import convert
+from common.helper.dto_helper import get_dto_decoder, json_field
 
-@dataclass
+@dataclass(slots=True)
 class Header(ExtendedDTO):
-    content_type: Optional[str] = None
-    accept: Optional[str] = None
-    range: Optional[str] = None
+    content_type: Optional[str] = json_field("ContentType")
+    accept: Optional[str] = json_field("Accept")
+    range: Optional[str] = json_field("Range")
 
     @staticmethod
     def from_dict(obj: Any) -> 'Header':
-        _content_type = get_optional_value(obj, "ContentType", str)
-        _accept = get_optional_value(obj, "Accept", str)
-        _range = get_optional_value(obj, "Range", str)
-        return Header(_content_type, _accept, _range)
+        return get_dto_decoder(Header)(obj)
     
-@dataclass
+@dataclass(slots=True)
 class Id(ExtendedDTO):
     name: Optional[str] = None
     value: Optional[str] = None
     type: Optional[str] = None
+    # (type, value, converted value) of the last get_value()
+    _converted: Optional[Tuple[Any, Any, Any]] = field(default=None, init=False, repr=False, compare=False)
 
     @staticmethod
     def from_dict(obj: Any) -> 'Id':
-        _name = get_optional_value(obj, "name", str)
-        _value = get_optional_value(obj, "value", str)
-        _type = get_optional_value(obj, "type", str)
-        return Id(_name,_value, _type)
+        return get_dto_decoder(Id)(obj)
     
     def get_value(self)->Any:
-        return eval(f"{self.type}('{self.value}')")
+        """
+        Returns the value converted to the type, e.g. «int», «bool», «date» or a type
+        registered with `register_converter()`. The converted value is cached until
+        the type or the value changes.
 
-@dataclass
+        Raises:
+            TypeError: If there is no converter for the type.
+            ValueError: If the value cannot be converted.
+
+        Examples:
+            >>> Id("limit", "42", "int").get_value()
+            42
+        """
+        converted = self._converted
+        if converted is not None and converted[0] == self.type and converted[1] == self.value:
+            return converted[2]
+
+        value = convert(self.value, self.type)
+        self._converted = (self.type, self.value, value)
+        return value
+
+@dataclass(slots=True)
 class Settings(ExtendedDTO):
-    ids: Optional[List[Id]] = None
-    expiration_time: Optional[int] = None
+    ids: Optional[List[Id]] = json_field("Ids")
+    expiration_time: Optional[int] = json_field("ExpirationTime")
 
     @staticmethod
     def from_dict(obj: Any) -> 'Settings':
-        _ids = get_optional_value(obj, "Ids", List[Id])
-        _expiration_time = get_optional_value(obj, "ExpirationTime", int)
-        return Settings(_ids,_expiration_time)
+        return get_dto_decoder(Settings)(obj)
+
+    def get_values(self)->Dict[str, Any]:
+        """
+        Returns the converted values of all the ids by their name.
+
+        Examples:
+            >>> Settings(ids=[Id("limit", "42", "int"), Id("active", "false", "bool")]).get_values()
+            {'limit': 42, 'active': False}
+        """
+        return {id.name: id.get_value() for id in self.ids or []}
 
-@dataclass
+@dataclass(slots=True)
 class APIConfigsDTO(ExtendedDTO):
-    api_key: Optional[str] = None
-    app_secret: Optional[str] = None
-    url: Optional[str] = None
-    version: Optional[str] = None
-    header:Optional[Header] = None
+    api_key: Optional[str] = json_field("ApiKey")
+    app_secret: Optional[str] = json_field("AppSecret")
+    url: Optional[str] = json_field("Url")
+    version: Optional[str] = json_field("Version")
+    header:Optional[Header] = json_field("Header")
     scope:Optional[List[str]] = None
-    settings:Optional[Settings] = None
+    settings:Optional[Settings] = json_field("Settings")
 
     @staticmethod
     def from_dict(obj: Any) -> 'APIConfigsDTO':
-        _api_key = get_optional_value(obj, "ApiKey", str)
-        _app_secret = get_optional_value(obj, "AppSecret", str)
-        _url = get_optional_value(obj, "Url", str)
-        _version = get_optional_value(obj, "Version", str)
-        _header = get_optional_value(obj, "Header", Header)
-        _scope = get_optional_value(obj, "scope", List[str])
-        _settings = get_optional_value(obj, "Settings", Settings)
-        return APIConfigsDTO(
-            api_key = _api_key, 
-            app_secret = _app_secret, 
-            url = _url, 
-            version = _version, 
-            header = _header, 
-            scope = _scope, 
-            settings = _settings)
+        return get_dto_decoder(APIConfigsDTO)(obj)
     
     @staticmethod
     def from_string(string:str) -> 'APIConfigsDTO':